@@ -8,9 +8,27 @@ from .core.vector import (
     Vector2D
 )
 
+from .core.utils.error import (
+    trusted,
+    set_trusted,
+    is_trusted
+)
+
+from .core.utils.parallel import (
+    backend,
+    get_backend,
+    set_backend
+)
+
 __all__ = [
     "Vertex",
     "Vertex2D",
     "Vector",
-    "Vector2D"
+    "Vector2D",
+    "trusted",
+    "set_trusted",
+    "is_trusted",
+    "backend",
+    "get_backend",
+    "set_backend"
 ]
\ No newline at end of file
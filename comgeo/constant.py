@@ -1,6 +1,3 @@
-# Multi-processing constants
-import multiprocessing
-
-
-MAX_WORKERS = multiprocessing.cpu_count()
-EIGHTY_WORKERS = round(MAX_WORKERS * 0.8)
\ No newline at end of file
+# Parallel execution defaults, resolved when a backend is created rather than at import
+WORKER_FRACTION = 0.8
+NUM_WORKERS_ENV = "COMGEO_NUM_WORKERS"
@@ -1,19 +1,23 @@
-from ..vertex import Vertex, Vertex2D, Vertex3D
+from ..vertex import Vertex, Vertex2D, Vertex3D, VertexArray
 from ...decorator.error import not_instance, not_self_implemented
 from ..utils.error import check_type, check_consistency
+from ..utils.sparse import CSRMatrix
+from ..utils.buffer import GrowableArray
+from ..utils.version import coordinate_versions
 
 import numpy as np
 
 
 class Graph:
     def __init__(self, 
-        vertices: list[Vertex | Vertex2D | Vertex3D], 
+        vertices: list[Vertex | Vertex2D | Vertex3D] | VertexArray, 
         id: int = -1, 
         visited: bool = False
     ):
-        check_type(vertices, list, "vertices")
+        check_type(vertices, (list, VertexArray), "vertices")
         self.check_vertices_len(vertices)
-        check_consistency(vertices, "vertices")
+        if isinstance(vertices, list):
+            check_consistency(vertices, "vertices")
         check_type(id, int, "id")
         check_type(visited, bool, "visited")
         
@@ -22,7 +26,10 @@ class Graph:
         self._visited = visited
 
         self._adjacency_list: dict[int, list[int]] = {}
-        self._adjacency_matrix: np.ndarray = np.zeros((len(vertices), len(vertices)))
+        # Directed (row, col) edge pairs in a growable buffer; the CSR matrix is built
+        # from them on first access
+        self._edges = GrowableArray(np.int64, (2,))
+        self._adjacency_matrix: CSRMatrix | None = None
     
     @property
     def id(self):
@@ -48,20 +55,27 @@ class Graph:
     
     @property
     def has_adjacency_matrix(self):
-        return np.sum(self._adjacency_matrix) > 0
+        self._sync_caches()
+        if self._adjacency_matrix is not None:
+            return self._adjacency_matrix.nnz > 0
+        return len(self._edges) > 0
     
     @property
     def vertices(self):
         return self._vertices
     
     @vertices.setter
-    @not_instance(list)
-    def vertices(self, vertices: list[Vertex | Vertex2D | Vertex3D]):
+    @not_instance((list, VertexArray))
+    def vertices(self, vertices: list[Vertex | Vertex2D | Vertex3D] | VertexArray):
         self.check_vertices_len(vertices)
         self._vertices = vertices
+        self._adjacency_matrix = None
+        # A new vertex list carries no version of its own
+        if isinstance(vertices, list):
+            coordinate_versions.bump()
     
     @staticmethod
-    def check_vertices_len(vertices: list[Vertex | Vertex2D | Vertex3D]):
+    def check_vertices_len(vertices: list[Vertex | Vertex2D | Vertex3D] | VertexArray):
         if len(vertices) == 0:
             raise ValueError("Graph must have at least one vertex")
     
@@ -69,28 +83,81 @@ class Graph:
     def adjacency_list(self):
         return self._adjacency_list
     
+    def _sync_caches(self):
+        """Drop derived data built from an older version of the vertices; subclasses extend it."""
+        pass
+
     @property
-    def adjacency_matrix(self):
+    def adjacency_matrix(self) -> CSRMatrix:
+        self._sync_caches()
+        if self._adjacency_matrix is None:
+            self._adjacency_matrix = self.construct_adjacency_matrix()
         return self._adjacency_matrix
     
     @adjacency_matrix.setter
-    @not_instance(np.ndarray)
-    def adjacency_matrix(self, adjacency_matrix: np.ndarray):
+    @not_instance((np.ndarray, CSRMatrix))
+    def adjacency_matrix(self, adjacency_matrix: np.ndarray | CSRMatrix):
+        if isinstance(adjacency_matrix, np.ndarray):
+            adjacency_matrix = CSRMatrix.from_dense(adjacency_matrix)
+        rows, cols, _ = adjacency_matrix.to_coo()
+        self._edges = GrowableArray.from_array(np.stack([rows, cols], axis=1))
         self._adjacency_matrix = adjacency_matrix
+
+    def construct_adjacency_matrix(self) -> CSRMatrix:
+        """Build the CSR adjacency matrix from the stored edges."""
+        num_vertices = len(self._vertices)
+        edges = self._edges.data
+        return CSRMatrix.from_coo(edges[:, 0], edges[:, 1], (num_vertices, num_vertices))
     
     @adjacency_list.setter
     @not_instance(dict)
     def adjacency_list(self, adjacency_list: dict[int, list[int]]):
         self._adjacency_list = adjacency_list
     
-    def add_vertex(self, vertex: Vertex | Vertex2D | Vertex3D, connections: list[int] = []):
-        check_type(vertex, type(self._vertices[0]), "vertex")
+    @property
+    def edges(self) -> np.ndarray:
+        """Stored directed edges as an (E, 2) array; undirected edges appear once per direction."""
+        return self._edges.data
+
+    def _vertex_type(self) -> type:
+        return self._vertices.vertex_type if isinstance(self._vertices, VertexArray) else type(self._vertices[0])
+
+    def add_vertex(self, vertex: Vertex | Vertex2D | Vertex3D, connections: list[int] | None = None):
+        if connections is None:
+            connections = []
+        check_type(vertex, self._vertex_type(), "vertex")
         check_type(connections, list, "connections")
         check_consistency(connections, "connections")
 
         self._vertices.append(vertex)
         self._adjacency_list[vertex.id] = connections
-        self._adjacency_matrix = np.pad(self._adjacency_matrix, ((0, 1), (0, 1)), 'constant')
-        for connection in connections:
-            self._adjacency_matrix[-1, connection] = 1
-            self._adjacency_matrix[connection, -1] = 1
\ No newline at end of file
+        index = len(self._vertices) - 1
+        self.add_edges(np.full(len(connections), index, dtype=np.int64), connections)
+
+    def add_vertices(self, vertices: list[Vertex | Vertex2D | Vertex3D] | VertexArray) -> np.ndarray:
+        """Append a batch of vertices in amortised O(1) per vertex and return their indices."""
+        check_type(vertices, (list, VertexArray), "vertices")
+        if isinstance(vertices, list):
+            check_consistency(vertices, "vertices")
+        if len(vertices) > 0:
+            check_type(vertices[0], self._vertex_type(), "vertices")
+        if isinstance(self._vertices, list) and isinstance(vertices, VertexArray):
+            vertices = vertices.to_vertices()
+        start = len(self._vertices)
+        self._vertices.extend(vertices)
+        self._adjacency_matrix = None
+        return np.arange(start, len(self._vertices), dtype=np.int64)
+
+    def add_edges(self, rows: np.ndarray | list[int], cols: np.ndarray | list[int], symmetric: bool = True):
+        """Add the edges (rows[i], cols[i]), in both directions unless ``symmetric`` is False."""
+        rows = np.asarray(rows, dtype=np.int64).ravel()
+        cols = np.asarray(cols, dtype=np.int64).ravel()
+        if rows.shape != cols.shape:
+            raise ValueError("rows and cols must have the same length")
+        num_vertices = len(self._vertices)
+        if len(rows) > 0 and (min(rows.min(), cols.min()) < 0 or max(rows.max(), cols.max()) >= num_vertices):
+            raise ValueError(f"Edge end points must be vertex indices in [0, {num_vertices})")
+        self._edges.extend(np.stack([rows, cols], axis=1))
+        if symmetric:
+            self._edges.extend(np.stack([cols, rows], axis=1))
+        self._adjacency_matrix = None
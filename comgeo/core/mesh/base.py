@@ -1,32 +1,67 @@
 from ..graph import Graph
-from ..vertex import Vertex2D, Vertex3D
+from ..vertex import Vertex2D, Vertex3D, VertexArray, coordinate_version
 from ...decorator.error import not_instance, not_self_implemented
 from ..utils.error import check_type, check_consistency
+from ..utils.sparse import CSRMatrix
+from ..utils.buffer import GrowableArray
+from ..utils.version import VersionCounter
+from .primitives.face import Face
+from .edges.half_edge import HalfEdgeStructure
+from .edges.edge_table import EdgeTable
+from .shared import SharedMesh
+from ...functional.mesh.topology import flatten_faces, face_lists, pad_faces, face_adjacency, connected_components, vertex_face_incidence
+from ...functional.mesh.cleanup import clean_mesh
+from ...functional.mesh.geometry import face_geometry, vertex_normals
 
 import numpy as np
 
 
 class Mesh(Graph):
     def __init__(self, 
-        vertices: list[Vertex2D | Vertex3D], 
-        faces: list[list[int]],
+        vertices: list[Vertex2D | Vertex3D] | VertexArray, 
+        faces: list[list[int]] | np.ndarray,
         id: int = -1, 
         visited: bool = False
     ):  
         super().__init__(vertices, id, visited)
         
-        if type(self._vertices[0]) not in [Vertex2D, Vertex3D]:
+        if not isinstance(self._vertices[0], (Vertex2D, Vertex3D)):
             raise ValueError("Vertices must be of type Vertex2D or Vertex3D")
 
-        check_type(faces, list, "faces")
-        check_consistency(faces, "faces")
-        self.check_faces_len(faces)
-        self._faces = faces
+        check_type(faces, (list, np.ndarray), "faces")
+        # Faces given as an array are kept as that array, and flattened into (offsets, indices)
+        # arrays sharing its memory when unpadded on first use, until the faces getter first
+        # builds face lists; a memory-mapped array is not read when the mesh is created
+        self._face_arrays: np.ndarray | tuple[np.ndarray, np.ndarray] | None = None
+        if isinstance(faces, np.ndarray):
+            # (F, kmax) id array padded with -1, e.g. from load_mesh(..., as_array=True)
+            if faces.ndim != 2 or not np.issubdtype(faces.dtype, np.integer):
+                raise ValueError(f"faces must be a 2D integer array, got {faces.dtype} with shape {faces.shape}")
+            self.check_faces_len(faces)
+            self._face_arrays = faces
+            faces = None
+        else:
+            check_consistency(faces, "faces")
+            self.check_faces_len(faces)
+        self._faces: list | None = faces
+        # Bumped when the faces are replaced and by the in-place edits of owned Face objects
+        self._face_versions = VersionCounter()
+        self._adopt_faces()
 
-        self._face_adjacency_matrix: np.ndarray = np.zeros((len(faces), len(faces)))
+        # Derived data is built lazily on first access and dropped by _sync_caches once
+        # the faces or the vertex coordinates move past the versions it was built from
+        self._flat_faces: tuple[np.ndarray, np.ndarray] | None = None
+        self._half_edges: HalfEdgeStructure | None = None
+        self._edge_table: EdgeTable | None = None
+        self._edge_lengths: np.ndarray | None = None
+        self._face_adjacency_matrix: CSRMatrix | None = None
         self._connected_components: list[list[int]] = []
-        self._vertex2face: list[list[int]] = []
+        self._vertex2face: CSRMatrix | None = None
         self._vertex2cc: list[int] = []
+        self._face_geometry: dict[str, np.ndarray | None] | None = None
+        self._vertex_normals: np.ndarray | None = None
+        self._topology_version = self.topology_version
+        self._coordinate_version = coordinate_version(self._vertices)
     
     @not_self_implemented
     @staticmethod
@@ -44,7 +79,21 @@ class Mesh(Graph):
     
     @property
     def faces(self):
+        if self._faces is None:
+            # From here on the face lists or objects are the faces of the mesh
+            self._faces = self._make_faces(face_lists(pad_faces(*self._flatten_face_arrays())))
+            self._face_arrays = None
+            self._adopt_faces()
         return self._faces
+
+    def _flatten_face_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        if isinstance(self._face_arrays, np.ndarray):
+            self._face_arrays = flatten_faces(self._face_arrays)
+        return self._face_arrays
+
+    def _make_faces(self, faces: list[list[int]]) -> list:
+        """Faces of the mesh for trusted vertex id lists, the lists themselves by default."""
+        return faces
     
     @faces.setter
     @not_instance(list)
@@ -53,78 +102,373 @@ class Mesh(Graph):
         check_consistency(faces, "faces")
         self.check_faces_len(faces)
         self._faces = faces
+        self._face_arrays = None
+        self._adopt_faces()
+        self._face_versions.bump()
+        self._sync_caches()
+
+    def _adopt_faces(self):
+        """Make the mesh the owner of its Face objects, so their edits only reach its caches."""
+        for face in self._faces or ():
+            if isinstance(face, Face):
+                face._versions = self._face_versions
+
+    @property
+    def topology_version(self) -> tuple[int, int]:
+        """Changes whenever the faces or the number of vertices change.
+
+        Faces replaced through the faces setter or cleanup, and Face objects edited in
+        place, are tracked; after editing plain face lists in place call invalidate_caches.
+        A Face object shared by several meshes reports to the last one it was given to.
+        """
+        return (self._face_versions.value, len(self._vertices))
+
+    @property
+    def geometry_version(self) -> tuple[tuple[int, int], int]:
+        """Changes whenever the topology or the vertex coordinates change.
+
+        For vertex lists it also changes when any vertex object elsewhere moves, see
+        core.vertex.array.coordinate_version.
+        """
+        return (self.topology_version, coordinate_version(self._vertices))
+
+    def _reset_topology(self):
+        self._flat_faces = None
+        self._half_edges = None
+        self._edge_table = None
+        self._edge_lengths = None
+        self._face_adjacency_matrix = None
+        self._adjacency_matrix = None
+        self._connected_components = []
+        self._vertex2face = None
+        self._vertex2cc = []
+        self._face_geometry = None
+        self._vertex_normals = None
+
+    def _sync_caches(self):
+        topology_version = self.topology_version
+        if topology_version != self._topology_version:
+            self._reset_topology()
+            self._topology_version = topology_version
+        version = coordinate_version(self._vertices)
+        if version != self._coordinate_version:
+            self._face_geometry = None
+            self._vertex_normals = None
+            self._edge_lengths = None
+            self._coordinate_version = version
+
+    def invalidate_caches(self):
+        """Drop all derived data, e.g. after editing the face lists in place."""
+        self._face_versions.bump()
+        self._sync_caches()
+
+    @property
+    def vertex_coordinates(self) -> np.ndarray:
+        """Vertex coordinates as an (N, dim) array; zero-copy when the vertices are a VertexArray."""
+        if isinstance(self._vertices, VertexArray):
+            return self._vertices.coordinates
+        return np.array([v.coordinates for v in self._vertices], dtype=np.float64)
+
+    @property
+    def face_array(self) -> np.ndarray:
+        """Faces as an (F, k) index array; only defined when every face has k vertices."""
+        offsets, indices = self.flat_faces
+        sizes = np.diff(offsets)
+        if np.any(sizes != sizes[0]):
+            raise ValueError("face_array requires every face to have the same number of vertices")
+        return indices.reshape(len(sizes), sizes[0])
+
+    @property
+    def flat_faces(self) -> tuple[np.ndarray, np.ndarray]:
+        """Faces as (offsets, indices) arrays; face i uses indices[offsets[i]:offsets[i + 1]]."""
+        self._sync_caches()
+        if self._flat_faces is None:
+            if self._faces is None:
+                self._flat_faces = self._flatten_face_arrays()
+            else:
+                self._flat_faces = flatten_faces([getattr(face, "vertex_ids", face) for face in self._faces])
+        return self._flat_faces
+
+    def to_shared(self) -> SharedMesh:
+        """Copy the vertex coordinates and flat faces into shared memory for process-pool workers.
+
+        The copy is a snapshot: later edits of the mesh are not reflected. The caller owns
+        the blocks and releases them with ``unlink`` or by using the result as a context manager.
+        """
+        return SharedMesh.from_arrays(self.vertex_coordinates, *self.flat_faces)
     
+    def cleanup(self, tolerance: float = 0.0, area_tolerance: float = 0.0) -> dict:
+        """Weld vertices within ``tolerance`` and remove degenerate faces, duplicate faces and unused vertices.
+
+        The mesh is updated in place; surviving vertex objects keep their ids and faces
+        keep their type. Returns the report of functional.mesh.cleanup.clean_mesh.
+        """
+        check_type(tolerance, float, "tolerance")
+        check_type(area_tolerance, float, "area_tolerance")
+        _, offsets, indices, report = clean_mesh(self.vertex_coordinates, *self.flat_faces, tolerance, area_tolerance)
+        if len(offsets) == 1:
+            raise ValueError("Cleanup would remove every face of the mesh")
+
+        kept = report["kept_vertices"]
+        if isinstance(self._vertices, VertexArray):
+            self._vertices = self._vertices[kept]
+        else:
+            self._vertices = [self._vertices[i] for i in kept.tolist()]
+
+        if self._faces is None:
+            self._face_arrays = (offsets, indices)
+        else:
+            faces = face_lists(pad_faces(offsets, indices))
+            face_type = type(self._faces[0]) if hasattr(self._faces[0], "vertex_ids") else None
+            self._faces = faces if face_type is None else [face_type.unchecked(face) for face in faces]
+            self._adopt_faces()
+
+        # Edges added through add_vertex follow their end points or disappear with them
+        vertex_map = report["vertex_map"]
+        if len(self._edges) > 0:
+            edges = vertex_map[self._edges.data]
+            self._edges = GrowableArray.from_array(edges[(edges >= 0).all(axis=1)])
+        if len(self._adjacency_list) > 0:
+            self._adjacency_list = {
+                key: [int(vertex_map[c]) for c in connections if vertex_map[c] >= 0]
+                for key, connections in self._adjacency_list.items()
+            }
+
+        self._face_versions.bump()
+        self._sync_caches()
+        self._flat_faces = (offsets, indices)
+        return report
+
+    @property
+    def face_geometry(self) -> dict[str, np.ndarray | None]:
+        """Per-face areas, centroids, bounds and normals, see functional.mesh.geometry.face_geometry."""
+        self._sync_caches()
+        if self._face_geometry is None:
+            self.construct_face_geometry()
+        return self._face_geometry
+
+    @property
+    def has_face_geometry(self) -> bool:
+        self._sync_caches()
+        return self._face_geometry is not None
+
+    def construct_face_geometry(self) -> dict[str, np.ndarray | None]:
+        """Compute the geometry of every face in one vectorised pass.
+
+        The cache is dropped when the faces or the vertex coordinates change, see
+        geometry_version. A VertexArray tracks its own coordinates, but vertex lists share
+        one global counter, so moving any vertex object of the process also drops the
+        cache of every list-based mesh.
+        """
+        self._face_geometry = face_geometry(self.vertex_coordinates, *self.flat_faces)
+        return self._face_geometry
+
+    @property
+    def face_areas(self) -> np.ndarray:
+        return self.face_geometry["areas"]
+
+    @property
+    def face_centroids(self) -> np.ndarray:
+        return self.face_geometry["centroids"]
+
+    @property
+    def face_bounds(self) -> np.ndarray:
+        """(F, 2, dim) axis-aligned bounding boxes, minimum corner first."""
+        return self.face_geometry["bounds"]
+
     @property
-    def face_adjacency_matrix(self) -> np.ndarray:
+    def face_normals(self) -> np.ndarray | None:
+        """(F, 3) unit face normals of a 3D mesh, None in 2D."""
+        return self.face_geometry["normals"]
+
+    @property
+    def vertex_normals(self) -> np.ndarray:
+        """(N, 3) unit vertex normals of a 3D mesh, area-weighted unless built otherwise."""
+        self._sync_caches()
+        if self._vertex_normals is None:
+            self.construct_vertex_normals()
+        return self._vertex_normals
+
+    @property
+    def has_vertex_normals(self) -> bool:
+        self._sync_caches()
+        return self._vertex_normals is not None
+
+    def construct_vertex_normals(self, weighting: str = "area") -> np.ndarray:
+        """Compute the vertex normals with "area", "angle" or "uniform" weighting, see functional.mesh.geometry.vertex_normals."""
+        check_type(weighting, str, "weighting")
+        self._vertex_normals = vertex_normals(self.vertex_coordinates, *self.flat_faces, weighting)
+        return self._vertex_normals
+
+    def assign_vertex_normals(self):
+        """Write the vertex normals to the normal of every Vertex3D of the mesh, or to the normals column of its VertexArray3D."""
+        if isinstance(self._vertices, VertexArray):
+            self._vertices.normals[:] = self.vertex_normals
+            return
+        for vertex, normal in zip(self._vertices, self.vertex_normals.tolist()):
+            vertex._normal = tuple(normal)
+
+    def face_area(self, face: int) -> float:
+        return float(self.face_geometry["areas"][face])
+
+    def face_centroid(self, face: int) -> np.ndarray:
+        return self.face_geometry["centroids"][face]
+
+    @property
+    def half_edges(self) -> HalfEdgeStructure:
+        """Half-edge connectivity of the faces, built on first access."""
+        self._sync_caches()
+        if self._half_edges is None:
+            self._half_edges = HalfEdgeStructure(*self.flat_faces, len(self._vertices))
+        return self._half_edges
+
+    @property
+    def edge_table(self) -> EdgeTable:
+        """Unique edges with their face incidence, built on first access."""
+        self._sync_caches()
+        if self._edge_table is None:
+            self.construct_edge_table()
+        return self._edge_table
+
+    @property
+    def has_edge_table(self) -> bool:
+        self._sync_caches()
+        return self._edge_table is not None
+
+    def construct_edge_table(self) -> EdgeTable:
+        self._edge_table = EdgeTable(*self.flat_faces, len(self._vertices))
+        return self._edge_table
+
+    @property
+    def edge_lengths(self) -> np.ndarray:
+        """Length of every edge of edge_table, cached until the coordinates change."""
+        self._sync_caches()
+        if self._edge_lengths is None:
+            self._edge_lengths = self.edge_table.lengths(self.vertex_coordinates)
+        return self._edge_lengths
+
+    @property
+    def face_adjacency_matrix(self) -> CSRMatrix:
+        self._sync_caches()
+        if self._face_adjacency_matrix is None:
+            self.construct_face_adjacency_matrix()
         return self._face_adjacency_matrix
     
     @property
     def has_face_adjacency_matrix(self) -> bool:
-        return np.sum(self._face_adjacency_matrix) > 0
+        self._sync_caches()
+        return self._face_adjacency_matrix is not None and self._face_adjacency_matrix.nnz > 0
     
-    @not_self_implemented
-    def construct_face_adjacency_matrix(self) -> np.ndarray:
-        pass
+    def construct_face_adjacency_matrix(self) -> CSRMatrix:
+        half_edges = self.half_edges
+        if not half_edges.is_manifold:
+            # Twins only link pairs of faces, so edges shared by more faces need the edge sort
+            self._face_adjacency_matrix = face_adjacency(*self.flat_faces, len(self._vertices))
+            return self._face_adjacency_matrix
+        rows, cols = half_edges.face_adjacency_pairs()
+        self._face_adjacency_matrix = CSRMatrix.from_coo(rows, cols, (half_edges.num_faces, half_edges.num_faces))
+        return self._face_adjacency_matrix
     
     @property
     def connected_components(self) -> list[list[int]]:
+        self._sync_caches()
+        if not self._connected_components:
+            self.construct_connected_components()
         return self._connected_components
     
     @property
     def has_connected_components(self) -> bool:
+        self._sync_caches()
         return len(self._connected_components) > 0
     
-    @not_self_implemented
     def construct_connected_components(self) -> list[list[int]]:
-        pass
+        """Group the face ids into parts connected through shared vertices.
+
+        Uses a vectorised union-find over the face corners and caches both the parts and
+        the vertex2cc labels (-1 for vertices used by no face).
+        """
+        vertex_labels, face_labels = connected_components(*self.flat_faces, len(self._vertices))
+        order = np.argsort(face_labels, kind="stable")
+        splits = np.cumsum(np.bincount(face_labels))[:-1]
+        self._connected_components = [part.tolist() for part in np.split(order, splits)]
+        self._vertex2cc = vertex_labels.tolist()
+        return self._connected_components
     
     @property
-    def vertex2face(self) -> list[list[int]]:
+    def vertex2face(self) -> CSRMatrix:
+        """Vertex-to-face incidence; row v holds the ids of the faces using vertex v."""
+        self._sync_caches()
+        if self._vertex2face is None:
+            self.construct_vertex2face()
         return self._vertex2face
     
     @property
     def has_vertex2face(self) -> bool:
-        return len(self._vertex2face) > 0
+        self._sync_caches()
+        return self._vertex2face is not None
     
-    @not_self_implemented
-    def construct_vertex2face(self) -> list[list[int]]:
-        pass
+    def construct_vertex2face(self) -> CSRMatrix:
+        self._vertex2face = vertex_face_incidence(*self.flat_faces, len(self._vertices))
+        return self._vertex2face
+
+    def vertex_faces(self, vertex: int) -> np.ndarray:
+        """Ids of the faces using ``vertex``, as a zero-copy slice of vertex2face."""
+        return self.vertex2face.row(vertex)
     
     @property
     def vertex2cc(self) -> list[int]:
+        self._sync_caches()
+        if not self._vertex2cc:
+            self.construct_vertex2cc()
         return self._vertex2cc
     
     @property
     def has_vertex2cc(self) -> bool:
+        self._sync_caches()
         return len(self._vertex2cc) > 0
     
-    @not_self_implemented
     def construct_vertex2cc(self) -> list[int]:
-        pass
+        """Component index of every vertex, see construct_connected_components."""
+        self.construct_connected_components()
+        return self._vertex2cc
     
     @property
-    def vertex_adjacency_matrix(self) -> np.ndarray:
-        return self._adjacency_matrix
+    def vertex_adjacency_matrix(self) -> CSRMatrix:
+        return self.adjacency_matrix
     
     @property
     def has_vertex_adjacency_matrix(self) -> bool:
-        return np.sum(self._adjacency_matrix) > 0
+        self._sync_caches()
+        return self._adjacency_matrix is not None and self._adjacency_matrix.nnz > 0
     
-    @not_self_implemented
-    def construct_vertex_adjacency_matrix(self) -> np.ndarray:
-        pass
+    def construct_adjacency_matrix(self) -> CSRMatrix:
+        return self.construct_vertex_adjacency_matrix()
+
+    def construct_vertex_adjacency_matrix(self) -> CSRMatrix:
+        """Build the vertex adjacency from the face boundaries plus any edges added through add_vertex."""
+        num_vertices = len(self._vertices)
+        rows, cols = self.half_edges.vertex_adjacency_pairs()
+        self._adjacency_matrix = CSRMatrix.from_coo(
+            np.concatenate([rows, self._edges.data[:, 0]]),
+            np.concatenate([cols, self._edges.data[:, 1]]),
+            (num_vertices, num_vertices)
+        )
+        return self._adjacency_matrix
     
     @property
-    def vertex_adjacency_list(self) -> list[list[int]]:
+    def vertex_adjacency_list(self) -> dict[int, list[int]]:
         return self._adjacency_list
     
     @property
     def has_vertex_adjacency_list(self) -> bool:
         return len(self._adjacency_list) > 0
     
-    @not_self_implemented
-    def construct_vertex_adjacency_list(self) -> list[list[int]]:
-        pass
+    def construct_vertex_adjacency_list(self) -> dict[int, list[int]]:
+        """Neighbours of every vertex, keyed by vertex index, from the vertex adjacency matrix."""
+        adjacency = self.vertex_adjacency_matrix
+        rows = np.split(adjacency.indices, adjacency.indptr[1:-1])
+        self._adjacency_list = {i: row.tolist() for i, row in enumerate(rows)}
+        return self._adjacency_list
 
     @not_self_implemented
     def point_cloud_sampling(self, num_points: int) -> list[Vertex2D | Vertex3D]:
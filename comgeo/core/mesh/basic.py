@@ -1,21 +1,22 @@
 from .hybrid import HybridMesh
-from .primitives.face import Face
 from .primitives.quad_face import QuadFace
 from .primitives.triangle_face import TriangleFace
-from ..vertex import Vertex2D, Vertex3D
+from ..vertex import Vertex2D, Vertex3D, VertexArray
 
 from ..utils.error import check_type
 from ...functional.mesh.io.load import load_mesh
+from ...functional.mesh.sampling import iter_sample_faces, sample_faces, sample_faces_to_file
 
-from ...constant import EIGHTY_WORKERS
+from typing import Iterator
+import os
 
-import multiprocessing
+import numpy as np
 
 
 class BasicMesh(HybridMesh):
     def __init__(self, 
-        vertices: list[Vertex2D | Vertex3D], 
-        faces: list[list[int]],
+        vertices: list[Vertex2D | Vertex3D] | VertexArray, 
+        faces: list[list[int]] | np.ndarray,
         id: int = -1, 
         visited: bool = False,
         face_type: type[QuadFace] | type[TriangleFace] = TriangleFace,
@@ -29,9 +30,10 @@ class BasicMesh(HybridMesh):
     def from_file_path(
         file_path: str, 
         dim: int, 
-        face_type: type[QuadFace] | type[TriangleFace]
+        face_type: type[QuadFace] | type[TriangleFace],
+        as_array: bool = False
     ) -> "BasicMesh":
-        vertices, faces = load_mesh(file_path, dim)
+        vertices, faces = load_mesh(file_path, dim, as_array=as_array)
         return BasicMesh(
             vertices=vertices,
             faces=faces,
@@ -39,51 +41,70 @@ class BasicMesh(HybridMesh):
             dim=dim
         )
 
-    @staticmethod
-    def _face_area(args):
-        face: Face = args[0]
-        vertices: list[Vertex2D | Vertex3D] = args[1]
-        return face.area(vertices)
-    
-    @staticmethod
-    def _sample_points(args):
-        face: Face = args[0]
-        num: int = args[1]
-        vertices: list[Vertex2D | Vertex3D] = args[2]
-        return face.point_cloud_sampling(num, vertices)
-        
-    def point_cloud_sampling(self, num_points: int) -> list[Vertex2D | Vertex3D]:
-        with multiprocessing.Pool(EIGHTY_WORKERS) as pool:
-            face_areas = pool.map(
-                BasicMesh._face_area,
-                [(face, self._vertices) for face in self._faces]
-            )
-
-        total_area = sum(face_areas)
-        probabilities = [area / total_area for area in face_areas]
+    def point_cloud_sampling_array(self,
+        num_points: int,
+        rng: np.random.Generator | int | None = None,
+        return_face_index: bool = False,
+        return_barycentric: bool = False,
+        chunk_size: int | None = None
+    ) -> np.ndarray | tuple[np.ndarray, ...]:
+        """Sample points uniformly by area and return them as one (num_points, dim) array.
 
-        # Split num_points for each face based on area, ensure at least 1 point per face
-        points_per_face = [max(1, int(round(p * num_points))) for p in probabilities]
+        See functional.mesh.sampling.sample_faces for the optional face index and
+        barycentric outputs and for chunked sampling on the execution backend.
+        """
+        return sample_faces(
+            self.vertex_coordinates,
+            self.face_array,
+            num_points,
+            rng=rng,
+            return_face_index=return_face_index,
+            return_barycentric=return_barycentric,
+            areas=self.face_areas,
+            chunk_size=chunk_size
+        )
 
-        # Adjust total points to match num_points exactly
-        diff = sum(points_per_face) - num_points
-        if diff != 0:
-            # Sort faces by fractional part of their probability for adjustment
-            fractional = [(i, (probabilities[i] * num_points) % 1) for i in range(len(probabilities))]
-            fractional.sort(key=lambda x: x[1], reverse=(diff > 0))
-            for i in range(abs(diff)):
-                idx = fractional[i][0]
-                points_per_face[idx] -= 1 if diff > 0 else -1
+    def point_cloud_sampling_chunks(self,
+        num_points: int,
+        chunk_size: int,
+        rng: np.random.Generator | int | None = None,
+        return_face_index: bool = False,
+        return_barycentric: bool = False
+    ) -> Iterator[np.ndarray | tuple[np.ndarray, ...]]:
+        """Yield the samples as (chunk_size, dim) arrays with bounded memory, see functional.mesh.sampling.iter_sample_faces."""
+        return iter_sample_faces(
+            self.vertex_coordinates,
+            self.face_array,
+            num_points,
+            chunk_size,
+            rng=rng,
+            return_face_index=return_face_index,
+            return_barycentric=return_barycentric,
+            areas=self.face_areas
+        )
 
-        # Use multiprocessing to sample points from faces in parallel
-        with multiprocessing.Pool(EIGHTY_WORKERS) as pool:
-            sampled_points_lists = pool.map(
-                self._sample_points,
-                [(self._faces[i], points_per_face[i], self._vertices) for i in range(len(self._faces))]
-            )
+    def point_cloud_sampling_to_file(self,
+        num_points: int,
+        out: str | os.PathLike | np.ndarray,
+        chunk_size: int,
+        rng: np.random.Generator | int | None = None
+    ) -> np.ndarray:
+        """Stream the samples into a .npy/raw file or a numpy.memmap, see functional.mesh.sampling.sample_faces_to_file."""
+        return sample_faces_to_file(
+            self.vertex_coordinates,
+            self.face_array,
+            num_points,
+            out,
+            chunk_size,
+            rng=rng,
+            areas=self.face_areas
+        )
 
-        sampled_points = []
-        for pts in sampled_points_lists:
-            sampled_points.extend(pts)
+    def point_cloud_sampling(self, num_points: int, rng: np.random.Generator | int | None = None) -> list[Vertex2D | Vertex3D]:
+        """Sample points uniformly by area as vertex objects.
 
-        return sampled_points
\ No newline at end of file
+        Use point_cloud_sampling_array to get the samples as one array without building a
+        vertex per point, or point_cloud_sampling_chunks for very large sample counts.
+        """
+        points = self.point_cloud_sampling_array(num_points, rng=rng)
+        return Vertex2D.from_array(points) if self._dim == 2 else Vertex3D.from_array(points)
@@ -0,0 +1,2 @@
+from .half_edge import HalfEdgeStructure
+from .edge_table import EdgeTable
@@ -2,7 +2,9 @@ from ...vertex import Vertex2D, Vertex3D
 from ...vector import Vector2D, Vector3D
 from ....decorator.error import not_instance, not_self_implemented
 from ...utils.error import check_type, check_consistency
-from ....functional.vertex.triplets.check import is_ccw
+from ....functional.vertex.triplets.compute import triplet_orientation
+
+import numpy as np
 
 
 class BaseEdge:
@@ -34,13 +36,15 @@ class BaseEdge:
     def intersect(self, other: 'BaseEdge') -> bool:
         check_type(other, BaseEdge, "other")
 
-        v1 = self._start
-        v2 = self._end
-        v3 = other.start
-        v4 = other.end
+        check_consistency([self._start, other.start], "<Vertex2D, Vertex3D>")
+
+        v1 = self._start.coordinates
+        v2 = self._end.coordinates
+        v3 = other.start.coordinates
+        v4 = other.end.coordinates
 
-        return (is_ccw(v1, v3, v4) != is_ccw(v2, v3, v4)) \
-            and (is_ccw(v1, v2, v3) != is_ccw(v1, v2, v4))
+        ccw = triplet_orientation(np.array([[v1, v3, v4], [v2, v3, v4], [v1, v2, v3], [v1, v2, v4]], dtype=np.float64)) > 0
+        return bool((ccw[0] != ccw[1]) and (ccw[2] != ccw[3]))
 
 class BaseEdge2D(BaseEdge):
     def __init__(self, start: Vertex2D, end: Vertex2D):
@@ -0,0 +1,94 @@
+from ...utils.error import check_type
+from ...utils.sparse import CSRMatrix
+from ....functional.mesh.topology import face_edges, flatten_faces, unique_edges
+
+import numpy as np
+
+
+class EdgeTable:
+    """Unique undirected edges of a polygonal mesh and their incidence with the faces.
+
+    Edges are stored as an (E, 2) array with the lower vertex id first, sorted by
+    (low, high). The face-to-edge map follows the flat face arrays: ``corner_edges[c]``
+    is the edge from corner c to the next corner of its face. The edge-to-face map is a
+    CSR matrix whose row e lists the faces along edge e.
+    """
+
+    def __init__(self, offsets: np.ndarray, indices: np.ndarray, num_vertices: int):
+        check_type(num_vertices, int, "num_vertices")
+        offsets = np.asarray(offsets, dtype=np.int64)
+        indices = np.asarray(indices, dtype=np.int64)
+        self._offsets = offsets
+        self._edges, self._corner_edges = unique_edges(offsets, indices, num_vertices)
+
+        start, end, face_ids = face_edges(offsets, indices)
+        valid = self._corner_edges >= 0
+        corner_edges = self._corner_edges[valid]
+        # Number of face sides on every edge: 1 on the boundary, 2 inside, more when non-manifold
+        self._valence = np.bincount(corner_edges, minlength=len(self._edges))
+
+        order = np.argsort(corner_edges, kind="stable")
+        indptr = np.zeros(len(self._edges) + 1, dtype=np.int64)
+        np.cumsum(self._valence, out=indptr[1:])
+        self._edge2face = CSRMatrix(indptr, face_ids[valid][order], (len(self._edges), len(offsets) - 1))
+
+        # Boundary edges keep the direction in which their face traverses them
+        boundary = np.flatnonzero(valid)[self._valence[corner_edges] == 1]
+        self._boundary_edges = np.stack([start[boundary], end[boundary]], axis=1)
+
+    @classmethod
+    def from_faces(cls, faces: list[list[int]] | np.ndarray, num_vertices: int) -> 'EdgeTable':
+        return cls(*flatten_faces(faces), num_vertices)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self._edges)
+
+    @property
+    def edges(self) -> np.ndarray:
+        return self._edges
+
+    @property
+    def corner_edges(self) -> np.ndarray:
+        return self._corner_edges
+
+    @property
+    def face2edge(self) -> tuple[np.ndarray, np.ndarray]:
+        """Face-to-edge map as flat (offsets, edge ids) arrays, like the flat faces."""
+        return self._offsets, self._corner_edges
+
+    @property
+    def edge2face(self) -> CSRMatrix:
+        return self._edge2face
+
+    @property
+    def valence(self) -> np.ndarray:
+        """Number of face sides along every edge."""
+        return self._valence
+
+    @property
+    def boundary_mask(self) -> np.ndarray:
+        return self._valence == 1
+
+    @property
+    def non_manifold_mask(self) -> np.ndarray:
+        return self._valence > 2
+
+    @property
+    def boundary_edges(self) -> np.ndarray:
+        """(B, 2) boundary edges, directed as their face traverses them."""
+        return self._boundary_edges
+
+    def face_edges(self, face: int) -> np.ndarray:
+        """Edge ids along ``face`` in boundary order, -1 where a vertex repeats."""
+        return self._corner_edges[self._offsets[face]:self._offsets[face + 1]]
+
+    def edge_faces(self, edge: int) -> np.ndarray:
+        return self._edge2face.row(edge)
+
+    def lengths(self, coordinates: np.ndarray) -> np.ndarray:
+        """Length of every edge for (N, dim) vertex coordinates."""
+        return np.linalg.norm(coordinates[self._edges[:, 1]] - coordinates[self._edges[:, 0]], axis=1)
+
+    def __repr__(self):
+        return f"EdgeTable(num_edges={self.num_edges}, num_boundary={len(self._boundary_edges)}, num_non_manifold={int(self.non_manifold_mask.sum())})"
@@ -0,0 +1,249 @@
+from ...utils.error import check_type
+from ....functional.mesh.topology import face_edges, flatten_faces
+
+from typing import Iterator
+import numpy as np
+
+
+class HalfEdgeStructure:
+    """Array-based half-edge (DCEL) connectivity of a polygonal mesh.
+
+    Half-edge h starts at ``vertex[h]``, belongs to face ``face[h]`` and is followed by
+    ``next[h]`` inside that face. ``twin[h]`` is the half-edge of the neighbouring face
+    along the same edge, or -1 on the boundary and on non-manifold edges (shared by more
+    than two faces). Half-edges are numbered like the corners of the flat face arrays,
+    so half-edge ``offsets[f] + i`` starts at corner i of face f.
+    """
+
+    def __init__(self, offsets: np.ndarray, indices: np.ndarray, num_vertices: int):
+        check_type(num_vertices, int, "num_vertices")
+        offsets = np.asarray(offsets, dtype=np.int64)
+        indices = np.asarray(indices, dtype=np.int64)
+        start, end, face_ids = face_edges(offsets, indices)
+        num_halfedges = len(indices)
+        halfedges = np.arange(num_halfedges, dtype=np.int64)
+
+        self._num_vertices = num_vertices
+        self._sizes = np.diff(offsets)
+        self._vertex = indices.copy()
+        self._face = face_ids
+        self._next = np.empty(num_halfedges, dtype=np.int64)
+        self._prev = np.empty(num_halfedges, dtype=np.int64)
+        # face_edges pairs every corner with its successor, which gives next directly
+        following = np.arange(1, num_halfedges + 1, dtype=np.int64)
+        non_empty = self._sizes > 0
+        following[offsets[1:][non_empty] - 1] = offsets[:-1][non_empty]
+        self._next[:] = following
+        self._prev[following] = halfedges
+        self._face_halfedge = offsets[:-1].copy()
+
+        # Half-edges along the same undirected edge form runs of equal keys; degenerate
+        # half-edges (a repeated corner) get unique negative keys and are never paired
+        self._degenerate = start == end
+        keys = np.minimum(start, end) * max(num_vertices, 1) + np.maximum(start, end)
+        keys[self._degenerate] = -1 - halfedges[self._degenerate]
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        run_start = np.ones(num_halfedges, dtype=np.bool_)
+        run_start[1:] = keys[1:] != keys[:-1]
+        run_id = np.cumsum(run_start) - 1
+        run_length = np.bincount(run_id)[run_id] if num_halfedges > 0 else np.zeros(0, dtype=np.int64)
+
+        self._twin = np.full(num_halfedges, -1, dtype=np.int64)
+        pair = np.flatnonzero(run_start & (run_length == 2))
+        self._twin[order[pair]] = order[pair + 1]
+        self._twin[order[pair + 1]] = order[pair]
+        self._non_manifold = np.zeros(num_halfedges, dtype=np.bool_)
+        self._non_manifold[order[run_length > 2]] = True
+        self._manifold = not self._non_manifold.any()
+
+        paired = np.flatnonzero(self._twin >= 0)
+        self._oriented = bool(np.all(self._vertex[self._twin[paired]] == end[paired]))
+
+        # One outgoing half-edge per vertex, a boundary one where possible so that the
+        # rotation around the vertex starts at the beginning of its fan
+        self._vertex_halfedge = np.full(num_vertices, -1, dtype=np.int64)
+        self._vertex_halfedge[self._vertex[::-1]] = halfedges[::-1]
+        boundary = np.flatnonzero(self.boundary_halfedges)
+        self._vertex_halfedge[self._vertex[boundary[::-1]]] = boundary[::-1]
+
+    @classmethod
+    def from_faces(cls, faces: list[list[int]] | np.ndarray, num_vertices: int) -> 'HalfEdgeStructure':
+        return cls(*flatten_faces(faces), num_vertices)
+
+    @property
+    def num_halfedges(self) -> int:
+        return len(self._vertex)
+
+    @property
+    def num_faces(self) -> int:
+        return len(self._face_halfedge)
+
+    @property
+    def num_vertices(self) -> int:
+        return self._num_vertices
+
+    @property
+    def vertex(self) -> np.ndarray:
+        return self._vertex
+
+    @property
+    def face(self) -> np.ndarray:
+        return self._face
+
+    @property
+    def next(self) -> np.ndarray:
+        return self._next
+
+    @property
+    def prev(self) -> np.ndarray:
+        return self._prev
+
+    @property
+    def twin(self) -> np.ndarray:
+        return self._twin
+
+    @property
+    def vertex_halfedge(self) -> np.ndarray:
+        return self._vertex_halfedge
+
+    @property
+    def face_halfedge(self) -> np.ndarray:
+        return self._face_halfedge
+
+    @property
+    def destination(self) -> np.ndarray:
+        """End vertex of every half-edge."""
+        return self._vertex[self._next]
+
+    @property
+    def is_manifold(self) -> bool:
+        """Whether no edge is shared by more than two faces."""
+        return self._manifold
+
+    @property
+    def is_oriented(self) -> bool:
+        """Whether every pair of neighbouring faces traverses their shared edge in opposite directions."""
+        return self._oriented
+
+    @property
+    def boundary_halfedges(self) -> np.ndarray:
+        """Mask of the half-edges without a twin on a manifold edge."""
+        return (self._twin < 0) & ~self._non_manifold & ~self._degenerate
+
+    @property
+    def boundary_vertices(self) -> np.ndarray:
+        """Mask of the vertices touching a boundary edge."""
+        boundary = np.flatnonzero(self.boundary_halfedges)
+        mask = np.zeros(self._num_vertices, dtype=np.bool_)
+        mask[self._vertex[boundary]] = True
+        mask[self._vertex[self._next[boundary]]] = True
+        return mask
+
+    def is_boundary_vertex(self, vertex: int) -> bool:
+        """O(1) boundary test, valid for manifold vertices of an oriented structure."""
+        halfedge = self._vertex_halfedge[vertex]
+        return bool(halfedge >= 0 and (self._twin[halfedge] < 0 or self._twin[self._prev[halfedge]] < 0))
+
+    def _check_traversable(self):
+        if not self._oriented or not self._manifold:
+            raise ValueError("Traversal requires a manifold mesh with consistently oriented faces")
+
+    def outgoing(self, vertex: int) -> Iterator[int]:
+        """Yield the outgoing half-edges of ``vertex`` in rotation order."""
+        self._check_traversable()
+        first = int(self._vertex_halfedge[vertex])
+        halfedge = first
+        while halfedge >= 0:
+            yield halfedge
+            halfedge = int(self._twin[self._prev[halfedge]])
+            if halfedge == first:
+                return
+
+    def one_ring(self, vertex: int) -> np.ndarray:
+        """Neighbouring vertices of ``vertex`` in rotation order."""
+        halfedges = list(self.outgoing(vertex))
+        ring = self._vertex[self._next[halfedges]].tolist()
+        # On the boundary the last neighbour is only reached through an incoming half-edge
+        if len(halfedges) > 0 and self._twin[self._prev[halfedges[-1]]] < 0:
+            ring.append(int(self._vertex[self._prev[halfedges[-1]]]))
+        return np.array(ring, dtype=np.int64)
+
+    def vertex_faces(self, vertex: int) -> np.ndarray:
+        """Faces around ``vertex`` in rotation order."""
+        return self._face[list(self.outgoing(vertex))]
+
+    def face_halfedges(self, face: int) -> np.ndarray:
+        """Half-edges of ``face`` in boundary order."""
+        halfedges = [int(self._face_halfedge[face])]
+        for _ in range(self._sizes[face] - 1):
+            halfedges.append(int(self._next[halfedges[-1]]))
+        return np.array(halfedges, dtype=np.int64)
+
+    def face_neighbors(self, face: int) -> np.ndarray:
+        """Faces sharing an edge with ``face``."""
+        twins = self._twin[self.face_halfedges(face)]
+        return self._face[twins[twins >= 0]]
+
+    def face_vertices(self, face: int) -> np.ndarray:
+        return self._vertex[self.face_halfedges(face)]
+
+    def flip(self, halfedge: int):
+        """Flip the interior edge of ``halfedge`` between two triangles to the other diagonal."""
+        self._check_traversable()
+        h, t = int(halfedge), int(self._twin[halfedge])
+        if t < 0:
+            raise ValueError(f"Half-edge {h} lies on the boundary and cannot be flipped")
+        f0, f1 = int(self._face[h]), int(self._face[t])
+        if self._sizes[f0] != 3 or self._sizes[f1] != 3:
+            raise ValueError("Only edges between two triangles can be flipped")
+
+        # h: a -> b, h1: b -> c, h2: c -> a and t: b -> a, t1: a -> d, t2: d -> b
+        h1, h2 = int(self._next[h]), int(self._prev[h])
+        t1, t2 = int(self._next[t]), int(self._prev[t])
+        a, b = int(self._vertex[h]), int(self._vertex[t])
+        c, d = int(self._vertex[h2]), int(self._vertex[t2])
+        if c == d or d in self.one_ring(c).tolist():
+            raise ValueError(f"Flipping half-edge {h} would duplicate the edge ({c}, {d})")
+
+        # h becomes d -> c in (d, c, a) and t becomes c -> d in (c, d, b)
+        self._vertex[h], self._vertex[t] = d, c
+        for cycle, face in (((h, h2, t1), f0), ((t, t2, h1), f1)):
+            for i in range(3):
+                self._next[cycle[i]] = cycle[(i + 1) % 3]
+                self._prev[cycle[(i + 1) % 3]] = cycle[i]
+                self._face[cycle[i]] = face
+        self._face_halfedge[f0], self._face_halfedge[f1] = h, t
+        if self._vertex_halfedge[a] == h:
+            self._vertex_halfedge[a] = t1
+        if self._vertex_halfedge[b] == t:
+            self._vertex_halfedge[b] = h1
+
+    def to_flat_faces(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the current faces as flat (offsets, indices) arrays, reflecting any flips."""
+        offsets = np.zeros(self.num_faces + 1, dtype=np.int64)
+        np.cumsum(self._sizes, out=offsets[1:])
+        indices = np.empty(offsets[-1], dtype=np.int64)
+        halfedge = self._face_halfedge.copy()
+        for corner in range(int(self._sizes.max()) if self.num_faces > 0 else 0):
+            active = self._sizes > corner
+            indices[offsets[:-1][active] + corner] = self._vertex[halfedge[active]]
+            halfedge = self._next[halfedge]
+        return offsets, indices
+
+    def face_adjacency_pairs(self) -> tuple[np.ndarray, np.ndarray]:
+        """(face, neighbour face) for every half-edge with a twin."""
+        paired = np.flatnonzero(self._twin >= 0)
+        faces, neighbors = self._face[paired], self._face[self._twin[paired]]
+        keep = faces != neighbors
+        return faces[keep], neighbors[keep]
+
+    def vertex_adjacency_pairs(self) -> tuple[np.ndarray, np.ndarray]:
+        """Directed (vertex, neighbour) pairs along every edge, both directions for every edge."""
+        keep = ~self._degenerate
+        start = self._vertex[keep]
+        end = self.destination[keep]
+        return np.concatenate([start, end]), np.concatenate([end, start])
+
+    def __repr__(self):
+        return f"HalfEdgeStructure(num_vertices={self._num_vertices}, num_faces={self.num_faces}, num_halfedges={self.num_halfedges})"
@@ -2,16 +2,20 @@ from .base import Mesh
 from .primitives.face import Face
 from .primitives.quad_face import QuadFace
 from .primitives.triangle_face import TriangleFace
-from ..vertex import Vertex2D, Vertex3D
+from ..vertex import Vertex2D, Vertex3D, VertexArray, VertexArray3D
 from ...functional.mesh.io.load import load_mesh
+from ...functional.mesh.io.save import save_mesh
+from ...functional.mesh.topology import pad_faces
 
 from ..utils.error import check_type
 
+import numpy as np
+
 
 class HybridMesh(Mesh):
     def __init__(self, 
-        vertices: list[Vertex2D | Vertex3D], 
-        faces: list[list[int]],
+        vertices: list[Vertex2D | Vertex3D] | VertexArray, 
+        faces: list[list[int]] | np.ndarray,
         id: int = -1, 
         visited: bool = False,
         face_type: type[Face] | type[QuadFace] | type[TriangleFace] = Face,
@@ -27,12 +31,45 @@ class HybridMesh(Mesh):
             raise ValueError("dim must be 2 or 3")
 
         check_type(face_type, (type(Face), type(QuadFace), type(TriangleFace)), "face_type")
-        self._faces = [face_type(face) for face in faces]
+        self._face_type = face_type
+        if self._faces is None:
+            # Face objects are only created on first access to faces
+            max_vertices = face_type.max_vertices
+            faces = self._face_arrays
+            if max_vertices is not None and faces.shape[1] > max_vertices and np.any(faces[:, max_vertices:] >= 0):
+                raise ValueError(f"Faces of {face_type.__name__} have at most {max_vertices} vertices")
+        else:
+            self._faces = [face_type(face) for face in self._faces]
+            self._adopt_faces()
+        self._dim = dim
+
+    @property
+    def dim(self) -> int:
+        return self._dim
+
+    def _make_faces(self, faces: list[list[int]]) -> list[Face]:
+        return self._face_type.from_array(faces)
     
     @staticmethod
-    def from_file_path(file_path: str, dim: int = 2) -> 'HybridMesh':
-        vertices, faces = load_mesh(file_path, dim)
+    def from_file_path(file_path: str, dim: int = 2, as_array: bool = False) -> 'HybridMesh':
+        vertices, faces = load_mesh(file_path, dim, as_array=as_array)
         return HybridMesh(vertices, faces, dim=dim)
 
+    def export_to_file_path(self, file_path: str):
+        """Save the mesh as ``.obj`` text or as the native memory-mappable ``.cgm`` format, with its vertex normals if any are set."""
+        attributes = None
+        normals = self._vertex_normal_column()
+        if normals is not None:
+            attributes = {"normals": normals}
+        save_mesh(file_path, self.vertex_coordinates, pad_faces(*self.flat_faces), attributes)
+
+    def _vertex_normal_column(self) -> np.ndarray | None:
+        """(N, 3) normals stored on the vertices, NaN where unset, or None if no vertex has one."""
+        if isinstance(self._vertices, VertexArray3D):
+            return self._vertices._normals
+        if self._dim == 3 and any(v._normal is not None for v in self._vertices):
+            return np.array([v.normal for v in self._vertices], dtype=np.float64)
+        return None
+
     def point_cloud_sampling(self, num_points):
         pass
\ No newline at end of file
@@ -1,14 +1,20 @@
-from ...vertex import Vertex, Vertex2D, Vertex3D
-from ....functional.vertex.triplets.check import is_ccw
+from ...vertex import Vertex, Vertex2D, Vertex3D, coordinate_version
+from ....functional.vertex.triplets.compute import triplet_orientation, cyclic_triplets
 from ....functional.polygon.center import get_center
 
 from ....decorator.error import not_instance, not_self_implemented, not_self_instance
 from ...utils.error import check_type, check_consistency
+from ...utils.version import VersionCounter
 
 import numpy as np
 
 
 class Face:
+    __slots__ = ("_vertex_ids", "_id", "_visited", "_center", "_area", "_geometry_version", "_max_num_vertices", "_versions")
+
+    # Corner limit used by unchecked(); subclasses with a fixed size override it
+    max_vertices: int | None = None
+
     def __init__(self, vertex_ids: list[int], id: int = -1, visited: bool = False, max_num_vertices: int | None = None):
         check_type(vertex_ids, list, "vertex_ids")
         check_type(id, int, "id")
@@ -19,11 +25,42 @@ class Face:
         self._visited = visited
         self._center: Vertex2D | Vertex3D | None = None
         self._area: float | None = None 
+        # Coordinate version the memoized center and area were computed from, None once set by hand
+        self._geometry_version: int | None = None
         self._max_num_vertices = max_num_vertices
+        # Face counter of the owning mesh, bumped by in-place edits
+        self._versions: VersionCounter | None = None
 
         if max_num_vertices is not None:
             assert len(vertex_ids) <= max_num_vertices, "Number of vertices in face exceeds max_num_vertices"
     
+    @classmethod
+    def unchecked(cls, vertex_ids: list[int], id: int = -1, visited: bool = False) -> 'Face':
+        """Create a face without validating the arguments, for trusted bulk construction."""
+        face = cls.__new__(cls)
+        face._vertex_ids = vertex_ids
+        face._id = id
+        face._visited = visited
+        face._center = None
+        face._area = None
+        face._geometry_version = None
+        face._max_num_vertices = cls.max_vertices
+        face._versions = None
+        return face
+
+    @classmethod
+    def from_array(cls, vertex_ids: np.ndarray | list[list[int]]) -> list['Face']:
+        """Create one face per row of vertex ids, validating the input once instead of every face."""
+        if isinstance(vertex_ids, np.ndarray):
+            if vertex_ids.ndim != 2 or not np.issubdtype(vertex_ids.dtype, np.integer):
+                raise ValueError(f"vertex_ids must be a 2D integer array, got {vertex_ids.dtype} with shape {vertex_ids.shape}")
+            vertex_ids = vertex_ids.tolist()
+        else:
+            check_type(vertex_ids, list, "vertex_ids")
+        if cls.max_vertices is not None and any(len(ids) > cls.max_vertices for ids in vertex_ids):
+            raise ValueError(f"Faces of {cls.__name__} have at most {cls.max_vertices} vertices")
+        return [cls.unchecked(ids) for ids in vertex_ids]
+
     @property
     def id(self):
         return self._id
@@ -53,16 +90,36 @@ class Face:
         if self._max_num_vertices is not None:
             assert len(vertex_ids) <= self._max_num_vertices, "Number of vertices in face exceeds max_num_vertices"
         self._vertex_ids = vertex_ids
+        self._modified()
     
-    @property
-    def center(self, all_vertices: list[Vertex | Vertex2D | Vertex3D]):
-        self._center = get_center([all_vertices[i] for i in self._vertex_ids])
+    def _modified(self):
+        """Drop the memoized geometry and report the connectivity change to the owning mesh."""
+        self._center = None
+        self._area = None
+        self._geometry_version = None
+        if self._versions is not None:
+            self._versions.bump()
+
+    def _check_geometry(self, all_vertices: list[Vertex | Vertex2D | Vertex3D]) -> int:
+        """Drop the memoized center and area if the coordinates changed since they were computed."""
+        version = coordinate_version(all_vertices)
+        if self._geometry_version is not None and self._geometry_version != version:
+            self._center = None
+            self._area = None
+        return version
+
+    def center(self, all_vertices: list[Vertex | Vertex2D | Vertex3D]) -> Vertex2D | Vertex3D:
+        """Vertex average of the face, memoized like area; Mesh.face_centroids holds all of them at once."""
+        version = self._check_geometry(all_vertices)
+        if self._center is None:
+            self._center = get_center([all_vertices[i] for i in self._vertex_ids])
+            self._geometry_version = version
         return self._center
     
-    @center.setter
     @not_instance(Vertex2D | Vertex3D)
-    def center(self, center: Vertex2D | Vertex3D):
+    def set_center(self, center: Vertex2D | Vertex3D):
         self._center = center
+        self._geometry_version = None
     
     @not_self_implemented
     def area(self, all_vertices: list[Vertex | Vertex2D | Vertex3D]):
@@ -88,19 +145,16 @@ class Face:
     
     def __setitem__(self, key: int, value: int):
         self._vertex_ids[key] = value
+        self._modified()
 
     def is_convex(self, all_vertices: list[Vertex | Vertex2D | Vertex3D]) -> bool:
         vertices = [all_vertices[i] for i in self._vertex_ids]
 
-        if type(vertices[0]) in [Vertex, Vertex3D]:
+        if not isinstance(vertices[0], Vertex2D):
             raise NotImplementedError("is_convex not implemented for " + str(type(vertices[0])))
 
-        ccws = np.array([
-            is_ccw(vertices[i], vertices[(i + 1) % len(vertices)], vertices[(i + 2) % len(vertices)])
-            for i in range(len(vertices))
-        ])
-
-        print(ccws)
+        coordinates = np.array([v.coordinates for v in vertices], dtype=np.float64)
+        ccws = triplet_orientation(cyclic_triplets(coordinates)) > 0
 
         return np.all(ccws) or not np.any(ccws)
 
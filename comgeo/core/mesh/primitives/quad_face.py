@@ -7,17 +7,24 @@ from .face import Face
 
 
 class QuadFace(Face):
+    __slots__ = ()
+
+    max_vertices = 4
+
     def __init__(self, vertex_ids: list[int], id: int = -1, visited: bool = False):
         super().__init__(vertex_ids, id, visited, 4)
     
     def area(self, all_vertices: list[Vertex | Vertex2D | Vertex3D]):
+        version = self._check_geometry(all_vertices)
         if self._area is None:
             self._area = get_area([all_vertices[i] for i in self._vertex_ids])
+            self._geometry_version = version
         return self._area
     
     @not_instance(float)
     def set_area(self, area: float):
         self._area = area
+        self._geometry_version = None
     
     def point_cloud_sampling(self, num_points: int, all_vertices: list[Vertex | Vertex2D | Vertex3D]) -> list[Vertex | Vertex2D | Vertex3D]:
         return point_cloud_sampling_quad([all_vertices[i] for i in self._vertex_ids], num_points)
@@ -7,17 +7,24 @@ from .face import Face
 
 
 class TriangleFace(Face):
+    __slots__ = ()
+
+    max_vertices = 3
+
     def __init__(self, vertex_ids: list[int], id: int = -1, visited: bool = False):
         super().__init__(vertex_ids, id, visited, 3)
     
     def area(self, all_vertices: list[Vertex | Vertex2D | Vertex3D]):
+        version = self._check_geometry(all_vertices)
         if self._area is None:
             self._area = get_area([all_vertices[i] for i in self._vertex_ids])
+            self._geometry_version = version
         return self._area
     
     @not_instance(float)
     def set_area(self, area: float):
         self._area = area
+        self._geometry_version = None
     
     @not_self_implemented
     def is_convex(self, all_vertices: list[Vertex | Vertex2D | Vertex3D]) -> bool:
@@ -21,8 +21,8 @@ class QuadMesh(BasicMesh):
         )
 
     @staticmethod
-    def from_file_path(file_path: str, dim: int = 2) -> "QuadMesh":
-        vertices, faces = load_mesh(file_path, dim)
+    def from_file_path(file_path: str, dim: int = 2, as_array: bool = False) -> "QuadMesh":
+        vertices, faces = load_mesh(file_path, dim, as_array=as_array)
         return QuadMesh(
             vertices=vertices,
             faces=faces,
@@ -45,8 +45,8 @@ class QuadMesh2D(QuadMesh):
         )
     
     @staticmethod
-    def from_file_path(file_path: str) -> "QuadMesh2D":
-        vertices, faces = load_mesh(file_path, dim=2)
+    def from_file_path(file_path: str, as_array: bool = False) -> "QuadMesh2D":
+        vertices, faces = load_mesh(file_path, dim=2, as_array=as_array)
         return QuadMesh2D(
             vertices=vertices,
             faces=faces
@@ -68,8 +68,8 @@ class QuadMesh3D(QuadMesh):
         )
 
     @staticmethod
-    def from_file_path(file_path: str) -> "QuadMesh3D":
-        vertices, faces = load_mesh(file_path, dim=3)
+    def from_file_path(file_path: str, as_array: bool = False) -> "QuadMesh3D":
+        vertices, faces = load_mesh(file_path, dim=3, as_array=as_array)
         return QuadMesh3D(
             vertices=vertices,
             faces=faces
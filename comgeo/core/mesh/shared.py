@@ -0,0 +1,83 @@
+from ..utils.shared import SharedArray
+from ...functional.mesh.geometry import face_geometry
+
+import numpy as np
+
+
+class SharedMesh:
+    """Vertex coordinates and flat faces of a mesh placed in shared memory.
+
+    A SharedMesh pickles as the names of its three blocks, so it can be passed to every
+    task of a process pool and each worker attaches to the same arrays without copying.
+    Faces use the flat (offsets, indices) form of functional/mesh/topology.py.
+    """
+
+    def __init__(self, coordinates: SharedArray, offsets: SharedArray, indices: SharedArray):
+        self._coordinates = coordinates
+        self._offsets = offsets
+        self._indices = indices
+
+    @classmethod
+    def from_arrays(cls, coordinates: np.ndarray, offsets: np.ndarray, indices: np.ndarray) -> 'SharedMesh':
+        coordinates = np.asarray(coordinates, dtype=np.float64)
+        if coordinates.ndim != 2:
+            raise ValueError(f"coordinates must be an (N, dim) array, got shape {coordinates.shape}")
+        return cls(
+            SharedArray.from_array(coordinates),
+            SharedArray.from_array(np.asarray(offsets, dtype=np.int64)),
+            SharedArray.from_array(np.asarray(indices, dtype=np.int64))
+        )
+
+    @property
+    def coordinates(self) -> np.ndarray:
+        return self._coordinates.array
+
+    @property
+    def offsets(self) -> np.ndarray:
+        return self._offsets.array
+
+    @property
+    def indices(self) -> np.ndarray:
+        return self._indices.array
+
+    @property
+    def dim(self) -> int:
+        return self._coordinates.shape[1]
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self._coordinates)
+
+    @property
+    def num_faces(self) -> int:
+        return len(self._offsets) - 1
+
+    @property
+    def face_array(self) -> np.ndarray:
+        """Faces as an (F, k) zero-copy view; only defined when every face has k vertices."""
+        sizes = np.diff(self.offsets)
+        if len(sizes) == 0 or np.any(sizes != sizes[0]):
+            raise ValueError("face_array requires every face to have the same number of vertices")
+        return self.indices.reshape(len(sizes), sizes[0])
+
+    def face_geometry(self) -> dict[str, np.ndarray | None]:
+        """Per-face areas, centroids, bounds and normals, see functional.mesh.geometry.face_geometry."""
+        return face_geometry(self.coordinates, self.offsets, self.indices)
+
+    def unlink(self):
+        """Release the shared blocks; only the process that created the mesh may call this."""
+        for shared in (self._coordinates, self._offsets, self._indices):
+            shared.unlink()
+
+    def __enter__(self) -> 'SharedMesh':
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._coordinates.is_owner:
+            self.unlink()
+
+    def __reduce__(self):
+        return SharedMesh, (self._coordinates, self._offsets, self._indices)
+
+    def __repr__(self):
+        return f"SharedMesh(num_vertices={self.num_vertices}, num_faces={self.num_faces}, dim={self.dim})"
@@ -23,8 +23,8 @@ class TriangleMesh(BasicMesh):
         )
     
     @staticmethod
-    def from_file_path(file_path: str, dim: int = 2) -> "TriangleMesh":
-        vertices, faces = load_mesh(file_path, dim)
+    def from_file_path(file_path: str, dim: int = 2, as_array: bool = False) -> "TriangleMesh":
+        vertices, faces = load_mesh(file_path, dim, as_array=as_array)
         return TriangleMesh(
             vertices=vertices,
             faces=faces,
@@ -47,8 +47,8 @@ class TriangleMesh2D(TriangleMesh):
         )
     
     @staticmethod
-    def from_file_path(file_path: str) -> "TriangleMesh2D":
-        vertices, faces = load_mesh(file_path, dim=2)
+    def from_file_path(file_path: str, as_array: bool = False) -> "TriangleMesh2D":
+        vertices, faces = load_mesh(file_path, dim=2, as_array=as_array)
         return TriangleMesh2D(
             vertices=vertices,
             faces=faces
@@ -70,8 +70,8 @@ class TriangleMesh3D(TriangleMesh):
         )
     
     @staticmethod
-    def from_file_path(file_path: str) -> "TriangleMesh3D":
-        vertices, faces = load_mesh(file_path, dim=3)
+    def from_file_path(file_path: str, as_array: bool = False) -> "TriangleMesh3D":
+        vertices, faces = load_mesh(file_path, dim=3, as_array=as_array)
         return TriangleMesh3D(
             vertices=vertices,
             faces=faces
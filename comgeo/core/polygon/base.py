@@ -1,5 +1,5 @@
-from ..vertex import Vertex, Vertex2D, Vertex3D
-from ...functional.vertex.triplets.check import is_ccw
+from ..vertex import Vertex, Vertex2D, Vertex3D, VertexArray, coordinate_version
+from ...functional.vertex.triplets.compute import triplet_orientation, cyclic_triplets
 from ...functional.polygon.center import get_center
 
 from ...decorator.error import not_instance, not_self_implemented, not_self_instance
@@ -8,17 +8,40 @@ from ..utils.error import check_type, check_consistency
 import numpy as np
 
 class Polygon:
-    def __init__(self, vertices: list[Vertex | Vertex2D | Vertex3D], id: int = -1, visited: bool = False):
-        check_type(vertices, list, "vertices")
-        check_consistency(vertices, "vertices")
+    __slots__ = ("_vertices", "_id", "_visited", "_center", "_area", "_geometry_version")
+
+    def __init__(self, vertices: list[Vertex | Vertex2D | Vertex3D] | VertexArray, id: int = -1, visited: bool = False):
+        check_type(vertices, (list, VertexArray), "vertices")
+        if isinstance(vertices, list):
+            check_consistency(vertices, "vertices")
         check_type(id, int, "id")
         check_type(visited, bool, "visited")
         
         self._vertices = vertices
         self._id = id
         self._visited = visited
-        self._center: Vertex2D | Vertex3D = get_center(vertices)
+        self._center: Vertex2D | Vertex3D | None = None
         self._area: float | None = None
+        # Coordinate version the center and area were computed from
+        self._geometry_version: int | None = None
+        self._update_geometry()
+
+    def _compute_area(self) -> float | None:
+        return None
+
+    def _coordinate_array(self) -> np.ndarray:
+        """Vertex coordinates as a (k, dim) array; zero-copy for a VertexArray."""
+        if isinstance(self._vertices, VertexArray):
+            return self._vertices.coordinates
+        return np.array([v.coordinates for v in self._vertices], dtype=np.float64)
+
+    def _update_geometry(self):
+        """Recompute the center and area if the vertex coordinates changed since the last time."""
+        version = coordinate_version(self._vertices)
+        if version != self._geometry_version:
+            self._center = get_center(self._vertices)
+            self._area = self._compute_area()
+            self._geometry_version = version
     
     @property
     def id(self):
@@ -43,13 +66,17 @@ class Polygon:
         return self._vertices
     
     @vertices.setter
-    @not_instance(list)
-    def vertices(self, vertices: list[Vertex | Vertex2D | Vertex3D]):
-        check_consistency(vertices, "vertices")
+    @not_instance((list, VertexArray))
+    def vertices(self, vertices: list[Vertex | Vertex2D | Vertex3D] | VertexArray):
+        if isinstance(vertices, list):
+            check_consistency(vertices, "vertices")
         self._vertices = vertices
+        self._geometry_version = None
+        self._update_geometry()
     
     @property
     def center(self):
+        self._update_geometry()
         return self._center
     
     @center.setter
@@ -59,6 +86,7 @@ class Polygon:
     
     @property
     def area(self):
+        self._update_geometry()
         return self._area
     
     @not_self_instance
@@ -72,13 +100,11 @@ class Polygon:
         return f"Polygon(id={self._id}, visited={self._visited}, \nvertices={self._vertices})"
     
     def is_convex(self) -> bool:
-        if type(self._vertices[0]) in [Vertex, Vertex3D]:
+        if not isinstance(self._vertices[0], Vertex2D):
             raise NotImplementedError("is_convex not implemented for " + str(type(self._vertices[0])))
 
-        ccws = np.array([
-            is_ccw(self._vertices[i], self._vertices[(i + 1) % len(self._vertices)], self._vertices[(i + 2) % len(self._vertices)])
-            for i in range(len(self._vertices))
-        ])
+        coordinates = np.array([v.coordinates for v in self._vertices], dtype=np.float64)
+        ccws = triplet_orientation(cyclic_triplets(coordinates)) > 0
 
         return np.all(ccws) or not np.any(ccws)
 
@@ -1,25 +1,35 @@
 from .base import Polygon
-from ..vertex import Vertex, Vertex2D, Vertex3D
+from ..vertex import Vertex, Vertex2D, Vertex3D, VertexArray
 from ...decorator.error import not_instance, not_self_implemented
 from ...functional.polygon.area import get_area
-from ...functional.polygon.point_cloud import point_cloud_sampling_triangle
+from ...functional.polygon.point_cloud import point_cloud_sampling_triangle, poisson_disk_sampling
+from ...functional.mesh.sampling import iter_sample_faces
+
+from typing import Iterator
+import numpy as np
+
+# The polygon as the single face of a mesh over its own vertices
+_FACE = np.array([[0, 1, 2]], dtype=np.int64)
 
 
 class Triangle(Polygon):
-    def __init__(self, vertices: list[Vertex | Vertex2D | Vertex3D], id: int = -1, visited: bool = False):
+    __slots__ = ()
+
+    def __init__(self, vertices: list[Vertex | Vertex2D | Vertex3D] | VertexArray, id: int = -1, visited: bool = False):
         self.check_vertices_len(vertices)
         super().__init__(vertices, id, visited)
 
-        self._area = get_area(vertices)
+    def _compute_area(self) -> float:
+        return get_area(self._vertices)
     
     @staticmethod
-    def check_vertices_len(vertices: list[Vertex | Vertex2D | Vertex3D]):
+    def check_vertices_len(vertices: list[Vertex | Vertex2D | Vertex3D] | VertexArray):
         if len(vertices) != 3:
             raise ValueError("Triangle must have 3 vertices")
     
     @Polygon.vertices.setter
-    @not_instance(list)
-    def vertices(self, vertices: list[Vertex | Vertex2D | Vertex3D]):
+    @not_instance((list, VertexArray))
+    def vertices(self, vertices: list[Vertex | Vertex2D | Vertex3D] | VertexArray):
         self.check_vertices_len(vertices)
         super(Triangle, type(self)).vertices.fset(self, vertices)
     
@@ -33,9 +43,25 @@ class Triangle(Polygon):
     def is_convex(self) -> bool:
         pass
 
-    def point_cloud_sampling(self, num_points: int) -> list[Vertex | Vertex2D | Vertex3D]:
-        if type(self._vertices[0]) not in [Vertex2D, Vertex3D]:
+    def point_cloud_sampling(self, num_points: int, method: str = "random", rng: np.random.Generator | int | None = None) -> list[Vertex | Vertex2D | Vertex3D]:
+        """Area-uniform samples from independent uniforms or the "halton" / "sobol" sequences."""
+        if not isinstance(self._vertices[0], (Vertex2D, Vertex3D)):
             raise NotImplementedError("point_cloud_sampling not implemented for " + str(type(self._vertices[0])))
         
-        points: list[Vertex2D | Vertex3D] = point_cloud_sampling_triangle(self._vertices, num_points)
-        return points
\ No newline at end of file
+        points: list[Vertex2D | Vertex3D] = point_cloud_sampling_triangle(self._vertices, num_points, method, rng)
+        return points
+
+    def point_cloud_sampling_chunks(self, num_points: int, chunk_size: int, rng: np.random.Generator | int | None = None) -> Iterator[np.ndarray]:
+        """Yield uniform samples as (chunk_size, dim) arrays, see functional.mesh.sampling.iter_sample_faces."""
+        if not isinstance(self._vertices[0], (Vertex2D, Vertex3D)):
+            raise NotImplementedError("point_cloud_sampling not implemented for " + str(type(self._vertices[0])))
+
+        return iter_sample_faces(self._coordinate_array(), _FACE, num_points, chunk_size, rng=rng)
+
+    def poisson_disk_sampling(self, radius: float, rng: np.random.Generator | int | None = None, max_rejections: int = 1000) -> list[Vertex2D | Vertex3D]:
+        """Blue-noise samples at least ``radius`` apart, see functional.polygon.point_cloud.poisson_disk_sampling."""
+        if not isinstance(self._vertices[0], (Vertex2D, Vertex3D)):
+            raise NotImplementedError("poisson_disk_sampling not implemented for " + str(type(self._vertices[0])))
+
+        points = poisson_disk_sampling(self._coordinate_array(), radius, rng=rng, max_rejections=max_rejections)
+        return Vertex2D.from_array(points) if points.shape[1] == 2 else Vertex3D.from_array(points)
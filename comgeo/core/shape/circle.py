@@ -1,9 +1,21 @@
 from .ellipse import Ellipse
 from ..vertex import Vertex2D
+from ..utils.error import check_type
+from ...functional.vertex.predicates import _orient2d, _incircle
+
+from fractions import Fraction
+
+_EPSILON = 2.0 ** -53
+
 
 class Circle(Ellipse):
-    def __init__(self, center: Vertex2D, radius: float):
+    def __init__(self, center: Vertex2D, radius: float, through: tuple[Vertex2D, Vertex2D, Vertex2D] | None = None):
         super().__init__(center, radius, radius)
+        if through is not None:
+            check_type(through, tuple, "through")
+            if len(through) != 3:
+                raise ValueError("through must hold exactly three vertices")
+        self._through = through
 
     @property
     def center(self) -> Vertex2D:
@@ -13,11 +25,38 @@ class Circle(Ellipse):
     def radius(self) -> float:
         return self._rx
 
+    @property
+    def through(self) -> tuple[Vertex2D, Vertex2D, Vertex2D] | None:
+        return self._through
+
     def area(self) -> float:
         return super().area()
 
     def perimeter(self) -> float:
         return super().perimeter()
 
+    def contains(self, point: Vertex2D) -> bool:
+        """Check if a point is inside or on the circle, with an exact answer near the boundary.
+
+        Circles built from three points (see circumcircle_vertices) use the robust
+        incircle predicate on those points, so the rounded center and radius play no part.
+        """
+        if self._through is not None:
+            a, b, c = self._through
+            det = _incircle(a.x, a.y, b.x, b.y, c.x, c.y, point.x, point.y)
+            if _orient2d(a.x, a.y, b.x, b.y, c.x, c.y) < 0.0:
+                det = -det
+            return det >= 0.0
+
+        dx = point.x - self._center.x
+        dy = point.y - self._center.y
+        distance = dx * dx + dy * dy
+        squared_radius = self._rx * self._rx
+        if abs(distance - squared_radius) > 8.0 * _EPSILON * (distance + squared_radius):
+            return distance < squared_radius
+        dx = Fraction(point.x) - Fraction(self._center.x)
+        dy = Fraction(point.y) - Fraction(self._center.y)
+        return dx * dx + dy * dy <= Fraction(self._rx) ** 2
+
     def __repr__(self):
-        return f"Circle(center={self.center}, radius={self.radius})"
\ No newline at end of file
+        return f"Circle(center={self.center}, radius={self.radius})"
@@ -0,0 +1,55 @@
+import numpy as np
+
+
+class GrowableArray:
+    """Append-only NumPy buffer that doubles its capacity when full.
+
+    Appending k rows is amortised O(k); ``data`` is a zero-copy view of the filled rows
+    that is only valid until the next append.
+    """
+
+    def __init__(self, dtype: type = np.float64, row_shape: tuple[int, ...] = (), capacity: int = 16):
+        self._buffer = np.empty((max(capacity, 1),) + tuple(row_shape), dtype=dtype)
+        self._size = 0
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> 'GrowableArray':
+        array = np.asarray(array)
+        buffer = cls(array.dtype, array.shape[1:], len(array))
+        buffer.extend(array)
+        return buffer
+
+    @property
+    def data(self) -> np.ndarray:
+        return self._buffer[:self._size]
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buffer)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def reserve(self, capacity: int):
+        """Make room for at least ``capacity`` rows."""
+        if capacity > len(self._buffer):
+            buffer = np.empty((max(capacity, 2 * len(self._buffer)),) + self._buffer.shape[1:], dtype=self._buffer.dtype)
+            buffer[:self._size] = self._buffer[:self._size]
+            self._buffer = buffer
+
+    def append(self, row):
+        self.reserve(self._size + 1)
+        self._buffer[self._size] = row
+        self._size += 1
+
+    def extend(self, rows: np.ndarray):
+        rows = np.asarray(rows, dtype=self._buffer.dtype).reshape((-1,) + self._buffer.shape[1:])
+        self.reserve(self._size + len(rows))
+        self._buffer[self._size:self._size + len(rows)] = rows
+        self._size += len(rows)
+
+    def clear(self):
+        self._size = 0
+
+    def __repr__(self):
+        return f"GrowableArray(size={self._size}, capacity={self.capacity}, dtype={self._buffer.dtype})"
@@ -1,9 +1,43 @@
 from typing import Any
 
+import contextlib
+import contextvars
+
+# Switch that turns the validation helpers below into no-ops. It is a context variable,
+# so a trusted block in one thread or task never turns off validation in another; new
+# threads start with validation on.
+_trusted: contextvars.ContextVar[bool] = contextvars.ContextVar("trusted", default=False)
+
+def is_trusted() -> bool:
+    return _trusted.get()
+
+def set_trusted(value: bool):
+    """Enable or disable trusted mode for the current thread or task."""
+    if not isinstance(value, bool):
+        raise TypeError(f"Expected {bool} for value, got {type(value)}")
+    _trusted.set(value)
+
+@contextlib.contextmanager
+def trusted(value: bool = True):
+    """Context manager that skips type and consistency validation inside its block."""
+    if not isinstance(value, bool):
+        raise TypeError(f"Expected {bool} for value, got {type(value)}")
+    token = _trusted.set(value)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
 def check_type(var: Any, expected_type: type, var_name: str):
+    if _trusted.get():
+        return
     if not isinstance(var, expected_type):
         raise TypeError(f"Expected {expected_type} for {var_name}, got {type(var)}")
 
 def check_consistency(args: list[Any], var_name: str):
-    if not all(isinstance(arg, type(args[0])) for arg in args):
-        raise TypeError(f"All arguments must be of the same type for {var_name}")
\ No newline at end of file
+    if _trusted.get() or len(args) == 0:
+        return
+    # Stand-in types such as VertexArray views name the type they are checked as
+    expected = getattr(type(args[0]), "consistency_type", type(args[0]))
+    if not all(isinstance(arg, expected) for arg in args):
+        raise TypeError(f"All arguments must be of the same type for {var_name}")
@@ -0,0 +1,174 @@
+from ...constant import WORKER_FRACTION, NUM_WORKERS_ENV
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+import contextlib
+import os
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on, honouring affinity masks where the platform has them."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def default_num_workers() -> int:
+    """Worker count from the COMGEO_NUM_WORKERS variable, else 80% of the available CPUs."""
+    value = os.environ.get(NUM_WORKERS_ENV)
+    if value is not None:
+        num_workers = int(value)
+        if num_workers < 1:
+            raise ValueError(f"{NUM_WORKERS_ENV} must be a positive integer, got {value}")
+        return num_workers
+    return max(1, round(available_cpus() * WORKER_FRACTION))
+
+
+def chunk_ranges(total: int, chunk_size: int) -> list[tuple[int, int]]:
+    """Split range(total) into consecutive (start, stop) pairs of at most chunk_size items."""
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    return [(start, min(start + chunk_size, total)) for start in range(0, total, chunk_size)]
+
+
+class Backend:
+    """Runs a function over independent pieces of work.
+
+    ``map`` returns the results in input order. ``chunk_size`` is the number of items
+    per piece that chunked algorithms use when the caller does not choose one; None
+    lets them process everything at once.
+    """
+
+    name = "base"
+    # Whether task arguments are pickled to other processes, so that large arrays are
+    # better passed as shared-memory handles
+    copies_arguments = False
+
+    def __init__(self, num_workers: int | None = None, chunk_size: int | None = None):
+        if num_workers is not None and (not isinstance(num_workers, int) or num_workers < 1):
+            raise ValueError(f"num_workers must be a positive int, got {num_workers}")
+        if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size < 1):
+            raise ValueError(f"chunk_size must be a positive int, got {chunk_size}")
+        self._num_workers = num_workers
+        self._chunk_size = chunk_size
+
+    @property
+    def num_workers(self) -> int:
+        return 1
+
+    @property
+    def chunk_size(self) -> int | None:
+        return self._chunk_size
+
+    def map(self, func: Callable, *iterables: Iterable) -> list[Any]:
+        raise NotImplementedError
+
+    def shutdown(self):
+        pass
+
+    def __enter__(self) -> 'Backend':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def __repr__(self):
+        return f"{type(self).__name__}(num_workers={self.num_workers}, chunk_size={self._chunk_size})"
+
+
+class SerialBackend(Backend):
+    """Runs everything in the calling thread."""
+
+    name = "serial"
+
+    def map(self, func: Callable, *iterables: Iterable) -> list[Any]:
+        return list(map(func, *iterables))
+
+
+class _PoolBackend(Backend):
+    """Backend keeping one long-lived executor, started on the first map and reused after."""
+
+    executor_type: type[Executor] = Executor
+
+    def __init__(self, num_workers: int | None = None, chunk_size: int | None = None):
+        super().__init__(num_workers, chunk_size)
+        self._executor: Executor | None = None
+
+    @property
+    def num_workers(self) -> int:
+        return self._num_workers if self._num_workers is not None else default_num_workers()
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = self.executor_type(max_workers=self.num_workers)
+        return self._executor
+
+    def map(self, func: Callable, *iterables: Iterable) -> list[Any]:
+        return list(self.executor.map(func, *iterables))
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+class ThreadBackend(_PoolBackend):
+    """Thread pool, for NumPy-heavy work that releases the GIL."""
+
+    name = "thread"
+    executor_type = ThreadPoolExecutor
+
+
+class ProcessBackend(_PoolBackend):
+    """Process pool; functions and arguments must be picklable."""
+
+    name = "process"
+    copies_arguments = True
+    executor_type = ProcessPoolExecutor
+
+
+_BACKEND_TYPES: dict[str, type[Backend]] = {
+    backend_type.name: backend_type for backend_type in (SerialBackend, ThreadBackend, ProcessBackend)
+}
+
+# Process-wide backend used by every parallel code path of the package
+_backend: Backend = SerialBackend()
+
+
+def make_backend(kind: str | Backend, num_workers: int | None = None, chunk_size: int | None = None) -> Backend:
+    """Create a backend from its name ("serial", "thread" or "process"); backends pass through."""
+    if isinstance(kind, Backend):
+        return kind
+    if kind not in _BACKEND_TYPES:
+        raise ValueError(f"Unknown backend {kind!r}, expected one of {sorted(_BACKEND_TYPES)}")
+    return _BACKEND_TYPES[kind](num_workers, chunk_size)
+
+
+def get_backend() -> Backend:
+    return _backend
+
+
+def set_backend(kind: str | Backend, num_workers: int | None = None, chunk_size: int | None = None) -> Backend:
+    """Replace the process-wide backend, shutting down the executor of the previous one."""
+    global _backend
+    new_backend = make_backend(kind, num_workers, chunk_size)
+    if new_backend is not _backend:
+        _backend.shutdown()
+        _backend = new_backend
+    return _backend
+
+
+@contextlib.contextmanager
+def backend(kind: str | Backend, num_workers: int | None = None, chunk_size: int | None = None):
+    """Context manager that uses another backend inside its block and shuts it down afterwards."""
+    global _backend
+    previous = _backend
+    _backend = make_backend(kind, num_workers, chunk_size)
+    try:
+        yield _backend
+    finally:
+        if _backend is not previous:
+            _backend.shutdown()
+        _backend = previous
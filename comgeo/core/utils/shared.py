@@ -0,0 +1,122 @@
+from collections import OrderedDict
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+
+class _Block(SharedMemory):
+    """SharedMemory whose close leaves the mapping alive while arrays still view it.
+
+    The mapping is then released together with the last array instead of raising
+    BufferError.
+    """
+
+    def close(self):
+        try:
+            super().close()
+        except BufferError:
+            self._buf = None
+            self._mmap = None
+            super().close()
+
+
+# Blocks created by this process, and a bounded cache of blocks attached by name so that
+# the tasks a long-lived worker receives attach every block once rather than once per task
+_owned: dict[str, _Block] = {}
+_attached: OrderedDict[str, _Block] = OrderedDict()
+_MAX_ATTACHED = 8
+
+
+def _attach(name: str) -> _Block:
+    if name in _owned:
+        return _owned[name]
+    if name in _attached:
+        _attached.move_to_end(name)
+        return _attached[name]
+    # Pool workers share the resource tracker of the process that created the block, so
+    # the registration made by attaching is a no-op and unlinking stays with the creator
+    block = _Block(name=name)
+    _attached[name] = block
+    while len(_attached) > _MAX_ATTACHED:
+        _attached.popitem(last=False)[1].close()
+    return block
+
+
+class SharedArray:
+    """NumPy array stored in a named ``multiprocessing.shared_memory`` block.
+
+    Pickling sends only the block name, shape and dtype, and unpickling attaches to the
+    block without copying, so passing a SharedArray to process-pool tasks costs O(1)
+    regardless of its size. The process that created the array owns the block and must
+    ``unlink`` it once the workers are done; using it as a context manager does so.
+    """
+
+    __slots__ = ("_block", "_array", "_owner")
+
+    def __init__(self, name: str, shape: tuple[int, ...], dtype: str | np.dtype):
+        self._block = _attach(name)
+        # frombuffer keeps the block's buffer exported, so the mapping lives as long as any view
+        count = int(np.prod(shape, dtype=np.int64))
+        self._array = np.frombuffer(self._block.buf, dtype=dtype, count=count).reshape(shape)
+        self._owner = False
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> 'SharedArray':
+        """Copy ``array`` into a new shared block owned by this process."""
+        array = np.ascontiguousarray(array)
+        block = _Block(create=True, size=max(array.nbytes, 1))
+        _owned[block.name] = block
+        shared = cls(block.name, array.shape, array.dtype)
+        shared._array[...] = array
+        shared._owner = True
+        return shared
+
+    @property
+    def name(self) -> str:
+        return self._block.name
+
+    @property
+    def array(self) -> np.ndarray:
+        return self._array
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._array.shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._array.dtype
+
+    @property
+    def is_owner(self) -> bool:
+        return self._owner
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if copy:
+            return np.array(self._array, dtype=dtype)
+        return self._array if dtype is None else self._array.astype(dtype, copy=False)
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __reduce__(self):
+        return SharedArray, (self.name, self._array.shape, self._array.dtype.str)
+
+    def unlink(self):
+        """Destroy the block name; mappings that already exist stay valid until closed."""
+        if not self._owner:
+            raise ValueError(f"Only the process that created shared array {self.name} can unlink it")
+        _owned.pop(self.name, None)
+        self._block.unlink()
+        self._block.close()
+        self._owner = False
+
+    def __enter__(self) -> 'SharedArray':
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._owner:
+            self.unlink()
+
+    def __repr__(self):
+        return f"SharedArray(name={self.name!r}, shape={self.shape}, dtype={self.dtype})"
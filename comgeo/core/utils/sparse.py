@@ -0,0 +1,153 @@
+from .error import check_type
+
+import numpy as np
+
+
+class CSRMatrix:
+    """Minimal compressed sparse row matrix backed by NumPy arrays.
+
+    ``data`` may be omitted, in which case every stored entry is an implicit 1.0;
+    this is the common case for adjacency and incidence matrices and saves one
+    array of nnz floats.
+    """
+
+    def __init__(self,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        shape: tuple[int, int],
+        data: np.ndarray | None = None
+    ):
+        check_type(shape, tuple, "shape")
+        indptr = np.asarray(indptr, dtype=np.int64)
+        indices = np.asarray(indices, dtype=np.int64)
+        if len(shape) != 2:
+            raise ValueError(f"shape must have two entries, got {shape}")
+        if indptr.shape != (shape[0] + 1,):
+            raise ValueError(f"indptr must have shape ({shape[0] + 1},), got {indptr.shape}")
+        if indices.shape != (indptr[-1],):
+            raise ValueError(f"indices must have shape ({indptr[-1]},), got {indices.shape}")
+        if data is not None:
+            data = np.asarray(data)
+            if data.shape != indices.shape:
+                raise ValueError(f"data must have shape {indices.shape}, got {data.shape}")
+
+        self._indptr = indptr
+        self._indices = indices
+        self._data = data
+        self._shape = (int(shape[0]), int(shape[1]))
+
+    @classmethod
+    def from_coo(cls,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        shape: tuple[int, int],
+        data: np.ndarray | None = None
+    ) -> 'CSRMatrix':
+        """Build a matrix from coordinate lists; duplicate entries are summed (or merged if data is None)."""
+        rows = np.asarray(rows, dtype=np.int64).ravel()
+        cols = np.asarray(cols, dtype=np.int64).ravel()
+        if rows.shape != cols.shape:
+            raise ValueError("rows and cols must have the same length")
+
+        keys = rows * shape[1] + cols
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        unique = np.ones(len(keys), dtype=bool)
+        unique[1:] = keys[1:] != keys[:-1]
+
+        if data is not None:
+            data = np.asarray(data).ravel()[order]
+            data = np.add.reduceat(data, np.flatnonzero(unique)) if len(data) > 0 else data
+
+        keys = keys[unique]
+        counts = np.bincount(keys // shape[1], minlength=shape[0]) if len(keys) > 0 else np.zeros(shape[0], dtype=np.int64)
+        indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return cls(indptr, keys % shape[1], shape, data)
+
+    @classmethod
+    def from_dense(cls, array: np.ndarray) -> 'CSRMatrix':
+        """Build a matrix from the non-zero entries of a dense 2D array."""
+        check_type(array, np.ndarray, "array")
+        if array.ndim != 2:
+            raise ValueError(f"array must be 2D, got {array.ndim}D")
+        rows, cols = np.nonzero(array)
+        return cls.from_coo(rows, cols, array.shape, array[rows, cols])
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self._shape
+
+    @property
+    def nnz(self) -> int:
+        return len(self._indices)
+
+    @property
+    def indptr(self) -> np.ndarray:
+        return self._indptr
+
+    @property
+    def indices(self) -> np.ndarray:
+        return self._indices
+
+    @property
+    def data(self) -> np.ndarray:
+        if self._data is None:
+            return np.ones(self.nnz, dtype=np.float64)
+        return self._data
+
+    def row(self, i: int) -> np.ndarray:
+        """Return the column indices stored in row i as a zero-copy slice."""
+        return self._indices[self._indptr[i]:self._indptr[i + 1]]
+
+    def row_data(self, i: int) -> np.ndarray:
+        """Return the values stored in row i."""
+        if self._data is None:
+            return np.ones(self._indptr[i + 1] - self._indptr[i], dtype=np.float64)
+        return self._data[self._indptr[i]:self._indptr[i + 1]]
+
+    def degree(self) -> np.ndarray:
+        """Return the number of stored entries per row."""
+        return np.diff(self._indptr)
+
+    def dot(self, other: np.ndarray) -> np.ndarray:
+        """Multiply with a dense (ncols,) or (ncols, k) array."""
+        other = np.asarray(other)
+        if other.shape[0] != self._shape[1]:
+            raise ValueError(f"other must have {self._shape[1]} rows, got {other.shape[0]}")
+        products = other[self._indices]
+        if self._data is not None:
+            products = products * self._data.reshape((-1,) + (1,) * (other.ndim - 1))
+        result = np.zeros((self._shape[0],) + other.shape[1:], dtype=np.result_type(products, np.float64))
+        non_empty = np.flatnonzero(self.degree() > 0)
+        if len(non_empty) > 0:
+            result[non_empty] = np.add.reduceat(products, self._indptr[non_empty], axis=0)
+        return result
+
+    def to_coo(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the (rows, cols, data) coordinate lists."""
+        rows = np.repeat(np.arange(self._shape[0], dtype=np.int64), self.degree())
+        return rows, self._indices.copy(), self.data.copy()
+
+    def toarray(self) -> np.ndarray:
+        """Expand into a dense array; only intended for small matrices."""
+        dense = np.zeros(self._shape, dtype=self.data.dtype)
+        rows, cols, data = self.to_coo()
+        dense[rows, cols] = data
+        return dense
+
+    def __getitem__(self, key: tuple[int, int]):
+        check_type(key, tuple, "key")
+        i, j = key
+        if i < 0:
+            i += self._shape[0]
+        if j < 0:
+            j += self._shape[1]
+        row = self.row(i)
+        k = np.searchsorted(row, j)
+        if k < len(row) and row[k] == j:
+            return 1.0 if self._data is None else self._data[self._indptr[i] + k]
+        return 0.0
+
+    def __repr__(self):
+        return f"CSRMatrix(shape={self._shape}, nnz={self.nnz})"
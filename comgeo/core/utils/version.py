@@ -0,0 +1,34 @@
+class VersionCounter:
+    """Monotonic mutation counter; caches remember the value they were built from.
+
+    bump() records a change seen by every cache compared against ``value``, while
+    stamp() hands out a fresh number and leaves ``value`` alone, for containers that
+    keep a version of their own. Both draw from one sequence, so every number handed
+    out is unique per counter and no stamp ever equals a value.
+    """
+
+    __slots__ = ("_value", "_last")
+
+    def __init__(self):
+        self._value = 0
+        self._last = 0
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def bump(self) -> int:
+        self._last += 1
+        self._value = self._last
+        return self._value
+
+    def stamp(self) -> int:
+        self._last += 1
+        return self._last
+
+    def __repr__(self):
+        return f"VersionCounter(value={self._value})"
+
+
+# Bumped by every change of the coordinates of a vertex object; VertexArrays take stamps
+coordinate_versions = VersionCounter()
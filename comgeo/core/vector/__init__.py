@@ -1,3 +1,4 @@
 from .base import Vector
 from .vector2d import Vector2D
 from .vector3d import Vector3D
+from .array import VectorArray, VectorArray2D, VectorArray3D
@@ -0,0 +1,161 @@
+from .base import Vector
+from .vector2d import Vector2D
+from .vector3d import Vector3D
+from ..vertex import VertexArray, VertexArray2D, VertexArray3D
+from ..utils.error import check_type, check_consistency
+
+import numpy as np
+
+
+class VectorArray:
+    """Batch of vectors stored as one contiguous (N, dim) float64 array.
+
+    Operations mirror Vector2D/Vector3D but apply to every row at once.
+    """
+
+    dim: int = 0
+    vector_type: type[Vector] = Vector
+    vertex_array_type: type[VertexArray] = VertexArray
+
+    def __init__(self, components: np.ndarray):
+        components = np.ascontiguousarray(components, dtype=np.float64)
+        if components.ndim != 2 or components.shape[1] != self.dim:
+            raise ValueError(f"components must have shape (N, {self.dim}), got {components.shape}")
+        self._components = components
+
+    @classmethod
+    def from_vertices(cls, v1: VertexArray | np.ndarray, v2: VertexArray | np.ndarray) -> 'VectorArray':
+        """Create the vectors pointing from each vertex of v1 to the paired vertex of v2."""
+        return cls(cls._coordinates_of(v2, "v2") - cls._coordinates_of(v1, "v1"))
+
+    @classmethod
+    def from_vertex(cls, v: VertexArray | np.ndarray) -> 'VectorArray':
+        """Create position vectors from a VertexArray."""
+        return cls(cls._coordinates_of(v, "v").copy())
+
+    @classmethod
+    def from_vectors(cls, vectors: list[Vector2D | Vector3D]) -> 'VectorArray':
+        """Create a VectorArray from a list of vector objects."""
+        check_type(vectors, list, "vectors")
+        check_consistency(vectors, "vectors")
+        if len(vectors) > 0:
+            check_type(vectors[0], cls.vector_type, "vectors")
+        return cls(np.array([v.coordinates for v in vectors], dtype=np.float64).reshape(-1, cls.dim))
+
+    @classmethod
+    def _coordinates_of(cls, vertices: VertexArray | np.ndarray, var_name: str) -> np.ndarray:
+        check_type(vertices, (cls.vertex_array_type, np.ndarray), var_name)
+        if isinstance(vertices, VertexArray):
+            return vertices.coordinates
+        if vertices.ndim != 2 or vertices.shape[1] != cls.dim:
+            raise ValueError(f"{var_name} must have shape (N, {cls.dim}), got {vertices.shape}")
+        return vertices
+
+    @property
+    def components(self) -> np.ndarray:
+        return self._components
+
+    def to_vectors(self) -> list[Vector2D | Vector3D]:
+        """Materialize the array as a list of vector objects."""
+        return [self.vector_type(*row) for row in self._components.tolist()]
+
+    def __len__(self) -> int:
+        return len(self._components)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return self.vector_type(*self._components[key].tolist())
+        return type(self)(self._components[key])
+
+    def __repr__(self):
+        return f"{type(self).__name__}(num_vectors={len(self)})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, VectorArray):
+            return NotImplemented
+        return type(self) == type(other) and np.array_equal(self._components, other._components)
+
+    def _check_other(self, other: 'VectorArray'):
+        check_type(other, type(self), "other")
+
+    def __add__(self, other: 'VectorArray') -> 'VectorArray':
+        """Add two vector arrays row by row."""
+        self._check_other(other)
+        return type(self)(self._components + other._components)
+
+    def __sub__(self, other: 'VectorArray') -> 'VectorArray':
+        """Subtract two vector arrays row by row."""
+        self._check_other(other)
+        return type(self)(self._components - other._components)
+
+    def __neg__(self) -> 'VectorArray':
+        return type(self)(-self._components)
+
+    def __mul__(self, other):
+        """Scale by a scalar or per-row array, or take row-wise dot products with another VectorArray."""
+        if isinstance(other, VectorArray):
+            return self.dot(other)
+        if isinstance(other, np.ndarray):
+            return type(self)(self._components * other.reshape(-1, 1))
+        if not isinstance(other, (float, int)) or isinstance(other, bool):
+            raise TypeError("Other must be a float, ndarray or VectorArray instance")
+        return type(self)(self._components * other)
+
+    def __truediv__(self, other):
+        """Divide by a scalar or per-row array."""
+        if isinstance(other, np.ndarray):
+            other = other.reshape(-1, 1)
+            if np.any(other == 0.0):
+                raise ValueError("Cannot divide by zero")
+            return type(self)(self._components / other)
+        if not isinstance(other, (float, int)) or isinstance(other, bool):
+            raise TypeError("Other must be a float or ndarray instance")
+        if other == 0.0:
+            raise ValueError("Cannot divide by zero")
+        return type(self)(self._components / other)
+
+    def dot(self, other: 'VectorArray') -> np.ndarray:
+        """Compute the row-wise dot products."""
+        self._check_other(other)
+        return np.einsum("ij,ij->i", self._components, other._components)
+
+    def norm(self, p: int | float = 2) -> np.ndarray:
+        """Compute the row-wise p-norms, matching Vector.norm(p)."""
+        check_type(p, (int, float), "p")
+        if p <= 0:
+            raise ValueError("p must be a positive number")
+        if p == 2:
+            return np.sqrt(np.einsum("ij,ij->i", self._components, self._components))
+        if p == 1:
+            return np.abs(self._components).sum(axis=1)
+        return (np.abs(self._components) ** p).sum(axis=1) ** (1 / p)
+
+    def normalize(self, p: int | float = 2) -> 'VectorArray':
+        """Scale every row to unit p-norm; zero-length rows are left as zero."""
+        norms = self.norm(p)
+        safe = np.where(norms > 0.0, norms, 1.0)
+        return type(self)(self._components / safe[:, None])
+
+
+class VectorArray2D(VectorArray):
+    dim = 2
+    vector_type = Vector2D
+    vertex_array_type = VertexArray2D
+
+    def cross(self, other: 'VectorArray2D') -> np.ndarray:
+        """Compute the row-wise scalar cross products."""
+        self._check_other(other)
+        a = self._components
+        b = other._components
+        return a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+
+
+class VectorArray3D(VectorArray):
+    dim = 3
+    vector_type = Vector3D
+    vertex_array_type = VertexArray3D
+
+    def cross(self, other: 'VectorArray3D') -> 'VectorArray3D':
+        """Compute the row-wise cross products."""
+        self._check_other(other)
+        return VectorArray3D(np.cross(self._components, other._components))
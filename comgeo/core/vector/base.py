@@ -2,6 +2,8 @@ from ...decorator.error import not_self_implemented, not_self_instance, not_inst
 from ..utils.error import check_type
 
 class Vector:
+    __slots__ = ("_id", "_visited")
+
     def __init__(self, id: int = -1, visited: bool = False):
         check_type(id, int, "id")
         check_type(visited, bool, "visited")
@@ -34,6 +36,10 @@ class Vector:
         """Check equality based on the id of the vector."""
         return self._id == other._id
 
+    def __hash__(self):
+        """Hash based on the id of the vector, consistent with __eq__."""
+        return hash(self._id)
+
     @not_self_implemented
     def __lt__(self, other: 'Vector'):
         """Less than comparison based on the id of the vector."""
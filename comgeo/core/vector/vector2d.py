@@ -7,12 +7,24 @@ from ..utils.error import check_type
 import math
 
 class Vector2D(Vector):
+    __slots__ = ("_x", "_y")
+
     def __init__(self, x: float, y: float, id: int = -1, visited: bool = False):
         super().__init__(id, visited)
         check_type(x, float, "x")
         check_type(y, float, "y")
         self._x = x
         self._y = y
+
+    @classmethod
+    def unchecked(cls, x: float, y: float, id: int = -1, visited: bool = False) -> 'Vector2D':
+        """Create a vector without validating the arguments, for trusted bulk construction."""
+        vector = cls.__new__(cls)
+        vector._id = id
+        vector._visited = visited
+        vector._x = x
+        vector._y = y
+        return vector
     
     @property
     def coordinates(self):
@@ -63,6 +75,10 @@ class Vector2D(Vector):
         """Check equality based on the coordinates of the vector."""
         return self._x == other._x and self._y == other._y
 
+    def __hash__(self) -> int:
+        """Hash the coordinates of the vector, consistent with __eq__."""
+        return hash((self._x, self._y))
+
     @not_self_instance
     def __lt__(self, other: 'Vector2D') -> bool:
         """Check if this vector is less than another vector."""
@@ -98,8 +114,8 @@ class Vector2D(Vector):
         """Compute the cross product of two vectors."""
         return self._x * other._y - self._y * other._x
     
-    @not_instance(int)
-    def norm(self, p: int = 2) -> float:
+    @not_instance((int, float))
+    def norm(self, p: int | float = 2) -> float:
         """Compute the norm of the vector."""
         if p <= 0:
             raise ValueError("p must be a positive number")
@@ -7,6 +7,8 @@ from ..utils.error import check_type
 import math
 
 class Vector3D(Vector):
+    __slots__ = ("_x", "_y", "_z")
+
     def __init__(self, x: float, y: float, z: float, id: int = -1, visited: bool = False):
         super().__init__(id, visited)
         check_type(x, float, "x")
@@ -16,6 +18,17 @@ class Vector3D(Vector):
         self._x = x
         self._y = y
         self._z = z
+
+    @classmethod
+    def unchecked(cls, x: float, y: float, z: float, id: int = -1, visited: bool = False) -> 'Vector3D':
+        """Create a vector without validating the arguments, for trusted bulk construction."""
+        vector = cls.__new__(cls)
+        vector._id = id
+        vector._visited = visited
+        vector._x = x
+        vector._y = y
+        vector._z = z
+        return vector
     
     @property
     def coordinates(self):
@@ -77,6 +90,10 @@ class Vector3D(Vector):
         """Check equality based on the coordinates of the vector."""
         return self._x == other._x and self._y == other._y and self._z == other._z
 
+    def __hash__(self) -> int:
+        """Hash the coordinates of the vector, consistent with __eq__."""
+        return hash((self._x, self._y, self._z))
+
     @not_self_instance
     def __lt__(self, other: 'Vector3D') -> bool:
         """Check if this vector is less than another vector."""
@@ -112,8 +129,8 @@ class Vector3D(Vector):
         """Compute the cross product of two vectors."""
         return Vector3D(self._y * other._z - self._z * other._y, self._z * other._x - self._x * other._z, self._x * other._y - self._y * other._x)
     
-    @not_instance(int)
-    def norm(self, p: int = 2) -> float:
+    @not_instance((int, float))
+    def norm(self, p: int | float = 2) -> float:
         """Compute the norm of the vector."""
         if p <= 0:
             raise ValueError("p must be a positive number")
@@ -1,3 +1,5 @@
 from .base import Vertex
 from .vertex2d import Vertex2D
-from .vertex3d import Vertex3D
\ No newline at end of file
+from .vertex3d import Vertex3D
+from .array import VertexArray, VertexArray2D, VertexArray3D, Vertex2DView, Vertex3DView, coordinate_version
+from .hashing import VertexHashMap, VertexHashSet, vertex_key
@@ -0,0 +1,401 @@
+from .base import Vertex
+from .vertex2d import Vertex2D
+from .vertex3d import Vertex3D
+from ...decorator.error import not_instance
+from ..utils.error import check_type, check_consistency
+from ..utils.version import coordinate_versions
+
+import numpy as np
+
+
+class _VertexView:
+    """Mixin storing the (array, index) pair of a vertex view and proxying the shared columns."""
+
+    # The slots live on the concrete views to avoid a layout conflict with the vertex slots
+    __slots__ = ()
+
+    def __init__(self, array: 'VertexArray', index: int):
+        self._array = array
+        self._index = index
+
+    @property
+    def array(self) -> 'VertexArray':
+        return self._array
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def _id(self) -> int:
+        ids = self._array._ids
+        return -1 if ids is None else int(ids[self._index])
+
+    @_id.setter
+    def _id(self, value: int):
+        self._array.ids[self._index] = value
+
+    @property
+    def _visited(self) -> bool:
+        visited = self._array._visited
+        return False if visited is None else bool(visited[self._index])
+
+    @_visited.setter
+    def _visited(self, value: bool):
+        self._array.visited[self._index] = value
+
+    @property
+    def _weight(self) -> float:
+        weights = self._array._weights
+        return 1.0 if weights is None else float(weights[self._index])
+
+    @_weight.setter
+    def _weight(self, value: float):
+        self._array.weights[self._index] = value
+
+    def _get(self, axis: int) -> float:
+        return float(self._array._coordinates[self._index, axis])
+
+    def _set(self, axis: int, value: float):
+        self._array._coordinates[self._index, axis] = value
+        self._array.mark_modified()
+
+
+class Vertex2DView(_VertexView, Vertex2D):
+    """Zero-copy Vertex2D view of one row of a VertexArray2D."""
+
+    __slots__ = ("_array", "_index")
+    consistency_type = Vertex2D
+
+    _x = property(lambda self: self._get(0), lambda self, value: self._set(0, value))
+    _y = property(lambda self: self._get(1), lambda self, value: self._set(1, value))
+
+    __eq__ = not_instance(Vertex2D)(Vertex2D.__eq__.__wrapped__)
+    __hash__ = Vertex2D.__hash__
+    __lt__ = not_instance(Vertex2D)(Vertex2D.__lt__.__wrapped__)
+    __add__ = not_instance(Vertex2D)(Vertex2D.__add__.__wrapped__)
+    __sub__ = not_instance(Vertex2D)(Vertex2D.__sub__.__wrapped__)
+    distance_to = not_instance(Vertex2D)(Vertex2D.distance_to.__wrapped__)
+
+
+class Vertex3DView(_VertexView, Vertex3D):
+    """Zero-copy Vertex3D view of one row of a VertexArray3D."""
+
+    __slots__ = ("_array", "_index")
+    consistency_type = Vertex3D
+
+    _x = property(lambda self: self._get(0), lambda self, value: self._set(0, value))
+    _y = property(lambda self: self._get(1), lambda self, value: self._set(1, value))
+    _z = property(lambda self: self._get(2), lambda self, value: self._set(2, value))
+
+    @property
+    def _normal(self) -> tuple | None:
+        normals = self._array._normals
+        if normals is None or np.isnan(normals[self._index]).all():
+            return None
+        return tuple(None if np.isnan(n) else float(n) for n in normals[self._index])
+
+    @_normal.setter
+    def _normal(self, value: tuple | None):
+        if value is None and self._array._normals is None:
+            return
+        self._array.normals[self._index] = _normal_row(value)
+
+    __eq__ = not_instance(Vertex3D)(Vertex3D.__eq__.__wrapped__)
+    __hash__ = Vertex3D.__hash__
+    __lt__ = not_instance(Vertex3D)(Vertex3D.__lt__.__wrapped__)
+    __add__ = not_instance(Vertex3D)(Vertex3D.__add__.__wrapped__)
+    __sub__ = not_instance(Vertex3D)(Vertex3D.__sub__.__wrapped__)
+    distance_to = not_instance(Vertex3D)(Vertex3D.distance_to.__wrapped__)
+
+
+def _normal_row(normal: tuple | None) -> list[float]:
+    """Row of the normals column for a Vertex3D normal, with NaN for missing components."""
+    if normal is None:
+        return [np.nan] * 3
+    return [np.nan if n is None else n for n in normal]
+
+
+class VertexArray:
+    """Struct-of-arrays vertex container backed by one contiguous (N, dim) float64 array.
+
+    The id, weight and visited columns (and the normals of a VertexArray3D) are only
+    allocated once they are written to.
+    Indexing with an integer returns a zero-copy vertex view, slicing returns a new
+    VertexArray sharing the same memory. Appending doubles the capacity of the columns
+    when they are full, which moves them to new buffers.
+
+    ``version`` changes with every coordinate write made through the container or its
+    views; call mark_modified() after writing to ``coordinates`` directly.
+    """
+
+    dim: int = 0
+    vertex_type: type[Vertex] = Vertex
+    view_type: type[_VertexView] = _VertexView
+    # Lazily allocated columns besides the coordinates, stored as "_" + name
+    columns: tuple[str, ...] = ("ids", "weights", "visited")
+
+    def __init__(self,
+        coordinates: np.ndarray,
+        ids: np.ndarray | None = None,
+        weights: np.ndarray | None = None,
+        visited: np.ndarray | None = None
+    ):
+        coordinates = np.asarray(coordinates, dtype=np.float64)
+        if coordinates.ndim != 2 or coordinates.shape[1] != self.dim:
+            raise ValueError(f"coordinates must have shape (N, {self.dim}), got {coordinates.shape}")
+        if not coordinates.flags.c_contiguous:
+            coordinates = np.ascontiguousarray(coordinates)
+
+        self._coordinates = coordinates
+        self._ids = self._check_column(ids, np.int64, "ids")
+        self._weights = self._check_column(weights, np.float64, "weights")
+        self._visited = self._check_column(visited, np.bool_, "visited")
+        # Columns live in the first len(self) rows of these buffers once the array has grown
+        self._capacity = len(coordinates)
+        self._backing: dict[str, np.ndarray] = {}
+        self._version = coordinate_versions.stamp()
+
+    def _check_column(self, column: np.ndarray | None, dtype: type, var_name: str, row_shape: tuple[int, ...] = ()) -> np.ndarray | None:
+        if column is None:
+            return None
+        column = np.asarray(column, dtype=dtype)
+        shape = (len(self._coordinates),) + row_shape
+        if column.shape != shape:
+            raise ValueError(f"{var_name} must have shape {shape}, got {column.shape}")
+        return column
+
+    @classmethod
+    def from_vertices(cls, vertices: list[Vertex2D | Vertex3D]) -> 'VertexArray':
+        """Create a VertexArray from a list of vertex objects."""
+        check_type(vertices, list, "vertices")
+        check_consistency(vertices, "vertices")
+        if len(vertices) > 0:
+            check_type(vertices[0], cls.vertex_type, "vertices")
+        return cls(
+            coordinates=np.array([v.coordinates for v in vertices], dtype=np.float64).reshape(-1, cls.dim),
+            ids=np.array([v.id for v in vertices], dtype=np.int64),
+            weights=np.array([v.weight for v in vertices], dtype=np.float64),
+            visited=np.array([v.visited for v in vertices], dtype=np.bool_)
+        )
+
+    def to_vertices(self) -> list[Vertex2D | Vertex3D]:
+        """Materialize the array as a list of independent vertex objects."""
+        ids = self.ids.tolist()
+        visited = self.visited.tolist()
+        vertices = []
+        for i, coordinates in enumerate(self._coordinates.tolist()):
+            vertex = self.vertex_type(*coordinates, id=ids[i], visited=visited[i])
+            if self._weights is not None:
+                vertex.weight = float(self._weights[i])
+            vertices.append(vertex)
+        return vertices
+
+    @property
+    def coordinates(self) -> np.ndarray:
+        return self._coordinates
+
+    @property
+    def version(self) -> int:
+        """Stamp of the last coordinate change, unique across all vertex containers."""
+        return self._version
+
+    def mark_modified(self):
+        """Record a coordinate change, e.g. after writing to ``coordinates`` in place."""
+        self._version = coordinate_versions.stamp()
+
+    def _allocate(self, name: str, fill, dtype: type, row_shape: tuple[int, ...] = ()) -> np.ndarray:
+        backing = np.full((self._capacity,) + row_shape, fill, dtype=dtype)
+        self._backing[name] = backing
+        return backing[:len(self)]
+
+    @property
+    def ids(self) -> np.ndarray:
+        if self._ids is None:
+            self._ids = self._allocate("_ids", -1, np.int64)
+        return self._ids
+
+    @property
+    def weights(self) -> np.ndarray:
+        if self._weights is None:
+            self._weights = self._allocate("_weights", 1.0, np.float64)
+        return self._weights
+
+    @property
+    def visited(self) -> np.ndarray:
+        if self._visited is None:
+            self._visited = self._allocate("_visited", False, np.bool_)
+        return self._visited
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def reserve(self, capacity: int):
+        """Make room for ``capacity`` vertices, at least doubling the current capacity."""
+        if capacity <= self._capacity:
+            return
+        capacity = max(capacity, 2 * self._capacity, 16)
+        for name in ("_coordinates",) + tuple("_" + column for column in self.columns):
+            column = getattr(self, name)
+            if column is not None:
+                backing = np.empty((capacity,) + column.shape[1:], dtype=column.dtype)
+                backing[:len(column)] = column
+                self._backing[name] = backing
+                setattr(self, name, backing[:len(column)])
+        self._capacity = capacity
+
+    def _write(self, name: str, start: int, values: np.ndarray):
+        backing = self._backing[name] if name in self._backing else getattr(self, name)
+        backing[start:start + len(values)] = values
+        setattr(self, name, backing[:start + len(values)])
+
+    def __len__(self) -> int:
+        return len(self._coordinates)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.view_type(self, i)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            index = int(key)
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError(f"vertex index {key} out of range for {len(self)} vertices")
+            return self.view_type(self, index)
+        columns = {name: getattr(self, "_" + name) for name in self.columns}
+        return type(self)(
+            coordinates=self._coordinates[key],
+            **{name: None if column is None else column[key] for name, column in columns.items()}
+        )
+
+    def __setitem__(self, key: int, vertex: Vertex2D | Vertex3D):
+        check_type(vertex, self.vertex_type, "vertex")
+        self._coordinates[key] = vertex.coordinates
+        self.ids[key] = vertex.id
+        self.weights[key] = vertex.weight
+        self.visited[key] = vertex.visited
+        self.mark_modified()
+
+    def append(self, vertex: Vertex2D | Vertex3D):
+        """Append a vertex in amortised O(1)."""
+        check_type(vertex, self.vertex_type, "vertex")
+        size = len(self)
+        self.reserve(size + 1)
+        for name, public, value in (("_ids", "ids", vertex.id), ("_weights", "weights", vertex.weight), ("_visited", "visited", vertex.visited)):
+            getattr(self, public)  # allocates the column
+            self._write(name, size, [value])
+        self._write("_coordinates", size, [vertex.coordinates])
+        self.mark_modified()
+
+    def _as_array(self, vertices: 'VertexArray | list[Vertex2D | Vertex3D] | np.ndarray') -> 'VertexArray':
+        if isinstance(vertices, np.ndarray):
+            return type(self)(vertices)
+        if isinstance(vertices, list):
+            return type(self).from_vertices(vertices)
+        check_type(vertices, type(self), "vertices")
+        return vertices
+
+    def extend(self, vertices: 'VertexArray | list[Vertex2D | Vertex3D] | np.ndarray'):
+        """Append a batch of vertices, given as a VertexArray, a vertex list or an (N, dim) coordinate array."""
+        other = self._as_array(vertices)
+        size = len(self)
+        self.reserve(size + len(other))
+        columns = (("_ids", "ids", other._ids, -1), ("_weights", "weights", other._weights, 1.0), ("_visited", "visited", other._visited, False))
+        for name, public, values, default in columns:
+            # Columns left at their defaults on both sides stay unallocated
+            if values is None and getattr(self, name) is None:
+                continue
+            getattr(self, public)  # allocates the column
+            self._write(name, size, np.full(len(other), default) if values is None else values)
+        self._write("_coordinates", size, other.coordinates)
+        self.mark_modified()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, VertexArray):
+            return type(self) == type(other) and np.array_equal(self._coordinates, other._coordinates)
+        if isinstance(other, list):
+            return len(self) == len(other) and all(v == o for v, o in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{type(self).__name__}(num_vertices={len(self)})"
+
+
+class VertexArray2D(VertexArray):
+    dim = 2
+    vertex_type = Vertex2D
+    view_type = Vertex2DView
+
+
+class VertexArray3D(VertexArray):
+    """VertexArray of Vertex3D with an optional (N, 3) normals column, NaN where unset."""
+
+    dim = 3
+    vertex_type = Vertex3D
+    view_type = Vertex3DView
+    columns = VertexArray.columns + ("normals",)
+
+    def __init__(self,
+        coordinates: np.ndarray,
+        ids: np.ndarray | None = None,
+        weights: np.ndarray | None = None,
+        visited: np.ndarray | None = None,
+        normals: np.ndarray | None = None
+    ):
+        super().__init__(coordinates, ids, weights, visited)
+        self._normals = self._check_column(normals, np.float64, "normals", (3,))
+
+    @classmethod
+    def from_vertices(cls, vertices: list[Vertex3D]) -> 'VertexArray3D':
+        array = super().from_vertices(vertices)
+        if any(v._normal is not None for v in vertices):
+            array.normals[:] = [_normal_row(v._normal) for v in vertices]
+        return array
+
+    def to_vertices(self) -> list[Vertex3D]:
+        vertices = super().to_vertices()
+        if self._normals is not None:
+            for i, vertex in enumerate(vertices):
+                vertex._normal = self.view_type(self, i)._normal
+        return vertices
+
+    @property
+    def normals(self) -> np.ndarray:
+        if self._normals is None:
+            self._normals = self._allocate("_normals", np.nan, np.float64, (3,))
+        return self._normals
+
+    def __setitem__(self, key: int, vertex: Vertex3D):
+        super().__setitem__(key, vertex)
+        if vertex._normal is not None or self._normals is not None:
+            self.normals[key] = _normal_row(vertex._normal)
+
+    def append(self, vertex: Vertex3D):
+        size = len(self)
+        super().append(vertex)
+        if vertex._normal is not None or self._normals is not None:
+            self.normals  # allocates the column
+            self._write("_normals", size, [_normal_row(vertex._normal)])
+
+    def extend(self, vertices: 'VertexArray3D | list[Vertex3D] | np.ndarray'):
+        other = self._as_array(vertices)
+        size = len(self)
+        super().extend(other)
+        if other._normals is not None or self._normals is not None:
+            self.normals  # allocates the column
+            self._write("_normals", size, np.full((len(other), 3), np.nan) if other._normals is None else other._normals)
+
+
+def coordinate_version(vertices: list[Vertex2D | Vertex3D] | VertexArray) -> int:
+    """Version of the coordinates of a vertex container, for stamping derived caches.
+
+    A VertexArray tracks its own writes, so its caches ignore every other container; a
+    vertex list falls back to the global counter, which every vertex object bumps, so
+    list-based caches are invalidated conservatively.
+    """
+    if isinstance(vertices, VertexArray):
+        return vertices.version
+    return coordinate_versions.value
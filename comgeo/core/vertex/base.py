@@ -2,6 +2,8 @@ from ...decorator.error import not_instance, not_self_implemented, not_self_inst
 from ..utils.error import check_type
 
 class Vertex:
+    __slots__ = ("_id", "_visited", "_weight")
+
     def __init__(self, id: int = -1, visited: bool = False, weight: float = 1.0):
         check_type(id, int, "id")
         check_type(visited, bool, "visited")
@@ -45,6 +47,10 @@ class Vertex:
         """Check equality of Vertex instances based on their IDs."""
         return self._id == other._id
 
+    def __hash__(self):
+        """Hash based on the ID, consistent with __eq__."""
+        return hash(self._id)
+
     @not_self_implemented
     def __lt__(self, other: 'Vertex'): 
         """Compare Vertex instances based on their IDs."""
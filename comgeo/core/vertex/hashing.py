@@ -0,0 +1,153 @@
+from .base import Vertex
+from ..utils.error import check_type
+
+from collections.abc import MutableMapping, MutableSet, Iterator
+from typing import Any
+import itertools
+import math
+
+
+VertexKey = Vertex | tuple[float, ...]
+
+
+def _coordinates(key: VertexKey) -> tuple[float, ...]:
+    if isinstance(key, Vertex):
+        return key.coordinates
+    return tuple(float(c) for c in key)
+
+
+def vertex_key(vertex: VertexKey, tolerance: float = 0.0) -> tuple:
+    """Return a hashable key for a vertex or coordinate tuple.
+
+    With ``tolerance == 0`` this is the exact coordinate tuple, otherwise the integer
+    index of the tolerance-sized grid cell containing the vertex.
+    """
+    coordinates = _coordinates(vertex)
+    if tolerance == 0.0:
+        return coordinates
+    return tuple(math.floor(c / tolerance) for c in coordinates)
+
+
+class VertexHashMap(MutableMapping):
+    """Dictionary keyed by vertex position instead of vertex identity.
+
+    Keys are vertices or coordinate tuples. With ``tolerance == 0`` two keys match when
+    their coordinates are equal. With a positive tolerance a key matches the first
+    stored key within that (Euclidean) distance; the space is bucketed into cells of
+    size ``tolerance`` and only the 3**dim neighbouring cells are searched, so every
+    lookup is O(1) on average.
+    """
+
+    def __init__(self, tolerance: float = 0.0):
+        check_type(tolerance, float, "tolerance")
+        if tolerance < 0.0:
+            raise ValueError("tolerance must be non-negative")
+        self._tolerance = tolerance
+        # stored coordinates -> (key as given on insertion, value)
+        self._entries: dict[tuple[float, ...], tuple[VertexKey, Any]] = {}
+        # grid cell -> stored coordinates inside it, only used with a positive tolerance
+        self._cells: dict[tuple[int, ...], list[tuple[float, ...]]] = {}
+        self._offsets: dict[int, list[tuple[int, ...]]] = {}
+
+    @property
+    def tolerance(self) -> float:
+        return self._tolerance
+
+    def _find(self, coordinates: tuple[float, ...]) -> tuple[float, ...] | None:
+        """Return the stored coordinates matching ``coordinates``, if any."""
+        if coordinates in self._entries:
+            return coordinates
+        if self._tolerance == 0.0 or not self._cells:
+            return None
+
+        dim = len(coordinates)
+        if dim not in self._offsets:
+            self._offsets[dim] = list(itertools.product((-1, 0, 1), repeat=dim))
+        cell = vertex_key(coordinates, self._tolerance)
+        limit = self._tolerance * self._tolerance
+        for offset in self._offsets[dim]:
+            for stored in self._cells.get(tuple(c + o for c, o in zip(cell, offset)), ()):
+                if len(stored) == dim and sum((a - b) ** 2 for a, b in zip(stored, coordinates)) <= limit:
+                    return stored
+        return None
+
+    def representative(self, key: VertexKey) -> VertexKey | None:
+        """Return the stored key that ``key`` matches, or None."""
+        stored = self._find(_coordinates(key))
+        return None if stored is None else self._entries[stored][0]
+
+    def __getitem__(self, key: VertexKey) -> Any:
+        stored = self._find(_coordinates(key))
+        if stored is None:
+            raise KeyError(key)
+        return self._entries[stored][1]
+
+    def __setitem__(self, key: VertexKey, value: Any):
+        coordinates = _coordinates(key)
+        stored = self._find(coordinates)
+        if stored is not None:
+            self._entries[stored] = (self._entries[stored][0], value)
+            return
+        self._entries[coordinates] = (key, value)
+        if self._tolerance > 0.0:
+            self._cells.setdefault(vertex_key(coordinates, self._tolerance), []).append(coordinates)
+
+    def __delitem__(self, key: VertexKey):
+        stored = self._find(_coordinates(key))
+        if stored is None:
+            raise KeyError(key)
+        del self._entries[stored]
+        if self._tolerance > 0.0:
+            cell = vertex_key(stored, self._tolerance)
+            self._cells[cell].remove(stored)
+            if not self._cells[cell]:
+                del self._cells[cell]
+
+    def __contains__(self, key: object) -> bool:
+        return self._find(_coordinates(key)) is not None
+
+    def __iter__(self) -> Iterator[VertexKey]:
+        return (key for key, _ in self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"VertexHashMap(tolerance={self._tolerance}, size={len(self)})"
+
+
+class VertexHashSet(MutableSet):
+    """Set of vertex positions, with the same matching rules as VertexHashMap."""
+
+    def __init__(self, vertices: list[VertexKey] | None = None, tolerance: float = 0.0):
+        self._map = VertexHashMap(tolerance)
+        for vertex in vertices or []:
+            self.add(vertex)
+
+    @property
+    def tolerance(self) -> float:
+        return self._map.tolerance
+
+    def representative(self, vertex: VertexKey) -> VertexKey | None:
+        """Return the stored vertex that ``vertex`` matches, or None."""
+        return self._map.representative(vertex)
+
+    def add(self, vertex: VertexKey):
+        if vertex not in self._map:
+            self._map[vertex] = None
+
+    def discard(self, vertex: VertexKey):
+        if vertex in self._map:
+            del self._map[vertex]
+
+    def __contains__(self, vertex: object) -> bool:
+        return vertex in self._map
+
+    def __iter__(self) -> Iterator[VertexKey]:
+        return iter(self._map)
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __repr__(self):
+        return f"VertexHashSet(tolerance={self.tolerance}, size={len(self)})"
@@ -1,8 +1,13 @@
 from .base import Vertex
 from ...decorator.error import not_instance, not_self_instance
 from ..utils.error import check_type
+from ..utils.version import coordinate_versions
+
+import numpy as np
 
 class Vertex2D(Vertex):
+    __slots__ = ("_x", "_y")
+
     def __init__(self, x: float, y: float, id: int = -1, visited: bool = False):
         super().__init__(id, visited)
         check_type(x, float, "x")
@@ -10,6 +15,31 @@ class Vertex2D(Vertex):
         self._x = x
         self._y = y
 
+    @classmethod
+    def unchecked(cls, x: float, y: float, id: int = -1, visited: bool = False) -> 'Vertex2D':
+        """Create a vertex without validating the arguments, for trusted bulk construction."""
+        vertex = cls.__new__(cls)
+        vertex._id = id
+        vertex._visited = visited
+        vertex._weight = 1.0
+        vertex._x = x
+        vertex._y = y
+        return vertex
+
+    @classmethod
+    def from_array(cls, coordinates: np.ndarray, ids: np.ndarray | list[int] | None = None) -> list['Vertex2D']:
+        """Create one Vertex2D per row of an (N, 2) array, validating the array once instead of every vertex."""
+        coordinates = np.asarray(coordinates, dtype=np.float64)
+        if coordinates.ndim != 2 or coordinates.shape[1] != 2:
+            raise ValueError(f"coordinates must have shape (N, 2), got {coordinates.shape}")
+        if ids is None:
+            ids = [-1] * len(coordinates)
+        else:
+            ids = np.asarray(ids, dtype=np.int64).tolist()
+            if len(ids) != len(coordinates):
+                raise ValueError(f"ids must have {len(coordinates)} entries, got {len(ids)}")
+        return [cls.unchecked(x, y, id) for (x, y), id in zip(coordinates.tolist(), ids)]
+
     @property
     def coordinates(self):
         return self._x, self._y
@@ -19,6 +49,7 @@ class Vertex2D(Vertex):
         check_type(y, float, "y")
         self._x = x
         self._y = y
+        coordinate_versions.bump()
 
     @property
     def x(self):
@@ -28,6 +59,7 @@ class Vertex2D(Vertex):
     @not_instance(float)
     def x(self, value: float):
         self._x = value
+        coordinate_versions.bump()
 
     @property
     def y(self):
@@ -37,6 +69,7 @@ class Vertex2D(Vertex):
     @not_instance(float)
     def y(self, value: float):
         self._y = value
+        coordinate_versions.bump()
 
     def __repr__(self):
         return f"Vertex2D(x={self._x}, y={self._y}, id={self._id}, visited={self._visited})"
@@ -46,6 +79,10 @@ class Vertex2D(Vertex):
         """Check equality of Vertex2D instances based on their coordinates."""
         return self._x == other._x and self._y == other._y
 
+    def __hash__(self) -> int:
+        """Hash the coordinates, consistent with __eq__. Do not move a vertex while it is a set member or dict key."""
+        return hash((self._x, self._y))
+
     @not_self_instance
     def __lt__(self, other: 'Vertex2D') -> bool:
         """Compare Vertex2D instances based on their coordinates."""
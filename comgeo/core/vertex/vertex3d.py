@@ -1,8 +1,13 @@
 from .base import Vertex
 from ...decorator.error import not_instance, not_self_instance
 from ..utils.error import check_type
+from ..utils.version import coordinate_versions
+
+import numpy as np
 
 class Vertex3D(Vertex):
+    __slots__ = ("_x", "_y", "_z", "_normal")
+
     def __init__(self, x: float, y: float, z: float, id: int = -1, visited: bool = False):
         super().__init__(id, visited)
         check_type(x, float, "x")
@@ -11,9 +16,45 @@ class Vertex3D(Vertex):
         self._x = x
         self._y = y
         self._z = z
-        self._nx = None
-        self._ny = None
-        self._nz = None
+        # (nx, ny, nz) once any component is set, None otherwise
+        self._normal: tuple | None = None
+
+    @classmethod
+    def unchecked(cls, x: float, y: float, z: float, id: int = -1, visited: bool = False) -> 'Vertex3D':
+        """Create a vertex without validating the arguments, for trusted bulk construction."""
+        vertex = cls.__new__(cls)
+        vertex._id = id
+        vertex._visited = visited
+        vertex._weight = 1.0
+        vertex._x = x
+        vertex._y = y
+        vertex._z = z
+        vertex._normal = None
+        return vertex
+
+    @classmethod
+    def from_array(cls, coordinates: np.ndarray, ids: np.ndarray | list[int] | None = None, normals: np.ndarray | None = None) -> list['Vertex3D']:
+        """Create one Vertex3D per row of an (N, 3) array, validating the array once instead of every vertex.
+
+        Rows of an optional (N, 3) ``normals`` array become the vertex normals.
+        """
+        coordinates = np.asarray(coordinates, dtype=np.float64)
+        if coordinates.ndim != 2 or coordinates.shape[1] != 3:
+            raise ValueError(f"coordinates must have shape (N, 3), got {coordinates.shape}")
+        if ids is None:
+            ids = [-1] * len(coordinates)
+        else:
+            ids = np.asarray(ids, dtype=np.int64).tolist()
+            if len(ids) != len(coordinates):
+                raise ValueError(f"ids must have {len(coordinates)} entries, got {len(ids)}")
+        vertices = [cls.unchecked(x, y, z, id) for (x, y, z), id in zip(coordinates.tolist(), ids)]
+        if normals is not None:
+            normals = np.asarray(normals, dtype=np.float64)
+            if normals.shape != coordinates.shape:
+                raise ValueError(f"normals must have shape {coordinates.shape}, got {normals.shape}")
+            for vertex, normal in zip(vertices, normals.tolist()):
+                vertex._normal = tuple(normal)
+        return vertices
 
     @property
     def coordinates(self):
@@ -26,6 +67,7 @@ class Vertex3D(Vertex):
         self._x = x
         self._y = y
         self._z = z
+        coordinate_versions.bump()
 
     @property
     def x(self):
@@ -35,6 +77,7 @@ class Vertex3D(Vertex):
     @not_instance(float)
     def x(self, value: float):
         self._x = value
+        coordinate_versions.bump()
 
     @property
     def y(self):
@@ -44,6 +87,7 @@ class Vertex3D(Vertex):
     @not_instance(float)
     def y(self, value: float):
         self._y = value
+        coordinate_versions.bump()
 
     @property
     def z(self):
@@ -53,37 +97,43 @@ class Vertex3D(Vertex):
     @not_instance(float)
     def z(self, value: float):
         self._z = value
+        coordinate_versions.bump()
 
     @property
     def normal(self):
-        return self._nx, self._ny, self._nz
+        return (None, None, None) if self._normal is None else self._normal
     
     @property
     def nx(self):
-        return self._nx
+        return self.normal[0]
 
     @property
     def ny(self):
-        return self._ny
+        return self.normal[1]
 
     @property
     def nz(self):
-        return self._nz
+        return self.normal[2]
+
+    def _set_normal_component(self, axis: int, value: float):
+        normal = list(self.normal)
+        normal[axis] = value
+        self._normal = tuple(normal)
 
     @nx.setter
     @not_instance(float)
     def nx(self, value: float):
-        self._nx = value
+        self._set_normal_component(0, value)
 
     @ny.setter
     @not_instance(float)
     def ny(self, value: float):
-        self._ny = value
+        self._set_normal_component(1, value)
 
     @nz.setter
     @not_instance(float)
     def nz(self, value: float):
-        self._nz = value
+        self._set_normal_component(2, value)
 
     @normal.setter
     def normal(self, value):
@@ -93,18 +143,20 @@ class Vertex3D(Vertex):
         check_type(nx, float, "nx")
         check_type(ny, float, "ny")
         check_type(nz, float, "nz")
-        self._nx = nx
-        self._ny = ny
-        self._nz = nz
+        self._normal = (nx, ny, nz)
 
     def __repr__(self):
-        return f"Vertex3D(x={self._x}, y={self._y}, z={self._z}, nx={self._nx}, ny={self._ny}, nz={self._nz}, id={self._id}, visited={self._visited})"
+        return f"Vertex3D(x={self._x}, y={self._y}, z={self._z}, nx={self.nx}, ny={self.ny}, nz={self.nz}, id={self._id}, visited={self._visited})"
 
     @not_self_instance
     def __eq__(self, other: 'Vertex3D') -> bool:
         """Check equality of Vertex3D instances based on their coordinates."""
         return (self._x == other._x and self._y == other._y and self._z == other._z)
 
+    def __hash__(self) -> int:
+        """Hash the coordinates, consistent with __eq__. Do not move a vertex while it is a set member or dict key."""
+        return hash((self._x, self._y, self._z))
+
     @not_self_instance
     def __lt__(self, other: 'Vertex3D') -> bool:
         """Compare Vertex3D instances based on their coordinates."""
@@ -1,5 +1,7 @@
 import functools
 
+from ..core.utils.error import is_trusted
+
 def not_self_implemented(func):
     """Decorator to raise NotImplementedError for methods that are not implemented."""
     def wrapper(self, *args, **kwargs):
@@ -12,11 +14,17 @@ def self_implemented(func):
         return func(self, *args, **kwargs)
     return wrapper
 
+def _type_name(cls) -> str:
+    if isinstance(cls, tuple):
+        return " or ".join(_type_name(c) for c in cls)
+    return getattr(cls, "__name__", str(cls))
+
 def not_self_instance(func):
     """Decorator to check if the argument is an instance of a specific class."""
+    @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         # Only check if there are positional arguments
-        if args and not isinstance(args[0], self.__class__):
+        if args and not is_trusted() and not isinstance(args[0], self.__class__):
             raise TypeError(f"{func.__name__} is only supported for {self.__class__.__name__} instances.")
         return func(self, *args, **kwargs)
     return wrapper
@@ -26,8 +34,8 @@ def not_instance(cls):
     def decorator(func):
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
-            if args and not isinstance(args[0], cls):
-                raise TypeError(f"{func.__name__} is only supported for {cls.__name__} instances.")
+            if args and not is_trusted() and not isinstance(args[0], cls):
+                raise TypeError(f"{func.__name__} is only supported for {_type_name(cls)} instances.")
             return func(self, *args, **kwargs)
         return wrapper
     return decorator
\ No newline at end of file
@@ -0,0 +1,247 @@
+from .topology import face_edges, pad_faces, union_find
+from ..vertex.triplets.compute import triplet_collinear
+
+import itertools
+import math
+import numpy as np
+
+
+# Upper bound on the number of candidate point pairs whose distances are held at once
+_PAIR_BUDGET = 1 << 22
+
+
+def _neighbour_cells(occupied: np.ndarray, offset: tuple[int, ...]) -> tuple[np.ndarray, np.ndarray]:
+    """Return (a, b) such that occupied[b] == occupied[a] + offset, for every occupied cell a with such a neighbour."""
+    shift = np.array(offset, dtype=np.int64)
+    low = occupied.min(axis=0) - np.abs(shift)
+    extent = occupied.max(axis=0) + np.abs(shift) - low + 1
+    if np.prod(extent.astype(np.float64)) < 2.0 ** 62:
+        # Cells as integer keys; occupied is sorted lexicographically, so are its keys
+        keys = np.ravel_multi_index(tuple((occupied - low).T), tuple(extent))
+        targets = np.ravel_multi_index(tuple((occupied + shift - low).T), tuple(extent))
+        found = np.minimum(np.searchsorted(keys, targets), len(keys) - 1)
+        first = np.flatnonzero(keys[found] == targets)
+        return first, found[first]
+    # Rank both sets together when the grid is too large for integer keys
+    _, rank = np.unique(np.concatenate([occupied, occupied + shift]), axis=0, return_inverse=True)
+    rank = rank.reshape(-1)
+    owner = np.full(2 * len(occupied), -1, dtype=np.int64)
+    owner[rank[:len(occupied)]] = np.arange(len(occupied))
+    second = owner[rank[len(occupied):]]
+    first = np.flatnonzero(second >= 0)
+    return first, second[first]
+
+
+def _any_close(a: np.ndarray, b: np.ndarray, tolerance: float) -> bool:
+    """Whether any point of a lies within tolerance of any point of b, in blocks of bounded size."""
+    # Only points of b within tolerance along the first axis can be close
+    b = b[np.argsort(b[:, 0], kind="stable")]
+    low = np.searchsorted(b[:, 0], a[:, 0] - tolerance, side="left")
+    high = np.searchsorted(b[:, 0], a[:, 0] + tolerance, side="right")
+    for i in np.flatnonzero(high > low):
+        window = b[low[i]:high[i]]
+        for block in range(0, len(window), _PAIR_BUDGET):
+            if np.any(np.sum((window[block:block + _PAIR_BUDGET] - a[i]) ** 2, axis=1) <= tolerance * tolerance):
+                return True
+    return False
+
+
+def _connected_cells(coordinates: np.ndarray, tolerance: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Hash points into cells of size tolerance / sqrt(dim) and link neighbouring cells holding a close pair.
+
+    Points sharing such a cell are at most ``tolerance`` apart, so every cell is already
+    connected and needs no pairwise test. Neighbouring cells are compared in batches of
+    at most _PAIR_BUDGET point pairs, and only the connected cell pairs are kept, so
+    memory stays bounded however many points share a cell. Returns (cell of every
+    point, first cells, second cells).
+    """
+    dim = coordinates.shape[1]
+    size = tolerance / math.sqrt(dim)
+    occupied, cell_of = np.unique(np.floor(coordinates / size).astype(np.int64), axis=0, return_inverse=True)
+    cell_of = cell_of.reshape(-1)
+    order = np.argsort(cell_of, kind="stable")
+    counts = np.bincount(cell_of, minlength=len(occupied))
+    starts = np.zeros(len(occupied), dtype=np.int64)
+    np.cumsum(counts[:-1], out=starts[1:])
+
+    reach = math.ceil(math.sqrt(dim))
+    rows = []
+    cols = []
+    # Half of the neighbourhood suffices since cell pairs are symmetric
+    for offset in itertools.product(range(-reach, reach + 1), repeat=dim):
+        if offset <= (0,) * dim:
+            continue
+        gap = size * math.sqrt(sum(max(abs(o) - 1, 0) ** 2 for o in offset))
+        if gap > tolerance:
+            continue
+        first, second = _neighbour_cells(occupied, offset)
+        total = counts[first] * counts[second]
+        connected = np.zeros(len(first), dtype=np.bool_)
+        cumulative = np.cumsum(total)
+        begin = 0
+        while begin < len(first):
+            end = max(int(np.searchsorted(cumulative, cumulative[begin] - total[begin] + _PAIR_BUDGET, side="right")), begin + 1)
+            if end == begin + 1 and total[begin] > _PAIR_BUDGET:
+                a, b = first[begin], second[begin]
+                connected[begin] = _any_close(
+                    coordinates[order[starts[a]:starts[a] + counts[a]]],
+                    coordinates[order[starts[b]:starts[b] + counts[b]]],
+                    tolerance
+                )
+            else:
+                # Cartesian product of the points of every cell pair in the batch
+                batch_first, batch_second = first[begin:end], second[begin:end]
+                na, nb = counts[batch_first], counts[batch_second]
+                sizes = na * nb
+                pair = np.repeat(np.arange(end - begin), sizes)
+                k = np.arange(int(sizes.sum())) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+                i = order[starts[batch_first][pair] + k // nb[pair]]
+                j = order[starts[batch_second][pair] + k % nb[pair]]
+                close = np.sum((coordinates[i] - coordinates[j]) ** 2, axis=1) <= tolerance * tolerance
+                connected[begin:end] = np.bincount(pair[close], minlength=end - begin) > 0
+            begin = end
+        rows.append(first[connected])
+        cols.append(second[connected])
+    empty = np.zeros(0, dtype=np.int64)
+    return cell_of, np.concatenate(rows + [empty]), np.concatenate(cols + [empty])
+
+
+def weld_vertices(coordinates: np.ndarray, tolerance: float = 0.0) -> np.ndarray:
+    """Map every vertex to the first vertex it is welded to.
+
+    With ``tolerance == 0`` vertices are welded when their coordinates are equal,
+    otherwise when they are within ``tolerance`` of each other, transitively. Points
+    are hashed into grid cells of diagonal ``tolerance``; points in one cell are welded
+    directly and only points in neighbouring cells are compared. Returns an (N,) array
+    of representative vertex ids.
+    """
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    if tolerance < 0.0:
+        raise ValueError("tolerance must be non-negative")
+    if len(coordinates) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    if tolerance == 0.0:
+        _, first, inverse = np.unique(coordinates, axis=0, return_index=True, return_inverse=True)
+        return first[inverse.reshape(-1)].astype(np.int64)
+
+    cell_of, rows, cols = _connected_cells(coordinates, tolerance)
+    roots = union_find(int(cell_of.max()) + 1, rows, cols)[cell_of]
+    # Every component is represented by its smallest vertex id
+    first = np.full(len(coordinates), len(coordinates), dtype=np.int64)
+    np.minimum.at(first, roots, np.arange(len(coordinates), dtype=np.int64))
+    return first[roots]
+
+
+def face_vector_areas(coordinates: np.ndarray, offsets: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """Unsigned area of every polygonal face, from the shoelace sum over its boundary edges."""
+    start, end, face_ids = face_edges(offsets, indices)
+    p, q = coordinates[start], coordinates[end]
+    num_faces = len(offsets) - 1
+    if coordinates.shape[1] == 2:
+        twice = np.bincount(face_ids, weights=p[:, 0] * q[:, 1] - p[:, 1] * q[:, 0], minlength=num_faces)
+        return np.abs(twice) / 2.0
+    cross = np.cross(p, q)
+    twice = np.stack([np.bincount(face_ids, weights=cross[:, k], minlength=num_faces) for k in range(3)], axis=1)
+    return np.linalg.norm(twice, axis=1) / 2.0
+
+
+def degenerate_faces(coordinates: np.ndarray, offsets: np.ndarray, indices: np.ndarray, area_tolerance: float = 0.0) -> np.ndarray:
+    """Flag faces with fewer than three distinct vertices or with an area of at most ``area_tolerance``.
+
+    Triangles are additionally tested for exact collinearity, so rounding never hides
+    a degenerate triangle.
+    """
+    num_faces = len(offsets) - 1
+    sizes = np.diff(offsets)
+    start, end, face_ids = face_edges(offsets, indices)
+
+    # A repeated vertex id shows up as a zero-length edge or, for larger faces, as a
+    # repeated (face, vertex) pair
+    degenerate = np.zeros(num_faces, dtype=np.bool_)
+    degenerate[face_ids[start == end]] = True
+    pairs = np.stack([face_ids, indices], axis=1)
+    if len(pairs) > 0:
+        unique_pairs, counts = np.unique(pairs, axis=0, return_counts=True)
+        degenerate[unique_pairs[counts > 1, 0]] = True
+    degenerate |= sizes < 3
+
+    degenerate |= face_vector_areas(coordinates, offsets, indices) <= area_tolerance
+    triangles = np.flatnonzero((sizes == 3) & ~degenerate)
+    if len(triangles) > 0:
+        corners = indices[offsets[triangles][:, None] + np.arange(3)]
+        degenerate[triangles[triplet_collinear(coordinates[corners])]] = True
+    return degenerate
+
+
+def duplicate_faces(offsets: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """Flag every face using the same vertex set as an earlier face, whatever its orientation."""
+    if len(offsets) <= 1:
+        return np.zeros(0, dtype=np.bool_)
+    keys = np.sort(pad_faces(offsets, indices), axis=1)
+    _, first = np.unique(keys, axis=0, return_index=True)
+    duplicate = np.ones(len(keys), dtype=np.bool_)
+    duplicate[first] = False
+    return duplicate
+
+
+def select_faces(offsets: np.ndarray, indices: np.ndarray, keep: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the flat (offsets, indices) of the faces flagged in ``keep``."""
+    sizes = np.diff(offsets)
+    new_offsets = np.zeros(int(keep.sum()) + 1, dtype=np.int64)
+    np.cumsum(sizes[keep], out=new_offsets[1:])
+    return new_offsets, indices[np.repeat(keep, sizes)]
+
+
+def remove_unused_vertices(num_vertices: int, indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the ids of the vertices referenced by ``indices`` and the old-to-new id map (-1 if removed)."""
+    used = np.zeros(num_vertices, dtype=np.bool_)
+    used[indices] = True
+    kept = np.flatnonzero(used)
+    vertex_map = np.full(num_vertices, -1, dtype=np.int64)
+    vertex_map[kept] = np.arange(len(kept))
+    return kept, vertex_map
+
+
+def clean_mesh(
+    coordinates: np.ndarray,
+    offsets: np.ndarray,
+    indices: np.ndarray,
+    tolerance: float = 0.0,
+    area_tolerance: float = 0.0
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, dict]:
+    """Weld vertices, drop degenerate and duplicate faces, then drop unused vertices.
+
+    Returns the cleaned (coordinates, offsets, indices) and a report with the number
+    of welded vertices, degenerate faces, duplicate faces and unused vertices removed,
+    plus ``vertex_map`` (old vertex id to new id, -1 if removed) and the old ids of the
+    surviving vertices and faces in ``kept_vertices`` and ``kept_faces``.
+    """
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    num_vertices = len(coordinates)
+
+    representative = weld_vertices(coordinates, tolerance)
+    welded = int(np.count_nonzero(representative != np.arange(num_vertices)))
+    indices = representative[indices]
+
+    degenerate = degenerate_faces(coordinates, offsets, indices, area_tolerance)
+    kept_faces = np.flatnonzero(~degenerate)
+    offsets, indices = select_faces(offsets, indices, ~degenerate)
+
+    duplicate = duplicate_faces(offsets, indices)
+    kept_faces = kept_faces[~duplicate]
+    offsets, indices = select_faces(offsets, indices, ~duplicate)
+
+    kept, vertex_map = remove_unused_vertices(num_vertices, indices)
+    # Welded vertices follow their representative
+    vertex_map = vertex_map[representative]
+    report = {
+        "welded_vertices": welded,
+        "degenerate_faces": int(degenerate.sum()),
+        "duplicate_faces": int(duplicate.sum()),
+        "unused_vertices": num_vertices - welded - len(kept),
+        "vertex_map": vertex_map,
+        "kept_vertices": kept,
+        "kept_faces": kept_faces
+    }
+    return coordinates[kept], offsets, vertex_map[indices], report
@@ -1,11 +1,14 @@
-from ....core.vertex import Vertex2D, Vertex3D
-from ....core.utils.error import check_type, check_consistency
+from ....core.vertex import Vertex2D, Vertex3D, VertexArray2D
+from ....core.utils.error import check_type, check_consistency, trusted
 from ....core.mesh.triangle_mesh import TriangleMesh2D
 from ....core.shape.circle import Circle
 from ....functional.shape.form import circumcircle_vertices
+from ....functional.vertex.predicates import _orient2d, _incircle
 from ....core.mesh.edges.base import BaseEdge2D
+from ..topology import flatten_faces, unique_edges
 
 from tqdm import tqdm
+import numpy as np
 
 
 def is_delaunay(triangle: tuple[Vertex2D | Vertex3D, Vertex2D | Vertex3D, Vertex2D | Vertex3D], vertices: list[Vertex2D | Vertex3D]) -> bool:
@@ -21,9 +24,10 @@ def is_delaunay(triangle: tuple[Vertex2D | Vertex3D, Vertex2D | Vertex3D, Vertex
     return True
 
 
-def delaunay_triangulation_naive(vertices: list[Vertex2D], verbose: bool = False, progress_bar: bool = False, refine: bool = False) -> TriangleMesh2D:
-    check_type(vertices, list, "vertices")
-    check_consistency(vertices, "vertices")
+def delaunay_triangulation_naive(vertices: list[Vertex2D] | VertexArray2D, verbose: bool = False, progress_bar: bool = False, refine: bool = False) -> TriangleMesh2D:
+    check_type(vertices, (list, VertexArray2D), "vertices")
+    if isinstance(vertices, list):
+        check_consistency(vertices, "vertices")
     if len(vertices) == 0:
         raise ValueError("Vertex list is empty")
 
@@ -51,13 +55,13 @@ def delaunay_triangulation_naive(vertices: list[Vertex2D], verbose: bool = False
         if verbose:
             print("Start constructing base list of edges")
 
-        for triangle in tqdm(triangles, desc="Processing Triangles") if progress_bar else triangles:
-            if not is_delaunay(triangle, vertices):
-                triangles.remove(triangle)
-            else:
-                edges.append(BaseEdge2D(triangle[0], triangle[1]))
-                edges.append(BaseEdge2D(triangle[1], triangle[2]))
-                edges.append(BaseEdge2D(triangle[2], triangle[0]))
+        triangles = [
+            triangle for triangle in (tqdm(triangles, desc="Processing Triangles") if progress_bar else triangles)
+            if is_delaunay(triangle, vertices)
+        ]
+        # Every edge shared by several triangles is only built and tested once
+        unique, _ = unique_edges(*flatten_faces([[v.id for v in triangle] for triangle in triangles]), len(vertices))
+        edges = [BaseEdge2D(vertices[a], vertices[b]) for a, b in unique.tolist()]
 
         if verbose:
             print(f"Constructed {len(edges)} initial edges")
@@ -73,24 +77,21 @@ def delaunay_triangulation_naive(vertices: list[Vertex2D], verbose: bool = False
                     else:
                         bad_edges.append(e2)
 
-        for bad_edge in tqdm(bad_edges, desc="Processing Bad Edges") if progress_bar else bad_edges:
-            for edge in tqdm(edges, desc="Processing Edges") if progress_bar else edges:
-                if bad_edge == edge:
-                    edges.remove(bad_edge)
+        bad_edge_set = set(tqdm(bad_edges, desc="Processing Bad Edges") if progress_bar else bad_edges)
+        edges = [edge for edge in edges if edge not in bad_edge_set]
 
         if verbose:
             print(f"Removed {len(bad_edges)} bad edges")
             print("Start constructing final list of triangles")
         
         triangles_ids: list[list[int, int, int]] = []
-        edge_tuples = [(e.start, e.end) for e in edges]
+        # Vertices hash by their coordinates, so membership tests are O(1)
+        edge_tuples = {(e.start, e.end) for e in edges} | {(e.end, e.start) for e in edges}
         for v1 in tqdm(vertices, desc="Processing Vertices") if progress_bar else vertices:
             for v2 in tqdm(vertices, desc="Processing Vertices") if progress_bar else vertices:
                 for v3 in tqdm(vertices, desc="Processing Vertices") if progress_bar else vertices:
                     if v1 != v2 and v2 != v3 and v1 != v3:
-                        if ((v1, v2) in edge_tuples or (v2, v1) in edge_tuples) and \
-                        ((v2, v3) in edge_tuples or (v3, v2) in edge_tuples) and \
-                        ((v3, v1) in edge_tuples or (v1, v3) in edge_tuples):
+                        if (v1, v2) in edge_tuples and (v2, v3) in edge_tuples and (v3, v1) in edge_tuples:
                             triangles_ids.append([v1.id, v2.id, v3.id])
 
     else:
@@ -98,4 +99,180 @@ def delaunay_triangulation_naive(vertices: list[Vertex2D], verbose: bool = False
             [v1.id, v2.id, v3.id] for v1, v2, v3 in triangles
         ]
 
-    return TriangleMesh2D(vertices, triangles_ids)
\ No newline at end of file
+    return TriangleMesh2D(vertices, triangles_ids)
+
+def _hilbert_order(coordinates: np.ndarray, bits: int = 16) -> np.ndarray:
+    """Return the permutation sorting 2D points along a Hilbert curve over their bounding box."""
+    side = 1 << bits
+    lower = coordinates.min(axis=0)
+    extent = np.maximum(coordinates.max(axis=0) - lower, np.finfo(np.float64).tiny)
+    grid = ((coordinates - lower) / extent * (side - 1)).astype(np.int64)
+    x, y = grid[:, 0].copy(), grid[:, 1].copy()
+
+    d = np.zeros(len(coordinates), dtype=np.int64)
+    s = side // 2
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s * s * ((3 * rx) ^ ry)
+        flip = ~ry & rx
+        x = np.where(flip, side - 1 - x, x)
+        y = np.where(flip, side - 1 - y, y)
+        swap = ~ry
+        x, y = np.where(swap, y, x), np.where(swap, x, y)
+        s //= 2
+    return np.argsort(d, kind="stable")
+
+
+def _bowyer_watson(coordinates: np.ndarray, progress_bar: bool = False) -> list[list[int]]:
+    """Incremental Bowyer-Watson triangulation of an (N, 2) array; returns counter-clockwise vertex id triples.
+
+    The hull is closed with ghost triangles sharing one vertex at infinity, so no
+    super triangle is needed and the convex hull comes out exact. Triangle ``t`` has
+    vertices ``tv[t]`` and ``tn[t][i]`` is the triangle across the edge opposite ``tv[t][i]``.
+    """
+    n = len(coordinates)
+    xs, ys = coordinates[:, 0].tolist(), coordinates[:, 1].tolist()
+    order = _hilbert_order(coordinates).tolist()
+    ghost = n
+
+    # Seed with the first three non-collinear points in insertion order
+    a = order[0]
+    b = next((i for i in order if xs[i] != xs[a] or ys[i] != ys[a]), None)
+    c = None if b is None else next(
+        (i for i in order if _orient2d(xs[a], ys[a], xs[b], ys[b], xs[i], ys[i]) != 0.0), None
+    )
+    if c is None:
+        raise ValueError("Cannot triangulate vertices that are all collinear")
+    if _orient2d(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]) < 0.0:
+        b, c = c, b
+
+    tv = [[a, b, c], [c, b, ghost], [a, c, ghost], [b, a, ghost]]
+    tn = [[1, 2, 3], [3, 2, 0], [1, 3, 0], [2, 1, 0]]
+    free: list[int] = []
+
+    def in_circumcircle(t: int, px: float, py: float) -> bool:
+        u, v, w = tv[t]
+        if w == ghost or u == ghost or v == ghost:
+            # Ghost triangle: its "circumcircle" is the open half-plane beyond the hull edge
+            if u == ghost:
+                u, v = v, w
+            elif v == ghost:
+                u, v = w, u
+            o = _orient2d(xs[u], ys[u], xs[v], ys[v], px, py)
+            if o != 0.0:
+                return o > 0.0
+            return (px - xs[u]) * (xs[v] - xs[u]) + (py - ys[u]) * (ys[v] - ys[u]) > 0.0 and \
+                (px - xs[v]) * (xs[u] - xs[v]) + (py - ys[v]) * (ys[u] - ys[v]) > 0.0
+        return _incircle(xs[u], ys[u], xs[v], ys[v], xs[w], ys[w], px, py) > 0.0
+
+    last = 0
+    seeds = {a, b, c}
+    for step, p in enumerate(tqdm(order, desc="Inserting Vertices") if progress_bar else order):
+        if p in seeds:
+            continue
+        px, py = xs[p], ys[p]
+
+        # Locate by walking from the last created triangle towards p
+        t = last
+        if ghost in tv[t]:
+            t = tn[t][tv[t].index(ghost)]
+        rotation = step
+        while True:
+            verts = tv[t]
+            if ghost in verts:
+                break
+            moved = False
+            for k in range(3):
+                i = (k + rotation) % 3
+                u, v = verts[(i + 1) % 3], verts[(i + 2) % 3]
+                if _orient2d(xs[u], ys[u], xs[v], ys[v], px, py) < 0.0:
+                    t = tn[t][i]
+                    moved = True
+                    break
+            if not moved:
+                break
+            rotation += 1
+
+        if any(v != ghost and xs[v] == px and ys[v] == py for v in tv[t]):
+            continue
+
+        # Collect the cavity of triangles whose circumcircle contains p
+        cavity = {t}
+        stack = [t]
+        boundary = []
+        while stack:
+            s = stack.pop()
+            verts, neighbors = tv[s], tn[s]
+            for i in range(3):
+                o = neighbors[i]
+                if o in cavity:
+                    continue
+                if in_circumcircle(o, px, py):
+                    cavity.add(o)
+                    stack.append(o)
+                else:
+                    boundary.append((verts[(i + 1) % 3], verts[(i + 2) % 3], o, tn[o].index(s)))
+
+        # Re-triangulate the cavity as a fan around p, reusing freed slots
+        free.extend(cavity)
+        by_start, by_end = {}, {}
+        created = []
+        for u, v, o, j in boundary:
+            if free:
+                r = free.pop()
+                tv[r] = [p, u, v]
+                tn[r] = [o, -1, -1]
+            else:
+                r = len(tv)
+                tv.append([p, u, v])
+                tn.append([o, -1, -1])
+            tn[o][j] = r
+            by_start[u] = r
+            by_end[v] = r
+            created.append(r)
+        for r in created:
+            _, u, v = tv[r]
+            tn[r][1] = by_start[v]
+            tn[r][2] = by_end[u]
+        last = created[0]
+
+    alive = [True] * len(tv)
+    for r in free:
+        alive[r] = False
+    return [verts for t, verts in enumerate(tv) if alive[t] and ghost not in verts]
+
+
+def delaunay_triangulation(vertices: list[Vertex2D] | VertexArray2D, verbose: bool = False, progress_bar: bool = False) -> TriangleMesh2D:
+    """Build the Delaunay triangulation with incremental Bowyer-Watson insertion.
+
+    Points are inserted along a Hilbert curve and located by walking from the
+    previously inserted point, giving expected O(n log n) time. Duplicate points are
+    skipped and remain unreferenced vertices of the returned mesh.
+    """
+    check_type(vertices, (list, VertexArray2D), "vertices")
+    if isinstance(vertices, list):
+        check_consistency(vertices, "vertices")
+        if len(vertices) > 0:
+            check_type(vertices[0], Vertex2D, "vertices")
+    if len(vertices) < 3:
+        raise ValueError("At least three vertices are required for a triangulation")
+
+    if isinstance(vertices, VertexArray2D):
+        coordinates = vertices.coordinates
+        vertices.ids[:] = np.arange(len(vertices))
+    else:
+        coordinates = np.array([v.coordinates for v in vertices], dtype=np.float64)
+        for idx, vertice in enumerate(vertices):
+            vertice.id = idx
+
+    if verbose:
+        print(f"Start inserting {len(vertices)} vertices")
+
+    triangles_ids = _bowyer_watson(coordinates, progress_bar)
+
+    if verbose:
+        print(f"Constructed {len(triangles_ids)} triangles")
+
+    with trusted():
+        return TriangleMesh2D(vertices, triangles_ids)
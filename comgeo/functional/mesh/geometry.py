@@ -0,0 +1,171 @@
+import numpy as np
+
+
+def triangle_areas(a: np.ndarray, b: np.ndarray, c: np.ndarray, signed: bool = False) -> np.ndarray:
+    """Areas of the triangles (a[i], b[i], c[i]) for (N, 2) or (N, 3) corner arrays.
+
+    Signed areas are only defined in 2D, where counter-clockwise triangles are positive.
+    """
+    u = b - a
+    v = c - a
+    if a.shape[1] == 2:
+        cross = (u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]) / 2.0
+        return cross if signed else np.abs(cross)
+    if signed:
+        raise ValueError("Signed areas are only defined for 2D triangles")
+    cross = np.cross(u, v)
+    return np.sqrt(np.einsum("ij,ij->i", cross, cross)) / 2.0
+
+
+def _doubled_area_vectors(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """Signed doubled areas as (n, 1) in 2D and doubled area vectors as (n, 3) in 3D."""
+    u, v = b - a, c - a
+    if a.shape[-1] == 2:
+        return (u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0])[:, None]
+    return _cross(u, v)
+
+
+def quad_split(a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Diagonal and triangle areas of the quads (a[i], b[i], c[i], d[i]).
+
+    Quads are split along the 0-2 diagonal, or along 1-3 (``flip``) when the triangles
+    0-1-2 and 0-2-3 face opposite ways, i.e. when 0-2 lies outside a concave quad.
+    Returns ``flip`` and the unsigned areas of the two triangles, 0-1-2 and 0-2-3 or
+    0-1-3 and 1-2-3.
+    """
+    n012, n023 = _doubled_area_vectors(a, b, c), _doubled_area_vectors(a, c, d)
+    flip = np.sum(n012 * n023, axis=1) < 0.0
+    first = np.where(flip, np.linalg.norm(_doubled_area_vectors(a, b, d), axis=1), np.linalg.norm(n012, axis=1))
+    second = np.where(flip, np.linalg.norm(_doubled_area_vectors(b, c, d), axis=1), np.linalg.norm(n023, axis=1))
+    return flip, first / 2.0, second / 2.0
+
+
+def face_areas(coordinates: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Unsigned areas of every face of an (F, 3) triangle or (F, 4) quad index array.
+
+    Quads are split like quad_split, the same triangles the samplers draw from.
+    """
+    if faces.ndim != 2 or faces.shape[1] not in (3, 4):
+        raise ValueError(f"faces must have shape (F, 3) or (F, 4), got {faces.shape}")
+    a = coordinates[faces[:, 0]]
+    b = coordinates[faces[:, 1]]
+    c = coordinates[faces[:, 2]]
+    if faces.shape[1] == 3:
+        return triangle_areas(a, b, c)
+
+    _, first, second = quad_split(a, b, c, coordinates[faces[:, 3]])
+    return first + second
+
+
+def _fan_cross_products(coordinates: np.ndarray, offsets: np.ndarray, indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Face ids and edge cross products of the fan triangles (first, c, c + 1) of every face.
+
+    Cross products are scalars in 2D and vectors in 3D; their sum over a face is twice
+    its (vector) area.
+    """
+    sizes = np.diff(offsets)
+    face_ids = np.repeat(np.arange(len(sizes), dtype=np.int64), sizes)
+    local = np.arange(len(indices), dtype=np.int64) - offsets[face_ids]
+    fan = np.flatnonzero((local > 0) & (local < sizes[face_ids] - 1))
+    a = coordinates[indices[offsets[face_ids[fan]]]]
+    u = coordinates[indices[fan]] - a
+    v = coordinates[indices[fan + 1]] - a
+    if coordinates.shape[1] == 2:
+        return face_ids[fan], u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]
+    return face_ids[fan], _cross(u, v)
+
+
+def _cross(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Row-wise cross products of two (K, 3) arrays, without the overhead of np.cross."""
+    cross = np.empty_like(u)
+    cross[:, 0] = u[:, 1] * v[:, 2] - u[:, 2] * v[:, 1]
+    cross[:, 1] = u[:, 2] * v[:, 0] - u[:, 0] * v[:, 2]
+    cross[:, 2] = u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]
+    return cross
+
+
+def _sum_rows(face_ids: np.ndarray, values: np.ndarray, num_faces: int) -> np.ndarray:
+    """Sums of the rows of the (K, d) array ``values`` grouped by ``face_ids``."""
+    return np.stack([np.bincount(face_ids, weights=values[:, k], minlength=num_faces) for k in range(values.shape[1])], axis=1)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale the rows to unit length, leaving zero rows at zero."""
+    lengths = np.linalg.norm(vectors, axis=1)
+    normals = np.zeros_like(vectors)
+    np.divide(vectors, lengths[:, None], out=normals, where=lengths[:, None] > 0.0)
+    return normals
+
+
+def face_geometry(coordinates: np.ndarray, offsets: np.ndarray, indices: np.ndarray) -> dict[str, np.ndarray | None]:
+    """Areas, vertex centroids, bounding boxes and unit normals of every polygonal face.
+
+    Faces are given as flat (offsets, indices) arrays and fanned from their first corner,
+    except that quads are split like quad_split, so areas match get_area. Bounds have shape (F, 2, dim) with
+    the minimum corner first. Normals are the normalised vector areas in 3D (zero for
+    degenerate faces) and None in 2D.
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    indices = np.asarray(indices, dtype=np.int64)
+    sizes = np.diff(offsets)
+    if np.any(sizes < 3):
+        raise ValueError("Every face needs at least 3 vertices")
+    num_faces = len(sizes)
+    corners = coordinates[indices]
+    starts = offsets[:-1]
+
+    centroids = np.add.reduceat(corners, starts, axis=0) / sizes[:, None]
+    bounds = np.stack([np.minimum.reduceat(corners, starts, axis=0), np.maximum.reduceat(corners, starts, axis=0)], axis=1)
+
+    face_ids, cross = _fan_cross_products(coordinates, offsets, indices)
+    quads = np.flatnonzero(sizes == 4)
+    quad_corners = coordinates[indices[starts[quads, None] + np.arange(4)]]
+    if coordinates.shape[1] == 2:
+        areas = np.abs(np.bincount(face_ids, weights=cross, minlength=num_faces)) / 2.0
+        areas[quads] = sum(quad_split(*quad_corners.transpose(1, 0, 2))[1:])
+        return {"areas": areas, "centroids": centroids, "bounds": bounds, "normals": None}
+
+    areas = np.bincount(face_ids, weights=np.sqrt(np.einsum("ij,ij->i", cross, cross)), minlength=num_faces) / 2.0
+    areas[quads] = sum(quad_split(*quad_corners.transpose(1, 0, 2))[1:])
+    # The vector area does not depend on the split
+    normals = _normalize(_sum_rows(face_ids, cross, num_faces))
+    return {"areas": areas, "centroids": centroids, "bounds": bounds, "normals": normals}
+
+
+def vertex_normals(coordinates: np.ndarray, offsets: np.ndarray, indices: np.ndarray, weighting: str = "area") -> np.ndarray:
+    """Unit normals of the vertices of a 3D polygon mesh, from one scatter-add over the face corners.
+
+    Every corner adds the normal of its face weighted by the face area (``"area"``), by
+    the corner angle (``"angle"``) or by one (``"uniform"``). Vertices used by no face, or
+    whose contributions cancel, get a zero normal.
+    """
+    if coordinates.shape[1] != 3:
+        raise ValueError(f"Vertex normals are only defined for 3D meshes, got {coordinates.shape[1]}D coordinates")
+    if weighting not in ("area", "angle", "uniform"):
+        raise ValueError(f"weighting must be 'area', 'angle' or 'uniform', got {weighting!r}")
+    offsets = np.asarray(offsets, dtype=np.int64)
+    indices = np.asarray(indices, dtype=np.int64)
+    sizes = np.diff(offsets)
+    num_faces = len(sizes)
+
+    face_ids, cross = _fan_cross_products(coordinates, offsets, indices)
+    # The summed cross products are twice the vector areas, which already carry the area weight
+    face_vectors = _sum_rows(face_ids, cross, num_faces)
+    if weighting != "area":
+        face_vectors = _normalize(face_vectors)
+    corner_faces = np.repeat(np.arange(num_faces, dtype=np.int64), sizes)
+    weights = face_vectors[corner_faces]
+
+    if weighting == "angle":
+        corners = np.arange(len(indices), dtype=np.int64)
+        local = corners - offsets[corner_faces]
+        following = np.where(local == sizes[corner_faces] - 1, offsets[corner_faces], corners + 1)
+        preceding = np.where(local == 0, offsets[corner_faces + 1] - 1, corners - 1)
+        points = coordinates[indices]
+        u = points[following] - points
+        v = points[preceding] - points
+        cross = _cross(u, v)
+        angles = np.arctan2(np.sqrt(np.einsum("ij,ij->i", cross, cross)), np.einsum("ij,ij->i", u, v))
+        weights = weights * angles[:, None]
+
+    return _normalize(_sum_rows(indices, weights, len(coordinates)))
@@ -0,0 +1,78 @@
+import numpy as np
+import json
+import struct
+
+
+# File layout: MAGIC, a little-endian (version, header size) pair, a JSON header
+# describing every array, then the raw arrays, each starting on an ALIGNMENT boundary.
+MAGIC = b"COMGEO\x00\x00"
+VERSION = 1
+ALIGNMENT = 64
+_PREAMBLE = struct.Struct("<8sII")
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def save_cgm(file_path: str, vertices: np.ndarray, faces: np.ndarray, attributes: dict[str, np.ndarray] | None = None):
+    """Write a mesh to the native binary ``.cgm`` container.
+
+    ``vertices`` is (N, dim), ``faces`` is (F, kmax) padded with -1 and every entry of
+    ``attributes`` is stored as an extra named array.
+    """
+    arrays = {"vertices": np.ascontiguousarray(vertices, dtype=np.float64),
+              "faces": np.ascontiguousarray(faces, dtype=np.int64)}
+    if arrays["vertices"].ndim != 2 or arrays["faces"].ndim != 2:
+        raise ValueError("vertices and faces must be 2D arrays")
+    for name, array in (attributes or {}).items():
+        if name in arrays:
+            raise ValueError(f"Attribute name {name} is reserved")
+        arrays[name] = np.ascontiguousarray(array)
+
+    # The header size depends on the offsets it stores, so lay out the arrays
+    # against a generous upper bound on its length
+    entries = {name: {"dtype": array.dtype.str, "shape": list(array.shape), "offset": 0} for name, array in arrays.items()}
+    reserve = _align(_PREAMBLE.size + len(json.dumps({"arrays": entries})) + 32 * len(entries))
+    offset = reserve
+    for name, array in arrays.items():
+        entries[name]["offset"] = offset
+        offset = _align(offset + array.nbytes)
+    header = json.dumps({"arrays": entries}).encode("utf-8")
+
+    with open(file_path, "wb") as file:
+        file.write(_PREAMBLE.pack(MAGIC, VERSION, len(header)))
+        file.write(header)
+        for name, array in arrays.items():
+            file.write(b"\x00" * (entries[name]["offset"] - file.tell()))
+            array.tofile(file)
+
+
+def read_cgm_header(file_path: str) -> dict:
+    """Read the JSON header of a ``.cgm`` file."""
+    with open(file_path, "rb") as file:
+        preamble = file.read(_PREAMBLE.size)
+        if len(preamble) != _PREAMBLE.size:
+            raise ValueError(f"{file_path} is not a cgm file")
+        magic, version, size = _PREAMBLE.unpack(preamble)
+        if magic != MAGIC:
+            raise ValueError(f"{file_path} is not a cgm file")
+        if version > VERSION:
+            raise ValueError(f"Unsupported cgm version {version}, expected at most {VERSION}")
+        return json.loads(file.read(size).decode("utf-8"))
+
+
+def load_cgm(file_path: str, mmap_mode: str = "r") -> tuple[np.ndarray, np.ndarray, dict[str, np.ndarray]]:
+    """Open a ``.cgm`` file and return (vertices, faces, attributes) as memory-mapped arrays.
+
+    Nothing is parsed or copied: pages are only read when the arrays are accessed.
+    Use ``mmap_mode="c"`` for writable copy-on-write arrays.
+    """
+    arrays = {}
+    for name, entry in read_cgm_header(file_path)["arrays"].items():
+        dtype, shape = np.dtype(entry["dtype"]), tuple(entry["shape"])
+        if int(np.prod(shape)) == 0:
+            arrays[name] = np.zeros(shape, dtype=dtype)
+        else:
+            arrays[name] = np.memmap(file_path, dtype=dtype, mode=mmap_mode, offset=entry["offset"], shape=shape)
+    return arrays.pop("vertices"), arrays.pop("faces"), arrays
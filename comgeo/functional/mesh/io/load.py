@@ -1,45 +1,50 @@
-from ....core.vertex import Vertex2D, Vertex3D
-from .obj import read_obj
+from ....core.vertex import Vertex2D, Vertex3D, VertexArray, VertexArray2D, VertexArray3D
+from ..topology import face_lists
+from .obj import read_obj_arrays
+from .cgm import load_cgm
 
+import numpy as np
 import os
 
-def load_mesh(file_path: str, dim: int = 2, verbose: bool = False) -> tuple[list[Vertex2D | Vertex3D], list[list[int]]]:
 
+def load_mesh(file_path: str, dim: int = 2, verbose: bool = False, as_array: bool = False) -> tuple[list[Vertex2D | Vertex3D] | VertexArray, list[list[int]] | np.ndarray]:
+    """Load the vertices and faces of a mesh file.
+
+    With ``as_array`` the vertices come back as a VertexArray2D/VertexArray3D and the
+    faces as an (F, kmax) int64 array padded with -1, without creating any per-vertex
+    or per-face Python objects. ``.cgm`` files are memory-mapped rather than read, and a
+    mesh built on the returned arrays only reads the pages it uses. Without ``as_array``
+    the whole file is read into vertex objects and face lists.
+    Vertex normals stored with a 3D mesh, one per vertex, are set on the Vertex3D objects
+    or become the normals column of the VertexArray3D.
+    """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
+    if dim not in (2, 3):
+        raise ValueError("dim must be 2 or 3")
 
     extension = file_path.split('.')[-1]
     if extension == 'obj':
-        _vertices, _vertices_normal, faces = read_obj(file_path, verbose)
-        vertices = []
-
-        vertex_id = 0
-
+        coordinates, normals, faces = read_obj_arrays(file_path, verbose)
+        if np.isnan(coordinates).any():
+            raise Warning(f"Identified vertices with fewer than {coordinates.shape[1]} coordinates")
+    elif extension == 'cgm':
+        coordinates, faces, attributes = load_cgm(file_path)
+        normals = attributes.get("normals")
+    else:
+        raise ValueError(f"Unsupported mesh file extension: {extension}")
+
+    if coordinates.shape[1] != dim:
+        raise Warning(f"Identified vertices with {coordinates.shape[1]} coordinates, expected {dim}")
+
+    ids = np.arange(len(coordinates))
+    if normals is not None and normals.shape != coordinates.shape:
+        normals = None
+    if as_array:
         if dim == 2:
-            for v in _vertices:
-                if len(v) != 2:
-                    raise Warning(f"Identified vertex with {len(v)} coordinates: {v}, skip it")
-                    continue
-                vertex = Vertex2D(v[0], v[1], vertex_id)
-                vertices.append(vertex)
-                vertex_id += 1
-
-        elif dim == 3:
-            # for v, vn in zip(_vertices, _vertices_normal):
-            #     if len(v) != 3:
-            #         raise Warning(f"Identified vertex with {len(v)} coordinates, skip it")
-            #         continue
-            #     vertex = Vertex3D(v[0], v[1], v[2], vertex_id)
-            #     vertex.normal = vn
-            #     vertices.append(vertex)
-            #     vertex_id += 1
-
-            for v in _vertices:
-                if len(v) != 3:
-                    raise Warning(f"Identified vertex with {len(v)} coordinates: {v}, skip it")
-                    continue
-                vertex = Vertex3D(v[0], v[1], v[2], vertex_id)
-                vertices.append(vertex)
-                vertex_id += 1
-        
-        return vertices, faces
\ No newline at end of file
+            return VertexArray2D(coordinates, ids=ids), faces
+        return VertexArray3D(coordinates, ids=ids, normals=normals), faces
+
+    if dim == 2:
+        return Vertex2D.from_array(coordinates, ids=ids), face_lists(faces)
+    return Vertex3D.from_array(coordinates, ids=ids, normals=normals), face_lists(faces)
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def read_obj(file_path: str, verbose: bool = False) -> tuple[list[list[float]], list[list[float]], list[list[int]]]:
     vertices = []
     vertices_normal = []
@@ -19,9 +22,139 @@ def read_obj(file_path: str, verbose: bool = False) -> tuple[list[list[float]],
                 if verbose:
                     print(f"Vertex found: {line} -> {strip} -> {vertex}")
                 vertices.append(vertex)
-            # elif split[0] == "vn":
-            #     vertices_normal.append([float(coord) for coord in split[1:]])
+            elif split[0] == "vn":
+                vertices_normal.append([float(coord) for coord in split[1:]])
             elif split[0] == "f":
                 faces.append([int(face.split('/')[0]) - 1 for face in split[1:]])
 
-    return vertices, vertices_normal, faces
\ No newline at end of file
+    return vertices, vertices_normal, faces
+
+_WHITESPACE = np.zeros(256, dtype=np.bool_)
+_WHITESPACE[[ord(c) for c in " \t\r\n\v\f"]] = True
+
+
+def _tagged_lines(buffer: np.ndarray, starts: np.ndarray, ends: np.ndarray, tag: bytes) -> np.ndarray:
+    """Return a mask of the lines whose first token is exactly ``tag``."""
+    width = len(tag)
+    mask = ends - starts > width
+    for k, char in enumerate(tag):
+        mask[mask] = buffer[starts[mask] + k] == char
+    mask[mask] = _WHITESPACE[buffer[starts[mask] + width]]
+    return mask
+
+
+def _record_text(buffer: np.ndarray, starts: np.ndarray, ends: np.ndarray, width: int) -> np.ndarray:
+    """Concatenate the selected lines without their leading tag, one record per newline-terminated line."""
+    bounds = np.empty(2 * len(starts) + 2, dtype=np.int64)
+    bounds[0], bounds[-1] = 0, len(buffer)
+    bounds[1:-1:2] = starts + width
+    bounds[2:-1:2] = ends + 1
+    keep = np.zeros(len(bounds) - 1, dtype=np.bool_)
+    keep[1::2] = True
+    return buffer[np.repeat(keep, np.diff(bounds))]
+
+
+def _parse_records(chars: np.ndarray, dtype: type) -> tuple[np.ndarray, np.ndarray]:
+    """Parse newline-terminated whitespace separated records into (values, counts per record).
+
+    Tokens of the form ``a/b/c`` contribute only their leading number ``a``.
+    """
+    newlines = np.flatnonzero(chars == ord("\n"))
+    if len(newlines) == 0:
+        return np.zeros(0, dtype=dtype), np.zeros(0, dtype=np.int64)
+
+    blank = _WHITESPACE[chars]
+    token_start = ~blank
+    token_start[1:] &= blank[:-1]
+    offsets = np.concatenate([[0], newlines[:-1] + 1])
+    counts = np.add.reduceat(token_start, offsets, dtype=np.int64)
+
+    slash = chars == ord("/")
+    if slash.any():
+        chars = np.where(slash, np.uint8(ord(" ")), chars)
+        blank |= slash
+        number_start = ~blank
+        number_start[1:] &= blank[:-1]
+        pick = np.searchsorted(np.flatnonzero(number_start), np.flatnonzero(token_start))
+        values = np.fromstring(chars.tobytes(), dtype=dtype, sep=" ")
+        if len(values) != number_start.sum():
+            raise ValueError("Malformed OBJ record: could not parse every token as a number")
+        return values[pick], counts
+
+    values = np.fromstring(chars.tobytes(), dtype=dtype, sep=" ")
+    if len(values) != counts.sum():
+        raise ValueError("Malformed OBJ record: could not parse every token as a number")
+    return values, counts
+
+
+def _pad_rows(values: np.ndarray, counts: np.ndarray, fill) -> np.ndarray:
+    """Scatter ragged records into an (R, max count) array padded with ``fill``."""
+    width = int(counts.max()) if len(counts) > 0 else 0
+    if np.all(counts == width):
+        return values.reshape(len(counts), width)
+    rows = np.repeat(np.arange(len(counts)), counts)
+    cols = np.arange(len(values)) - np.repeat(np.cumsum(counts) - counts, counts)
+    padded = np.full((len(counts), width), fill, dtype=values.dtype)
+    padded[rows, cols] = values
+    return padded
+
+
+def read_obj_arrays(file_path: str, verbose: bool = False) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Read the ``v``, ``vn`` and ``f`` records of an OBJ file into contiguous arrays.
+
+    The whole file is classified and parsed with NumPy instead of line by line.
+    Returns (vertices, normals, faces): vertices is (N, k) float64 (NaN padded if
+    records have different lengths), normals is (M, 3) and faces is (F, kmax) int64
+    with zero-based vertex ids, padded with -1 for faces with fewer corners.
+    Texture and normal references in face corners are ignored; negative (relative)
+    ids are resolved against the vertices defined before the face. Records may be
+    indented and their tokens separated by any whitespace.
+    """
+    with open(file_path, "rb") as file:
+        data = file.read()
+    if not data.endswith(b"\n"):
+        data += b"\n"
+    buffer = np.frombuffer(data, dtype=np.uint8)
+
+    ends = np.flatnonzero(buffer == ord("\n"))
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    # Skip the indentation: every line starts at its first non-whitespace character,
+    # or at its newline when it is blank
+    non_blank = np.flatnonzero(~_WHITESPACE[buffer])
+    first = np.searchsorted(non_blank, starts)
+    starts = np.minimum(np.append(non_blank, len(buffer))[first], ends)
+
+    is_vertex = _tagged_lines(buffer, starts, ends, b"v")
+    is_normal = _tagged_lines(buffer, starts, ends, b"vn")
+    is_face = _tagged_lines(buffer, starts, ends, b"f")
+
+    values, counts = _parse_records(_record_text(buffer, starts[is_vertex], ends[is_vertex], 1), np.float64)
+    vertices = _pad_rows(values, counts, np.nan)
+
+    values, counts = _parse_records(_record_text(buffer, starts[is_normal], ends[is_normal], 2), np.float64)
+    normals = _pad_rows(values, counts, np.nan)
+    if normals.size > 0 and normals.shape[1] != 3:
+        raise ValueError(f"Vertex normals must have 3 components, got {normals.shape[1]}")
+    normals = normals.reshape(-1, 3)
+
+    values, counts = _parse_records(_record_text(buffer, starts[is_face], ends[is_face], 1), np.int64)
+    seen = np.cumsum(is_vertex)[is_face]
+    values = np.where(values < 0, np.repeat(seen, counts) + values, values - 1)
+    faces = _pad_rows(values, counts, -1)
+
+    if verbose:
+        print(f"Read {len(vertices)} vertices, {len(normals)} normals and {len(faces)} faces from {file_path}")
+
+    return vertices, normals, faces
+
+
+def write_obj(file_path: str, vertices: np.ndarray, faces: np.ndarray, normals: np.ndarray | None = None):
+    """Write (N, dim) vertices, optional (N, 3) normals and (F, kmax) faces padded with -1 to an OBJ file."""
+    with open(file_path, "w") as file:
+        np.savetxt(file, vertices, fmt="v" + " %.17g" * vertices.shape[1])
+        if normals is not None:
+            np.savetxt(file, normals, fmt="vn %.17g %.17g %.17g")
+        if len(faces) > 0 and np.all(faces[:, -1] >= 0):
+            np.savetxt(file, faces + 1, fmt="f" + " %d" * faces.shape[1])
+        else:
+            file.writelines("f " + " ".join(str(i + 1) for i in face if i >= 0) + "\n" for face in faces.tolist())
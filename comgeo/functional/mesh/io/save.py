@@ -0,0 +1,18 @@
+from .cgm import save_cgm
+from .obj import write_obj
+
+import numpy as np
+
+
+def save_mesh(file_path: str, vertices: np.ndarray, faces: np.ndarray, attributes: dict[str, np.ndarray] | None = None):
+    """Save (N, dim) vertices and (F, kmax) faces padded with -1, choosing the format from the extension.
+
+    ``.cgm`` keeps every attribute; ``.obj`` only keeps a ``normals`` attribute.
+    """
+    extension = file_path.split('.')[-1]
+    if extension == 'cgm':
+        save_cgm(file_path, vertices, faces, attributes)
+    elif extension == 'obj':
+        write_obj(file_path, vertices, faces, (attributes or {}).get("normals"))
+    else:
+        raise ValueError(f"Unsupported mesh file extension: {extension}")
@@ -0,0 +1,216 @@
+from .geometry import face_areas
+from ..polygon.point_cloud import quad_weights, triangle_weights
+from ...core.utils.parallel import chunk_ranges, get_backend
+from ...core.utils.shared import SharedArray
+
+from typing import Iterator
+import contextlib
+import numbers
+import os
+
+import numpy as np
+
+
+def barycentric_weights(corners: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Draw area-uniform corner weights for (n, k, dim) triangle or quad corners.
+
+    Uses the same mappings as functional/polygon/point_cloud.py, so quads are sampled
+    exactly uniformly by area rather than uniformly in their bilinear parameters.
+    """
+    num_points, num_vertices = corners.shape[:2]
+    samples = np.stack([rng.random(num_points), rng.random(num_points)], axis=1)
+    if num_vertices == 3:
+        return triangle_weights(samples)
+    if num_vertices == 4:
+        return quad_weights(corners, samples)
+    raise ValueError(f"Sampling is only supported for triangle and quad faces, got {num_vertices} vertices")
+
+
+def interpolate(coordinates: np.ndarray, faces: np.ndarray, face_index: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Evaluate the weighted corner sum of face_index[i] for every sample i."""
+    corners = faces[face_index]
+    points = weights[:, 0:1] * coordinates[corners[:, 0]]
+    for j in range(1, faces.shape[1]):
+        points += weights[:, j:j + 1] * coordinates[corners[:, j]]
+    return points
+
+
+def _sample_chunk(coordinates: np.ndarray | SharedArray, faces: np.ndarray | SharedArray, face_index: np.ndarray, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    coordinates, faces = np.asarray(coordinates), np.asarray(faces)
+    weights = barycentric_weights(coordinates[faces[face_index]], rng)
+    return interpolate(coordinates, faces, face_index, weights), weights
+
+
+def _face_counts(coordinates: np.ndarray, faces: np.ndarray, num_points: int, rng: np.random.Generator, areas: np.ndarray | None) -> np.ndarray:
+    """Number of samples on every face, a single multinomial draw weighted by face area."""
+    if not _is_integer(num_points) or num_points < 0:
+        raise ValueError(f"num_points must be a non-negative int, got {num_points}")
+    num_points = int(num_points)
+    if areas is None:
+        areas = face_areas(coordinates, faces)
+    total_area = areas.sum()
+    if not total_area > 0.0:
+        raise ValueError("Cannot sample a mesh with zero total area")
+    return rng.multinomial(num_points, areas / total_area)
+
+
+def _is_integer(value) -> bool:
+    """Whether value is a Python or NumPy integer; bools are rejected."""
+    return isinstance(value, numbers.Integral) and not isinstance(value, (bool, np.bool_))
+
+
+def _check_chunk_size(chunk_size: int) -> int:
+    if not _is_integer(chunk_size) or chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive int, got {chunk_size}")
+    return int(chunk_size)
+
+
+def _pack(points: np.ndarray, face_index: np.ndarray, weights: np.ndarray, return_face_index: bool, return_barycentric: bool) -> np.ndarray | tuple[np.ndarray, ...]:
+    if not (return_face_index or return_barycentric):
+        return points
+    result = (points,)
+    if return_face_index:
+        result += (face_index,)
+    if return_barycentric:
+        result += (weights,)
+    return result
+
+
+def _iter_chunks(
+    coordinates: np.ndarray,
+    faces: np.ndarray,
+    counts: np.ndarray,
+    chunk_size: int,
+    rng: np.random.Generator
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Yield (points, face_index, weights) for consecutive chunks of the samples allotted by ``counts``.
+
+    Only the cumulative counts are kept besides the current chunks. Chunks are mapped
+    over the execution backend one batch of num_workers chunks at a time, and chunk i
+    always uses the i-th child generator of rng whatever the batching. A single chunk
+    uses rng itself, like the unchunked sampler.
+    """
+    num_points = int(counts.sum())
+    if num_points <= chunk_size:
+        face_index = np.repeat(np.arange(len(faces), dtype=np.int64), counts)
+        points, weights = _sample_chunk(coordinates, faces, face_index, rng)
+        yield points, face_index, weights
+        return
+
+    bounds = np.cumsum(counts)
+    backend = get_backend()
+    ranges = chunk_ranges(num_points, chunk_size)
+    with contextlib.ExitStack() as stack:
+        if backend.copies_arguments:
+            coordinates = stack.enter_context(SharedArray.from_array(coordinates))
+            faces = stack.enter_context(SharedArray.from_array(faces))
+        for first in range(0, len(ranges), backend.num_workers):
+            batch = ranges[first:first + backend.num_workers]
+            # Sample i lies on the first face whose cumulative count exceeds i
+            face_indices = [np.searchsorted(bounds, np.arange(start, stop), side="right") for start, stop in batch]
+            chunks = backend.map(
+                _sample_chunk,
+                [coordinates] * len(batch),
+                [faces] * len(batch),
+                face_indices,
+                rng.spawn(len(batch))
+            )
+            for face_index, (points, weights) in zip(face_indices, chunks):
+                yield points, face_index, weights
+
+
+def sample_faces(
+    coordinates: np.ndarray,
+    faces: np.ndarray,
+    num_points: int,
+    rng: np.random.Generator | int | None = None,
+    return_face_index: bool = False,
+    return_barycentric: bool = False,
+    areas: np.ndarray | None = None,
+    chunk_size: int | None = None
+) -> np.ndarray | tuple[np.ndarray, ...]:
+    """Sample num_points points uniformly by area over a triangle or quad mesh.
+
+    The number of points per face is a single multinomial draw weighted by face
+    area, and all samples are produced as one (num_points, dim) array. Optionally
+    returns the face index and the corner weights of every sample. Precomputed face
+    areas can be passed to skip recomputing them.
+
+    With a chunk_size (by default the one of the current execution backend), the
+    samples are generated in chunks of that many points on the backend, each chunk
+    with its own child generator of rng. The result then depends on chunk_size but
+    not on the backend or its number of workers. Process backends receive the mesh
+    arrays through shared memory, so each task only transfers its own samples.
+    """
+    rng = np.random.default_rng(rng)
+    counts = _face_counts(coordinates, faces, num_points, rng, areas)
+
+    if chunk_size is None:
+        chunk_size = get_backend().chunk_size
+    if chunk_size is None:
+        face_index = np.repeat(np.arange(len(faces), dtype=np.int64), counts)
+        points, weights = _sample_chunk(coordinates, faces, face_index, rng)
+    else:
+        chunk_size = _check_chunk_size(chunk_size)
+        chunks = list(_iter_chunks(coordinates, faces, counts, chunk_size, rng))
+        points, face_index, weights = (np.concatenate(arrays) for arrays in zip(*chunks))
+
+    return _pack(points, face_index, weights, return_face_index, return_barycentric)
+
+
+def iter_sample_faces(
+    coordinates: np.ndarray,
+    faces: np.ndarray,
+    num_points: int,
+    chunk_size: int,
+    rng: np.random.Generator | int | None = None,
+    return_face_index: bool = False,
+    return_barycentric: bool = False,
+    areas: np.ndarray | None = None
+) -> Iterator[np.ndarray | tuple[np.ndarray, ...]]:
+    """Stream the samples of sample_faces as (chunk_size, dim) chunks, the last one possibly shorter.
+
+    The per-face counts are drawn once up front, so the chunks together follow the same
+    area-proportional distribution as a single call, and concatenating them gives exactly
+    ``sample_faces(..., chunk_size=chunk_size)``. Memory stays O(F + num_workers * chunk_size)
+    for any num_points.
+    """
+    chunk_size = _check_chunk_size(chunk_size)
+    rng = np.random.default_rng(rng)
+    counts = _face_counts(coordinates, faces, num_points, rng, areas)
+    return (
+        _pack(points, face_index, weights, return_face_index, return_barycentric)
+        for points, face_index, weights in _iter_chunks(coordinates, faces, counts, chunk_size, rng)
+    )
+
+
+def sample_faces_to_file(
+    coordinates: np.ndarray,
+    faces: np.ndarray,
+    num_points: int,
+    out: str | os.PathLike | np.ndarray,
+    chunk_size: int,
+    rng: np.random.Generator | int | None = None,
+    areas: np.ndarray | None = None
+) -> np.ndarray:
+    """Write the samples of iter_sample_faces chunk by chunk into ``out`` and return it.
+
+    ``out`` is a (num_points, dim) array such as a numpy.memmap, or a path: a ``.npy``
+    path is created as a memory-mapped .npy file, any other path as raw C-order float64.
+    """
+    shape = (num_points, coordinates.shape[1])
+    if isinstance(out, (str, os.PathLike)):
+        if os.fspath(out).endswith(".npy"):
+            out = np.lib.format.open_memmap(out, mode="w+", dtype=np.float64, shape=shape)
+        else:
+            out = np.memmap(out, dtype=np.float64, mode="w+", shape=shape)
+    elif out.shape != shape:
+        raise ValueError(f"out must have shape {shape}, got {out.shape}")
+
+    start = 0
+    for points in iter_sample_faces(coordinates, faces, num_points, chunk_size, rng=rng, areas=areas):
+        out[start:start + len(points)] = points
+        start += len(points)
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
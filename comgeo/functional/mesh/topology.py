@@ -0,0 +1,225 @@
+from ...core.utils.sparse import CSRMatrix
+
+import itertools
+import numpy as np
+
+
+def flatten_faces(faces: list[list[int]] | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Flatten a face list into CSR-style (offsets, indices) arrays.
+
+    Face i uses the vertex ids ``indices[offsets[i]:offsets[i + 1]]``. Array input
+    may pad shorter faces with -1; unpadded arrays are flattened without a copy, and
+    (F, 3) arrays, which cannot hold padding, are not read at all.
+    """
+    if isinstance(faces, np.ndarray):
+        if faces.ndim != 2:
+            raise ValueError(f"faces must be a 2D array, got {faces.ndim}D")
+        faces = faces.astype(np.int64, copy=False)
+        # Faces have at least 3 corners, so only wider arrays can be padded
+        if faces.shape[1] > 3 and len(faces) > 0 and np.any(faces[:, -1] < 0):
+            # Rows padded with -1 hold faces with fewer corners
+            valid = faces >= 0
+            offsets = np.zeros(len(faces) + 1, dtype=np.int64)
+            np.cumsum(valid.sum(axis=1), out=offsets[1:])
+            return offsets, faces[valid]
+        offsets = np.arange(len(faces) + 1, dtype=np.int64) * faces.shape[1]
+        return offsets, faces.ravel()
+
+    sizes = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+    offsets = np.zeros(len(faces) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    indices = np.fromiter(itertools.chain.from_iterable(faces), dtype=np.int64, count=int(offsets[-1]))
+    return offsets, indices
+
+
+def face_lists(faces: np.ndarray) -> list[list[int]]:
+    """Convert an (F, kmax) face array padded with -1 into a list of vertex id lists."""
+    if len(faces) == 0 or np.all(faces[:, -1] >= 0):
+        return faces.tolist()
+    return [[i for i in face if i >= 0] for face in faces.tolist()]
+
+
+def pad_faces(offsets: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """Inverse of flatten_faces: scatter the faces into an (F, kmax) array padded with -1."""
+    sizes = np.diff(offsets)
+    width = int(sizes.max()) if len(sizes) > 0 else 0
+    if np.all(sizes == width):
+        return indices.reshape(len(sizes), width)
+    padded = np.full((len(sizes), width), -1, dtype=np.int64)
+    rows = np.repeat(np.arange(len(sizes)), sizes)
+    padded[rows, np.arange(len(indices)) - offsets[rows]] = indices
+    return padded
+
+
+def face_edges(offsets: np.ndarray, indices: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the directed boundary edges (start, end, face id) of every face."""
+    sizes = np.diff(offsets)
+    face_ids = np.repeat(np.arange(len(sizes), dtype=np.int64), sizes)
+
+    # Each corner points to the next corner of its face, wrapping around at the end
+    following = np.arange(1, len(indices) + 1, dtype=np.int64)
+    non_empty = sizes > 0
+    following[offsets[1:][non_empty] - 1] = offsets[:-1][non_empty]
+    return indices, indices[following], face_ids
+
+
+def unique_edges(offsets: np.ndarray, indices: np.ndarray, num_vertices: int) -> tuple[np.ndarray, np.ndarray]:
+    """Deduplicate the face boundary edges with a sorted-key unique.
+
+    Returns the (E, 2) undirected edges, lower vertex id first and sorted by (low, high),
+    and the edge id of every corner, where corner c joins ``indices[c]`` to the next
+    corner of its face. Corners repeating the next vertex get -1.
+    """
+    start, end, _ = face_edges(offsets, indices)
+    valid = start != end
+    num_keys = max(num_vertices, 1)
+    keys = np.minimum(start, end)[valid] * num_keys + np.maximum(start, end)[valid]
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    corner_edges = np.full(len(indices), -1, dtype=np.int64)
+    corner_edges[valid] = inverse
+    edges = np.stack([unique_keys // num_keys, unique_keys % num_keys], axis=1)
+    return edges, corner_edges
+
+
+def vertex_face_incidence(offsets: np.ndarray, indices: np.ndarray, num_vertices: int) -> CSRMatrix:
+    """Vertex-to-face incidence: row v of the (num_vertices, num_faces) CSR matrix lists the faces using v.
+
+    A counting pass over the corners sizes the rows and a stable sort by vertex fills
+    them, so every row lists its faces in increasing order. A face using a vertex twice
+    is listed once.
+    """
+    sizes = np.diff(offsets)
+    face_ids = np.repeat(np.arange(len(sizes), dtype=np.int64), sizes)
+    order = np.argsort(indices, kind="stable")
+    vertices = indices[order]
+    faces = face_ids[order]
+    if len(order) > 0:
+        repeated = np.zeros(len(order), dtype=np.bool_)
+        repeated[1:] = (vertices[1:] == vertices[:-1]) & (faces[1:] == faces[:-1])
+        if repeated.any():
+            vertices, faces = vertices[~repeated], faces[~repeated]
+    indptr = np.zeros(num_vertices + 1, dtype=np.int64)
+    np.cumsum(np.bincount(vertices, minlength=num_vertices), out=indptr[1:])
+    return CSRMatrix(indptr, faces, (num_vertices, len(sizes)))
+
+
+def vertex_adjacency(offsets: np.ndarray, indices: np.ndarray, num_vertices: int) -> CSRMatrix:
+    """Build the symmetric vertex adjacency matrix induced by the face boundaries."""
+    start, end, _ = face_edges(offsets, indices)
+    keep = start != end
+    start = start[keep]
+    end = end[keep]
+    return CSRMatrix.from_coo(
+        np.concatenate([start, end]),
+        np.concatenate([end, start]),
+        (num_vertices, num_vertices)
+    )
+
+
+def face_adjacency(offsets: np.ndarray, indices: np.ndarray, num_vertices: int) -> CSRMatrix:
+    """Build the symmetric face adjacency matrix; two faces are adjacent if they share an edge."""
+    num_faces = len(offsets) - 1
+    start, end, face_ids = face_edges(offsets, indices)
+    keep = start != end
+    low = np.minimum(start, end)[keep]
+    high = np.maximum(start, end)[keep]
+    face_ids = face_ids[keep]
+
+    keys = low * num_vertices + high
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    face_ids = face_ids[order]
+
+    # Faces sharing an edge form a run of equal keys; pair every face with the
+    # ones d positions further along the same run.
+    rows = []
+    cols = []
+    d = 1
+    while d < len(keys):
+        same = keys[d:] == keys[:-d]
+        if not same.any():
+            break
+        rows.append(face_ids[:-d][same])
+        cols.append(face_ids[d:][same])
+        d += 1
+
+    rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+    cols = np.concatenate(cols) if cols else np.zeros(0, dtype=np.int64)
+    keep = rows != cols
+    rows = rows[keep]
+    cols = cols[keep]
+    return CSRMatrix.from_coo(
+        np.concatenate([rows, cols]),
+        np.concatenate([cols, rows]),
+        (num_faces, num_faces)
+    )
+
+
+def union_find(num_nodes: int, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """Return the root of every node after merging the pairs (rows[i], cols[i]).
+
+    Vectorised union-find: every round links the roots of all unmerged pairs at once,
+    the root of lower rank (ties broken by id) under the other so that no cycles can
+    form, then fully compresses the paths by pointer jumping. Runs in near-linear time
+    and never builds an adjacency matrix.
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    parent = np.arange(num_nodes, dtype=np.int64)
+    rank = np.zeros(num_nodes, dtype=np.int64)
+    while True:
+        roots_u, roots_v = parent[rows], parent[cols]
+        open_pairs = roots_u != roots_v
+        if not open_pairs.any():
+            return parent
+        rows, cols = rows[open_pairs], cols[open_pairs]
+        roots_u, roots_v = roots_u[open_pairs], roots_v[open_pairs]
+
+        # Union by rank: the root with the smaller (rank, -id) goes under the other
+        u_lower = (rank[roots_u] < rank[roots_v]) | ((rank[roots_u] == rank[roots_v]) & (roots_u > roots_v))
+        child = np.where(u_lower, roots_u, roots_v)
+        new_parent = np.where(u_lower, roots_v, roots_u)
+        # A root hooked by several pairs keeps one of them; the others retry next round
+        parent[child] = new_parent
+        np.maximum.at(rank, parent[child], rank[child] + 1)
+
+        # Path compression
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+
+def component_labels(roots: np.ndarray) -> np.ndarray:
+    """Relabel union-find roots as 0..k-1, numbering the components in order of first appearance."""
+    _, first, inverse = np.unique(roots, return_index=True, return_inverse=True)
+    order = np.empty(len(first), dtype=np.int64)
+    order[np.argsort(first, kind="stable")] = np.arange(len(first))
+    return order[inverse.reshape(-1)]
+
+
+def connected_components(offsets: np.ndarray, indices: np.ndarray, num_vertices: int) -> tuple[np.ndarray, np.ndarray]:
+    """Split a mesh into parts of faces connected through shared vertices.
+
+    Returns the component of every vertex (-1 for vertices used by no face) and of every
+    face, numbered in the order of the lowest face id of each component.
+    """
+    sizes = np.diff(offsets)
+    face_ids = np.repeat(np.arange(len(sizes), dtype=np.int64), sizes)
+    # Every corner is merged with the first corner of its face
+    roots = union_find(num_vertices, indices[offsets[:-1][face_ids]], indices)
+
+    num_faces = len(sizes)
+    face_roots = roots[indices[offsets[:-1][sizes > 0]]]
+    face_labels = np.full(num_faces, -1, dtype=np.int64)
+    face_labels[sizes > 0] = component_labels(face_roots)
+
+    # Map every root to the label of its faces
+    root_label = np.full(num_vertices, -1, dtype=np.int64)
+    root_label[face_roots] = face_labels[sizes > 0]
+    vertex_labels = root_label[roots]
+    used = np.zeros(num_vertices, dtype=np.bool_)
+    used[indices] = True
+    vertex_labels[~used] = -1
+    return vertex_labels, face_labels
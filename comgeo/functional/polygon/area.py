@@ -1,4 +1,4 @@
-from ...core.vertex import Vertex2D, Vertex3D
+from ...core.vertex import Vertex2D, Vertex3D, VertexArray
 from ...core.vector import Vector2D, Vector3D
 from ...core.utils.error import check_type, check_consistency
 
@@ -18,10 +18,10 @@ def get_triangle_area(vertices: list[Vertex2D | Vertex3D]) -> float:
     if len(vertices) != 3:
         raise ValueError("Triangle must have 3 vertices")
     
-    if type(vertices[0]) not in [Vertex2D, Vertex3D]:
+    if not isinstance(vertices[0], (Vertex2D, Vertex3D)):
         raise ValueError("Triangle must have vertices of type Vertex2D or Vertex3D")
     
-    if type(vertices[0]) == Vertex2D:
+    if isinstance(vertices[0], Vertex2D):
         return get_triangle_area_2d(vertices)
     else:
         return get_triangle_area_3d(vertices)
@@ -37,26 +37,32 @@ def get_quadrilateral_area_2d(vertices: list[Vertex2D]) -> float:
 def get_quadrilateral_area_3d(vertices: list[Vertex3D]) -> float:
     # Split quadrilateral into two triangles and sum their areas
     # Triangle 1: 0, 1, 2
-    area1 = get_triangle_area_3d([vertices[0], vertices[1], vertices[2]])
+    normal1 = Vector3D.from_vertices(vertices[0], vertices[1]).cross(Vector3D.from_vertices(vertices[0], vertices[2]))
     # Triangle 2: 0, 2, 3
-    area2 = get_triangle_area_3d([vertices[0], vertices[2], vertices[3]])
-    return area1 + area2
+    normal2 = Vector3D.from_vertices(vertices[0], vertices[2]).cross(Vector3D.from_vertices(vertices[0], vertices[3]))
+    if normal1 * normal2 < 0.0:
+        # The 0-2 diagonal lies outside a concave quadrilateral, split along 1-3 instead
+        area1 = get_triangle_area_3d([vertices[0], vertices[1], vertices[3]])
+        area2 = get_triangle_area_3d([vertices[1], vertices[2], vertices[3]])
+        return area1 + area2
+    return (normal1.norm() + normal2.norm()) / 2.0
 
 def get_quadrilateral_area(vertices: list[Vertex2D | Vertex3D]) -> float:
     if len(vertices) != 4:
         raise ValueError("Quadrilateral must have 4 vertices")
     
-    if type(vertices[0]) not in [Vertex2D, Vertex3D]:
+    if not isinstance(vertices[0], (Vertex2D, Vertex3D)):
         raise ValueError("Quadrilateral must have vertices of type Vertex2D or Vertex3D")
     
-    if type(vertices[0]) == Vertex2D:
+    if isinstance(vertices[0], Vertex2D):
         return get_quadrilateral_area_2d(vertices)
     else:
         return get_quadrilateral_area_3d(vertices)
 
-def get_area(vertices: list[Vertex2D | Vertex3D]) -> float:
-    check_type(vertices, list, "vertices")
-    check_consistency(vertices, "vertices")
+def get_area(vertices: list[Vertex2D | Vertex3D] | VertexArray) -> float:
+    check_type(vertices, (list, VertexArray), "vertices")
+    if isinstance(vertices, list):
+        check_consistency(vertices, "vertices")
     check_type(vertices[0], (Vertex2D, Vertex3D), "vertices")
     if len(vertices) < 3:
         raise ValueError("Polygon must have at least 3 vertices")
@@ -1,13 +1,16 @@
-from ...core.vertex import Vertex2D, Vertex3D
+from ...core.vertex import Vertex2D, Vertex3D, VertexArray
 from ...core.utils.error import check_type, check_consistency
 
-def get_center(vertices: list[Vertex2D | Vertex3D]) -> Vertex2D | Vertex3D:
-    check_type(vertices, list, "vertices")
+def get_center(vertices: list[Vertex2D | Vertex3D] | VertexArray) -> Vertex2D | Vertex3D:
+    check_type(vertices, (list, VertexArray), "vertices")
+    if isinstance(vertices, VertexArray):
+        return vertices.vertex_type(*vertices.coordinates.mean(axis=0).tolist())
+
     check_consistency(vertices, "vertices")
-    if type(vertices[0]) not in [Vertex2D, Vertex3D]:
+    if not isinstance(vertices[0], (Vertex2D, Vertex3D)):
         raise ValueError("Polygon must have vertices of type Vertex2D or Vertex3D")
     
-    sum_vertex: Vertex2D | Vertex3D = Vertex2D(0.0, 0.0) if type(vertices[0]) == Vertex2D else Vertex3D(0.0, 0.0, 0.0)
+    sum_vertex: Vertex2D | Vertex3D = Vertex2D(0.0, 0.0) if isinstance(vertices[0], Vertex2D) else Vertex3D(0.0, 0.0, 0.0)
     for vertex in vertices:
         sum_vertex += vertex
     return sum_vertex / float(len(vertices))
\ No newline at end of file
@@ -1,48 +1,236 @@
-from ...core.vertex import Vertex, Vertex2D, Vertex3D
+from ...core.vertex import Vertex, Vertex2D, Vertex3D, VertexArray
+from ..mesh.geometry import quad_split
 
-from random import random
+from itertools import product
 import math
 
-def point_cloud_sampling_triangle(vertices: list[Vertex | Vertex2D | Vertex3D], num_points: int) -> list[Vertex | Vertex2D | Vertex3D]:
-    if type(vertices[0]) not in [Vertex2D, Vertex3D]:
-        raise NotImplementedError("point_cloud_sampling not implemented for " + str(type(vertices[0])))
-    
-    points: list[Vertex2D | Vertex3D] = []
-    for _ in range(num_points):
-        r1 = random()
-        r2 = random()
-
-        w1 = 1 - math.sqrt(r1)
-        w2 = math.sqrt(r1) * (1 - r2)
-        w3 = math.sqrt(r1) * r2
-
-        points.append(
-            vertices[0] * w1 + \
-            vertices[1] * w2 + \
-            vertices[2] * w3
-        )
-    
+import numpy as np
+
+# First primes, the bases of the Halton sequence
+_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# Sobol direction numbers (Joe and Kuo) for dimensions 2 and up: degree s of the primitive
+# polynomial, its inner coefficients a and the initial odd numbers m_1 .. m_s
+_SOBOL_DIRECTIONS = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17))
+)
+_SOBOL_BITS = 32
+
+SAMPLING_METHODS = ("random", "halton", "sobol")
+
+
+def _radical_inverse(indices: np.ndarray, base: int) -> np.ndarray:
+    result = np.zeros(len(indices), dtype=np.float64)
+    scale = 1.0 / base
+    indices = indices.copy()
+    while np.any(indices > 0):
+        result += (indices % base) * scale
+        indices //= base
+        scale /= base
+    return result
+
+
+def halton_sequence(num_points: int, dim: int = 2, start: int = 0) -> np.ndarray:
+    """Points start .. start + num_points - 1 of the Halton sequence in [0, 1)^dim."""
+    if not 1 <= dim <= len(_PRIMES):
+        raise ValueError(f"Halton sequences are available for 1 to {len(_PRIMES)} dimensions, got {dim}")
+    indices = np.arange(start, start + num_points, dtype=np.int64)
+    return np.stack([_radical_inverse(indices, base) for base in _PRIMES[:dim]], axis=1)
+
+
+def _sobol_direction_integers(dimension: int) -> list[int]:
+    """Direction integers v_k * 2^32 of one Sobol dimension (0-based)."""
+    if dimension == 0:
+        return [1 << (_SOBOL_BITS - 1 - k) for k in range(_SOBOL_BITS)]
+    s, a, m = _SOBOL_DIRECTIONS[dimension - 1]
+    m = list(m)
+    for k in range(s, _SOBOL_BITS):
+        value = m[k - s] ^ (m[k - s] << s)
+        for j in range(1, s):
+            if (a >> (s - 1 - j)) & 1:
+                value ^= m[k - j] << j
+        m.append(value)
+    return [m[k] << (_SOBOL_BITS - 1 - k) for k in range(_SOBOL_BITS)]
+
+
+def sobol_sequence(num_points: int, dim: int = 2, start: int = 0) -> np.ndarray:
+    """Points start .. start + num_points - 1 of the Sobol sequence in [0, 1)^dim.
+
+    Points are in natural (not Gray code) order, so every aligned block of 2^m points is
+    a (t, m, dim)-net.
+    """
+    if not 1 <= dim <= len(_SOBOL_DIRECTIONS) + 1:
+        raise ValueError(f"Sobol sequences are available for 1 to {len(_SOBOL_DIRECTIONS) + 1} dimensions, got {dim}")
+    if start + num_points > 1 << _SOBOL_BITS:
+        raise ValueError(f"Sobol sequences are limited to 2^{_SOBOL_BITS} points")
+    indices = np.arange(start, start + num_points, dtype=np.uint64)
+    points = np.empty((num_points, dim), dtype=np.float64)
+    for d in range(dim):
+        values = np.zeros(num_points, dtype=np.uint64)
+        for k, direction in enumerate(_sobol_direction_integers(d)):
+            bit = (indices >> np.uint64(k)) & np.uint64(1)
+            values ^= bit * np.uint64(direction)
+        points[:, d] = values / float(1 << _SOBOL_BITS)
     return points
 
-def point_cloud_sampling_quad(vertices: list[Vertex | Vertex2D | Vertex3D], num_points: int) -> list[Vertex | Vertex2D | Vertex3D]:
-    if type(vertices[0]) not in [Vertex2D, Vertex3D]:
+
+def unit_square_samples(num_points: int, method: str = "random", rng: np.random.Generator | int | None = None) -> np.ndarray:
+    """(num_points, 2) samples of [0, 1)^2 from independent uniforms or a low-discrepancy sequence.
+
+    The Halton and Sobol sequences are deterministic; passing rng applies a random shift
+    modulo 1 (a Cranley-Patterson rotation) to get independent, equally even replicas.
+    """
+    if method == "random":
+        rng = np.random.default_rng(rng)
+        return np.stack([rng.random(num_points), rng.random(num_points)], axis=1)
+    if method == "halton":
+        samples = halton_sequence(num_points, 2)
+    elif method == "sobol":
+        samples = sobol_sequence(num_points, 2)
+    else:
+        raise ValueError(f"Unknown sampling method {method!r}, expected one of {SAMPLING_METHODS}")
+    if rng is not None:
+        samples = (samples + np.random.default_rng(rng).random(2)) % 1.0
+    return samples
+
+
+def triangle_weights(samples: np.ndarray) -> np.ndarray:
+    """Map (n, 2) unit square samples to area-uniform barycentric weights of a triangle."""
+    r1 = np.sqrt(samples[:, 0])
+    r2 = samples[:, 1]
+    return np.stack([1.0 - r1, r1 * (1.0 - r2), r1 * r2], axis=1)
+
+
+def quad_weights(corners: np.ndarray, samples: np.ndarray) -> np.ndarray:
+    """Map (n, 2) unit square samples to area-uniform corner weights of (n, 4, dim) quads.
+
+    Every quad is split into two triangles like quad_split, the same split face_areas
+    uses, so 0-2 unless that diagonal lies outside a concave quad. The first coordinate
+    picks the triangle in proportion to its area and, rescaled, places the sample along
+    the triangle's far edge while the second one gives the distance from its apex. The
+    samples are exactly area-uniform and keep the stratification of the sequence, and
+    only samples with a zero second coordinate collapse onto a corner.
+    """
+    flip, first, second = quad_split(*(corners[:, k] for k in range(4)))
+    total = first + second
+    split = np.divide(first, total, out=np.ones_like(total), where=total > 0.0)
+
+    u = samples[:, 0]
+    in_first = u < split
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u = np.where(in_first, u / split, (u - split) / (1.0 - split))
+    weights = triangle_weights(np.stack([samples[:, 1], np.clip(u, 0.0, 1.0)], axis=1))
+
+    corner_ids = np.where(
+        in_first[:, None],
+        np.where(flip[:, None], [0, 1, 3], [0, 1, 2]),
+        np.where(flip[:, None], [1, 2, 3], [0, 2, 3])
+    )
+    result = np.zeros((len(samples), 4), dtype=np.float64)
+    np.put_along_axis(result, corner_ids, weights, axis=1)
+    return result
+
+
+def _coordinates(vertices: list[Vertex | Vertex2D | Vertex3D] | VertexArray) -> np.ndarray:
+    if isinstance(vertices, VertexArray):
+        return vertices.coordinates
+    return np.array([v.coordinates for v in vertices], dtype=np.float64)
+
+
+def sample_polygon(
+    coordinates: np.ndarray,
+    num_points: int,
+    method: str = "random",
+    rng: np.random.Generator | int | None = None
+) -> np.ndarray:
+    """Area-uniform (num_points, dim) samples of a triangle or quad given by its (k, dim) corners."""
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    if len(coordinates) not in (3, 4):
+        raise ValueError(f"Sampling is only supported for triangles and quads, got {len(coordinates)} vertices")
+    samples = unit_square_samples(num_points, method, rng)
+    if len(coordinates) == 3:
+        weights = triangle_weights(samples)
+    else:
+        weights = quad_weights(np.broadcast_to(coordinates, (num_points,) + coordinates.shape), samples)
+    return weights @ coordinates
+
+
+def poisson_disk_sampling(
+    coordinates: np.ndarray,
+    radius: float,
+    rng: np.random.Generator | int | None = None,
+    max_rejections: int = 1000,
+    batch_size: int = 256
+) -> np.ndarray:
+    """Blue-noise samples of a triangle or quad with no two points closer than ``radius``.
+
+    Candidates are drawn area-uniformly in batches and accepted by dart throwing. A grid
+    of cell size radius / sqrt(dim) holds at most one point per cell, so every test only
+    looks at the 5^dim surrounding cells. Sampling stops after ``max_rejections``
+    consecutive rejected candidates, when the polygon is close to maximally covered.
+    """
+    if not radius > 0.0:
+        raise ValueError(f"radius must be positive, got {radius}")
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    rng = np.random.default_rng(rng)
+    dim = coordinates.shape[1]
+    cell_size = radius / math.sqrt(dim)
+    neighbour_offsets = list(product(range(-2, 3), repeat=dim))
+    radius_squared = radius * radius
+
+    grid: dict[tuple[int, ...], int] = {}
+    points: list[np.ndarray] = []
+    rejections = 0
+    while rejections < max_rejections:
+        candidates = sample_polygon(coordinates, batch_size, rng=rng)
+        cells = np.floor(candidates / cell_size).astype(np.int64).tolist()
+        for candidate, cell in zip(candidates, cells):
+            close = False
+            for offset in neighbour_offsets:
+                neighbour = grid.get(tuple(c + o for c, o in zip(cell, offset)))
+                if neighbour is not None and np.sum((points[neighbour] - candidate) ** 2) < radius_squared:
+                    close = True
+                    break
+            if close:
+                rejections += 1
+                if rejections >= max_rejections:
+                    break
+                continue
+            grid[tuple(cell)] = len(points)
+            points.append(candidate)
+            rejections = 0
+    return np.array(points, dtype=np.float64).reshape(-1, dim)
+
+
+def _to_vertices(points: np.ndarray) -> list[Vertex2D | Vertex3D]:
+    return Vertex2D.from_array(points) if points.shape[1] == 2 else Vertex3D.from_array(points)
+
+
+def point_cloud_sampling_triangle(
+    vertices: list[Vertex | Vertex2D | Vertex3D] | VertexArray,
+    num_points: int,
+    method: str = "random",
+    rng: np.random.Generator | int | None = None
+) -> list[Vertex | Vertex2D | Vertex3D]:
+    if not isinstance(vertices[0], (Vertex2D, Vertex3D)):
         raise NotImplementedError("point_cloud_sampling not implemented for " + str(type(vertices[0])))
-    
-    points: list[Vertex2D | Vertex3D] = []
-    for _ in range(num_points):
-        l = random()
-        r = random()
-
-        a1 = (1 - l) * (1 - r)
-        a2 = l * (1 - r)
-        a3 = l * r
-        a4 = (1 - l) * r
-
-        points.append(
-            vertices[0] * a1 + \
-            vertices[1] * a2 + \
-            vertices[2] * a3 + \
-            vertices[3] * a4
-        )
-    
-    return points
\ No newline at end of file
+
+    return _to_vertices(sample_polygon(_coordinates(vertices)[:3], num_points, method, rng))
+
+
+def point_cloud_sampling_quad(
+    vertices: list[Vertex | Vertex2D | Vertex3D] | VertexArray,
+    num_points: int,
+    method: str = "random",
+    rng: np.random.Generator | int | None = None
+) -> list[Vertex | Vertex2D | Vertex3D]:
+    if not isinstance(vertices[0], (Vertex2D, Vertex3D)):
+        raise NotImplementedError("point_cloud_sampling not implemented for " + str(type(vertices[0])))
+
+    return _to_vertices(sample_polygon(_coordinates(vertices)[:4], num_points, method, rng))
@@ -24,7 +24,7 @@ def circumcircle_vertices(vertices: tuple[Vertex2D, Vertex2D, Vertex2D]) -> Circ
     center = Vertex2D(Ux, Uy)
     radius = center.distance_to(A)
 
-    return Circle(center, radius)
+    return Circle(center, radius, through=(A, B, C))
 
 def circumcircle_triangle(triangle: Triangle) -> Circle:
 
@@ -0,0 +1,185 @@
+from typing import Sequence
+
+import numpy as np
+
+
+# Shewchuk's first-stage error bounds ("Adaptive Precision Floating-Point Arithmetic
+# and Fast Robust Geometric Predicates", 1997). When the floating-point determinant
+# exceeds bound * permanent its sign is guaranteed; otherwise it is recomputed exactly
+# in integer arithmetic.
+_EPSILON = 2.0 ** -53
+_CCW_BOUND = (3.0 + 16.0 * _EPSILON) * _EPSILON
+_O3D_BOUND = (7.0 + 56.0 * _EPSILON) * _EPSILON
+_ICC_BOUND = (10.0 + 96.0 * _EPSILON) * _EPSILON
+
+
+def _scaled_integers(values) -> tuple[list[int], int]:
+    """Write floats exactly as integers over one common power-of-two denominator."""
+    ratios = [float(value).as_integer_ratio() for value in values]
+    denominator = max(d for _, d in ratios)
+    return [n * (denominator // d) for n, d in ratios], denominator
+
+
+def _exact_result(det: int, scale: int) -> float:
+    """Return det / scale as a float, keeping the sign even if the quotient underflows."""
+    result = det / scale
+    if result == 0.0 and det != 0:
+        return 5e-324 if det > 0 else -5e-324
+    return result
+
+
+def _orient2d_exact(ax, ay, bx, by, cx, cy) -> float:
+    (ax, ay, bx, by, cx, cy), d = _scaled_integers((ax, ay, bx, by, cx, cy))
+    return _exact_result((ax - cx) * (by - cy) - (ay - cy) * (bx - cx), d ** 2)
+
+
+def _orient3d_exact(ax, ay, az, bx, by, bz, cx, cy, cz, dx, dy, dz) -> float:
+    (ax, ay, az, bx, by, bz, cx, cy, cz, dx, dy, dz), d = _scaled_integers((ax, ay, az, bx, by, bz, cx, cy, cz, dx, dy, dz))
+    adx, ady, adz = ax - dx, ay - dy, az - dz
+    bdx, bdy, bdz = bx - dx, by - dy, bz - dz
+    cdx, cdy, cdz = cx - dx, cy - dy, cz - dz
+    return _exact_result(
+        adz * (bdx * cdy - cdx * bdy) + bdz * (cdx * ady - adx * cdy) + cdz * (adx * bdy - bdx * ady), d ** 3
+    )
+
+
+def _incircle_exact(ax, ay, bx, by, cx, cy, dx, dy) -> float:
+    (ax, ay, bx, by, cx, cy, dx, dy), d = _scaled_integers((ax, ay, bx, by, cx, cy, dx, dy))
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+    return _exact_result(
+        (adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+        + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+        + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady),
+        d ** 4
+    )
+
+
+def _orient2d(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> float:
+    """orient2d on unpacked coordinates, for tight loops."""
+    left = (ax - cx) * (by - cy)
+    right = (ay - cy) * (bx - cx)
+    det = left - right
+    if abs(det) > _CCW_BOUND * (abs(left) + abs(right)):
+        return det
+    return _orient2d_exact(ax, ay, bx, by, cx, cy)
+
+
+def _incircle(ax: float, ay: float, bx: float, by: float, cx: float, cy: float, dx: float, dy: float) -> float:
+    """incircle on unpacked coordinates, for tight loops."""
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+    bdxcdy, cdxbdy = bdx * cdy, cdx * bdy
+    cdxady, adxcdy = cdx * ady, adx * cdy
+    adxbdy, bdxady = adx * bdy, bdx * ady
+    alift = adx * adx + ady * ady
+    blift = bdx * bdx + bdy * bdy
+    clift = cdx * cdx + cdy * cdy
+    det = alift * (bdxcdy - cdxbdy) + blift * (cdxady - adxcdy) + clift * (adxbdy - bdxady)
+    permanent = (abs(bdxcdy) + abs(cdxbdy)) * alift \
+        + (abs(cdxady) + abs(adxcdy)) * blift \
+        + (abs(adxbdy) + abs(bdxady)) * clift
+    if abs(det) > _ICC_BOUND * permanent:
+        return det
+    return _incircle_exact(ax, ay, bx, by, cx, cy, dx, dy)
+
+
+def orient2d(a: Sequence[float], b: Sequence[float], c: Sequence[float]) -> float:
+    """Return a value whose sign is exactly that of the orientation of (a, b, c).
+
+    Positive when the points are counter-clockwise, negative when clockwise and zero
+    when collinear.
+    """
+    return _orient2d(a[0], a[1], b[0], b[1], c[0], c[1])
+
+
+def orient3d(a: Sequence[float], b: Sequence[float], c: Sequence[float], d: Sequence[float]) -> float:
+    """Return a value whose sign is exactly that of det[a - d, b - d, c - d].
+
+    Positive when d lies below the plane through a, b, c, where "below" means a, b, c
+    appear counter-clockwise when seen from above; zero when the points are coplanar.
+    """
+    ax, ay, az = a[0], a[1], a[2]
+    dx, dy, dz = d[0], d[1], d[2]
+    adx, ady, adz = ax - dx, ay - dy, az - dz
+    bdx, bdy, bdz = b[0] - dx, b[1] - dy, b[2] - dz
+    cdx, cdy, cdz = c[0] - dx, c[1] - dy, c[2] - dz
+    bdxcdy, cdxbdy = bdx * cdy, cdx * bdy
+    cdxady, adxcdy = cdx * ady, adx * cdy
+    adxbdy, bdxady = adx * bdy, bdx * ady
+    det = adz * (bdxcdy - cdxbdy) + bdz * (cdxady - adxcdy) + cdz * (adxbdy - bdxady)
+    permanent = (abs(bdxcdy) + abs(cdxbdy)) * abs(adz) \
+        + (abs(cdxady) + abs(adxcdy)) * abs(bdz) \
+        + (abs(adxbdy) + abs(bdxady)) * abs(cdz)
+    if abs(det) > _O3D_BOUND * permanent:
+        return det
+    return _orient3d_exact(ax, ay, az, b[0], b[1], b[2], c[0], c[1], c[2], dx, dy, dz)
+
+
+def incircle(a: Sequence[float], b: Sequence[float], c: Sequence[float], d: Sequence[float]) -> float:
+    """Return a value whose sign is exactly that of the in-circle determinant.
+
+    For counter-clockwise (a, b, c) it is positive when d lies inside their
+    circumcircle, negative outside and zero on the circle; the sign flips for
+    clockwise triangles.
+    """
+    return _incircle(a[0], a[1], b[0], b[1], c[0], c[1], d[0], d[1])
+
+
+def _as_points(points: np.ndarray, dim: int, var_name: str) -> np.ndarray:
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim != 2 or points.shape[1] != dim:
+        raise ValueError(f"{var_name} must have shape (N, {dim}), got {points.shape}")
+    return points
+
+
+def _fix_uncertain(det: np.ndarray, uncertain: np.ndarray, exact, *columns: np.ndarray) -> np.ndarray:
+    """Recompute the entries flagged as uncertain with the exact scalar predicate."""
+    for i in np.flatnonzero(uncertain):
+        det[i] = exact(*(column[i] for column in columns))
+    return det
+
+
+def orient2d_batch(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """Vectorised orient2d over (N, 2) arrays; only filter failures are evaluated exactly."""
+    a, b, c = (_as_points(p, 2, name) for p, name in ((a, "a"), (b, "b"), (c, "c")))
+    left = (a[:, 0] - c[:, 0]) * (b[:, 1] - c[:, 1])
+    right = (a[:, 1] - c[:, 1]) * (b[:, 0] - c[:, 0])
+    det = left - right
+    uncertain = np.abs(det) <= _CCW_BOUND * (np.abs(left) + np.abs(right))
+    return _fix_uncertain(det, uncertain, _orient2d_exact, *a.T, *b.T, *c.T)
+
+
+def orient3d_batch(a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> np.ndarray:
+    """Vectorised orient3d over (N, 3) arrays; only filter failures are evaluated exactly."""
+    a, b, c, d = (_as_points(p, 3, name) for p, name in ((a, "a"), (b, "b"), (c, "c"), (d, "d")))
+    ad, bd, cd = a - d, b - d, c - d
+    bdxcdy, cdxbdy = bd[:, 0] * cd[:, 1], cd[:, 0] * bd[:, 1]
+    cdxady, adxcdy = cd[:, 0] * ad[:, 1], ad[:, 0] * cd[:, 1]
+    adxbdy, bdxady = ad[:, 0] * bd[:, 1], bd[:, 0] * ad[:, 1]
+    det = ad[:, 2] * (bdxcdy - cdxbdy) + bd[:, 2] * (cdxady - adxcdy) + cd[:, 2] * (adxbdy - bdxady)
+    permanent = (np.abs(bdxcdy) + np.abs(cdxbdy)) * np.abs(ad[:, 2]) \
+        + (np.abs(cdxady) + np.abs(adxcdy)) * np.abs(bd[:, 2]) \
+        + (np.abs(adxbdy) + np.abs(bdxady)) * np.abs(cd[:, 2])
+    uncertain = np.abs(det) <= _O3D_BOUND * permanent
+    return _fix_uncertain(det, uncertain, _orient3d_exact, *a.T, *b.T, *c.T, *d.T)
+
+
+def incircle_batch(a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> np.ndarray:
+    """Vectorised incircle over (N, 2) arrays; only filter failures are evaluated exactly."""
+    a, b, c, d = (_as_points(p, 2, name) for p, name in ((a, "a"), (b, "b"), (c, "c"), (d, "d")))
+    ad, bd, cd = a - d, b - d, c - d
+    bdxcdy, cdxbdy = bd[:, 0] * cd[:, 1], cd[:, 0] * bd[:, 1]
+    cdxady, adxcdy = cd[:, 0] * ad[:, 1], ad[:, 0] * cd[:, 1]
+    adxbdy, bdxady = ad[:, 0] * bd[:, 1], bd[:, 0] * ad[:, 1]
+    alift = np.einsum("ij,ij->i", ad, ad)
+    blift = np.einsum("ij,ij->i", bd, bd)
+    clift = np.einsum("ij,ij->i", cd, cd)
+    det = alift * (bdxcdy - cdxbdy) + blift * (cdxady - adxcdy) + clift * (adxbdy - bdxady)
+    permanent = (np.abs(bdxcdy) + np.abs(cdxbdy)) * alift \
+        + (np.abs(cdxady) + np.abs(adxcdy)) * blift \
+        + (np.abs(adxbdy) + np.abs(bdxady)) * clift
+    uncertain = np.abs(det) <= _ICC_BOUND * permanent
+    return _fix_uncertain(det, uncertain, _incircle_exact, *a.T, *b.T, *c.T, *d.T)
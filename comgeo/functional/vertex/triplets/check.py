@@ -1,32 +1,40 @@
 from ....core.vertex import Vertex, Vertex2D, Vertex3D
+from ....core.utils.error import check_consistency
+from .compute import triplet_orientation
+
+import numpy as np
 
 def is_ccw_2d(
-    v1: Vertex2D, 
-    v2: Vertex2D, 
+    v1: Vertex2D,
+    v2: Vertex2D,
     v3: Vertex2D
 ) -> bool:
-    return (v2.x - v1.x) * (v3.y - v1.y) > (v2.y - v1.y) * (v3.x - v1.x)
+    triplet = np.array([[v1.coordinates, v2.coordinates, v3.coordinates]], dtype=np.float64)
+    return bool(triplet_orientation(triplet)[0] > 0)
 
 def is_ccw_3d(
-    v1: Vertex3D, 
-    v2: Vertex3D, 
-    v3: Vertex3D
+    v1: Vertex3D,
+    v2: Vertex3D,
+    v3: Vertex3D,
+    normal: tuple[float, float, float] = (0.0, 0.0, 1.0)
 ) -> bool:
-    raise NotImplementedError("is_ccw_3d not implemented")
+    """Check whether the triplet turns counter-clockwise when seen from the side normal points to."""
+    triplet = np.array([[v1.coordinates, v2.coordinates, v3.coordinates]], dtype=np.float64)
+    return bool(triplet_orientation(triplet, normal)[0] > 0)
 
 def is_ccw(
-    v1: Vertex | Vertex2D | Vertex3D, 
-    v2: Vertex | Vertex2D | Vertex3D, 
+    v1: Vertex | Vertex2D | Vertex3D,
+    v2: Vertex | Vertex2D | Vertex3D,
     v3: Vertex | Vertex2D | Vertex3D
 ) -> bool:
-    
+
     # same vertex type only
-    assert type(v1) == type(v2) == type(v3), "All vertices must be of the same type"
-    
+    check_consistency([v1, v2, v3], "vertices")
+
     if isinstance(v1, Vertex2D):
         return is_ccw_2d(v1, v2, v3)
-    
+
     if isinstance(v1, Vertex3D):
         return is_ccw_3d(v1, v2, v3)
-    
-    raise NotImplementedError("is_ccw not implemented for " + str(type(v1)))
\ No newline at end of file
+
+    raise NotImplementedError("is_ccw not implemented for " + str(type(v1)))
@@ -0,0 +1,94 @@
+from ..predicates import orient2d_batch, _O3D_BOUND, _scaled_integers, _exact_result
+
+import numpy as np
+
+
+def as_triplets(triplets: np.ndarray) -> np.ndarray:
+    """Validate an (N, 3, d) batch of vertex triplets with d in (2, 3)."""
+    triplets = np.asarray(triplets, dtype=np.float64)
+    if triplets.ndim != 3 or triplets.shape[1] != 3 or triplets.shape[2] not in (2, 3):
+        raise ValueError(f"triplets must have shape (N, 3, 2) or (N, 3, 3), got {triplets.shape}")
+    return triplets
+
+
+def cyclic_triplets(coordinates: np.ndarray) -> np.ndarray:
+    """Return the (k, 3, d) triplets (i, i + 1, i + 2) of a closed polygon with k corners."""
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    k = len(coordinates)
+    index = (np.arange(k)[:, None] + np.arange(3)[None, :]) % k
+    return coordinates[index]
+
+
+def _normals_for(triplets: np.ndarray, normal: np.ndarray | None) -> np.ndarray:
+    if normal is None:
+        normal = np.array([0.0, 0.0, 1.0])
+    normal = np.asarray(normal, dtype=np.float64)
+    if normal.shape not in ((3,), (len(triplets), 3)):
+        raise ValueError(f"normal must have shape (3,) or ({len(triplets)}, 3), got {normal.shape}")
+    return np.broadcast_to(normal, (len(triplets), 3))
+
+
+def _projected_orient_exact(ax, ay, az, bx, by, bz, cx, cy, cz, nx, ny, nz) -> float:
+    (ax, ay, az, bx, by, bz, cx, cy, cz, nx, ny, nz), d = _scaled_integers((ax, ay, az, bx, by, bz, cx, cy, cz, nx, ny, nz))
+    ux, uy, uz = bx - ax, by - ay, bz - az
+    vx, vy, vz = cx - ax, cy - ay, cz - az
+    return _exact_result(nx * (uy * vz - uz * vy) + ny * (uz * vx - ux * vz) + nz * (ux * vy - uy * vx), d ** 3)
+
+
+def _orient_3d(triplets: np.ndarray, normal: np.ndarray) -> np.ndarray:
+    """Filtered n . ((b - a) x (c - a)); rows the error bound cannot decide are recomputed exactly."""
+    a, b, c = triplets[:, 0], triplets[:, 1], triplets[:, 2]
+    u, v = b - a, c - a
+    yz, zy = u[:, 1] * v[:, 2], u[:, 2] * v[:, 1]
+    zx, xz = u[:, 2] * v[:, 0], u[:, 0] * v[:, 2]
+    xy, yx = u[:, 0] * v[:, 1], u[:, 1] * v[:, 0]
+    det = normal[:, 0] * (yz - zy) + normal[:, 1] * (zx - xz) + normal[:, 2] * (xy - yx)
+    permanent = np.abs(normal[:, 0]) * (np.abs(yz) + np.abs(zy)) \
+        + np.abs(normal[:, 1]) * (np.abs(zx) + np.abs(xz)) \
+        + np.abs(normal[:, 2]) * (np.abs(xy) + np.abs(yx))
+    for i in np.flatnonzero(np.abs(det) <= _O3D_BOUND * permanent):
+        det[i] = _projected_orient_exact(*a[i], *b[i], *c[i], *normal[i])
+    return det
+
+
+def triplet_orientation(triplets: np.ndarray, normal: np.ndarray | None = None) -> np.ndarray:
+    """Return the exact orientation sign (+1 ccw, -1 cw, 0 collinear) of every triplet.
+
+    3D triplets are oriented as seen from the side ``normal`` points to, either one
+    (3,) vector for all triplets or an (N, 3) array; the default is +z.
+    """
+    triplets = as_triplets(triplets)
+    if triplets.shape[2] == 2:
+        det = orient2d_batch(triplets[:, 0], triplets[:, 1], triplets[:, 2])
+    else:
+        det = _orient_3d(triplets, _normals_for(triplets, normal))
+    return np.sign(det).astype(np.int8)
+
+
+def triplet_signed_area(triplets: np.ndarray, normal: np.ndarray | None = None) -> np.ndarray:
+    """Return the signed area of every triplet, positive for counter-clockwise ones.
+
+    3D areas are measured in the plane orthogonal to ``normal`` (default +z), so a
+    triangle lying in that plane gets its true area.
+    """
+    triplets = as_triplets(triplets)
+    if triplets.shape[2] == 2:
+        return 0.5 * orient2d_batch(triplets[:, 0], triplets[:, 1], triplets[:, 2])
+    normal = _normals_for(triplets, normal)
+    lengths = np.linalg.norm(normal, axis=1)
+    if np.any(lengths == 0.0):
+        raise ValueError("normal must be non-zero")
+    cross = np.cross(triplets[:, 1] - triplets[:, 0], triplets[:, 2] - triplets[:, 0])
+    return 0.5 * np.einsum("ij,ij->i", cross, normal) / lengths
+
+
+def triplet_collinear(triplets: np.ndarray) -> np.ndarray:
+    """Return whether every triplet is exactly collinear (in 3D: in every coordinate projection)."""
+    triplets = as_triplets(triplets)
+    if triplets.shape[2] == 2:
+        return orient2d_batch(triplets[:, 0], triplets[:, 1], triplets[:, 2]) == 0.0
+    collinear = np.ones(len(triplets), dtype=np.bool_)
+    for axes in ((0, 1), (1, 2), (2, 0)):
+        projected = triplets[:, :, axes]
+        collinear &= orient2d_batch(projected[:, 0], projected[:, 1], projected[:, 2]) == 0.0
+    return collinear
@@ -1,6 +1,8 @@
 # Vertex
 bash test_script/vertex/test_core.sh
 bash test_script/vertex/test_functional_triplets_check.sh
+bash test_script/vertex/test_functional_triplets_compute.sh
+bash test_script/vertex/test_functional_predicates.sh
 
 # Vector
 bash test_script/vector/test_core.sh
@@ -13,4 +15,7 @@ bash test_script/polygon/test_functional.sh
 bash test_script/mesh/test_core.sh
 
 # Shape
-bash test_script/shape/test_core.sh
\ No newline at end of file
+bash test_script/shape/test_core.sh
+
+# Utils
+bash test_script/utils/test_core.sh
\ No newline at end of file
@@ -1,8 +1,9 @@
 import unittest
 import numpy as np
 
-from comgeo.core.vertex import Vertex, Vertex2D
+from comgeo.core.vertex import Vertex, Vertex2D, Vertex3D, VertexArray2D
 from comgeo.core.graph.base import Graph
+from comgeo.core.utils.sparse import CSRMatrix
 
 
 class TestGraph(unittest.TestCase):
@@ -17,8 +18,9 @@ class TestGraph(unittest.TestCase):
         self.assertEqual(self.graph.id, 1)
         self.assertFalse(self.graph.visited)
         self.assertEqual(len(self.graph.vertices), 5)
+        self.assertIsInstance(self.graph.adjacency_matrix, CSRMatrix)
         self.assertEqual(self.graph.adjacency_matrix.shape, (5, 5))
-        self.assertTrue(np.all(self.graph.adjacency_matrix == 0))
+        self.assertEqual(self.graph.adjacency_matrix.nnz, 0)
         self.assertEqual(self.graph.adjacency_list, {})
         self.assertFalse(self.graph.has_adjacency_matrix)
         self.assertFalse(self.graph.has_adjacency_list)
@@ -50,7 +52,8 @@ class TestGraph(unittest.TestCase):
         """Test the adjacency_matrix property."""
         new_matrix = np.ones((5, 5))
         self.graph.adjacency_matrix = new_matrix
-        self.assertTrue(np.all(self.graph.adjacency_matrix == new_matrix))
+        self.assertTrue(np.all(self.graph.adjacency_matrix.toarray() == new_matrix))
+        self.assertTrue(self.graph.has_adjacency_matrix)
         with self.assertRaises(TypeError):
             self.graph.adjacency_matrix = [[1, 1], [1, 1]]
 
@@ -74,6 +77,16 @@ class TestGraph(unittest.TestCase):
         self.assertTrue(self.graph.has_adjacency_matrix)
         self.assertTrue(self.graph.has_adjacency_list)
 
+    def test_adjacency_matrix_is_lazy(self):
+        """Test that the adjacency matrix is only built on access and rebuilt after growth."""
+        self.graph.add_vertex(Vertex2D(x=5.0, y=5.0, id=5), connections=[1])
+        self.assertIsNone(self.graph._adjacency_matrix)
+        self.assertEqual(self.graph.adjacency_matrix.row(1).tolist(), [5])
+        self.graph.add_vertex(Vertex2D(x=6.0, y=6.0, id=6), connections=[1, 5])
+        self.assertEqual(self.graph.adjacency_matrix.shape, (7, 7))
+        self.assertEqual(self.graph.adjacency_matrix.row(1).tolist(), [5, 6])
+        self.assertEqual(self.graph.adjacency_matrix.row(6).tolist(), [1, 5])
+
     def test_initialization_errors(self):
         """Test initialization with incorrect types."""
         with self.assertRaises(TypeError):
@@ -92,5 +105,47 @@ class TestGraph(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.graph.add_vertex(Vertex2D(x=1.0, y=1.0, id=1), connections="not a list")
 
+    def test_add_vertex_default_connections(self):
+        """Test that the default connections are not shared between calls."""
+        self.graph.add_vertex(Vertex2D(x=5.0, y=5.0, id=5))
+        self.graph.adjacency_list[5].append(0)
+        self.graph.add_vertex(Vertex2D(x=6.0, y=6.0, id=6))
+        self.assertEqual(self.graph.adjacency_list[6], [])
+
+    def test_add_vertices_and_edges(self):
+        """Test batch insertion of vertices and edges."""
+        indices = self.graph.add_vertices([Vertex2D(x=float(i), y=0.0, id=i) for i in range(5, 8)])
+        self.assertEqual(indices.tolist(), [5, 6, 7])
+        self.graph.add_edges(indices[:-1], indices[1:])
+        self.graph.add_edges([0], [7], symmetric=False)
+        self.assertEqual(self.graph.edges.shape, (5, 2))
+        self.assertEqual(self.graph.adjacency_matrix.shape, (8, 8))
+        self.assertEqual(self.graph.adjacency_matrix.row(6).tolist(), [5, 7])
+        self.assertEqual(self.graph.adjacency_matrix.row(0).tolist(), [7])
+        self.assertEqual(self.graph.adjacency_matrix.row(7).tolist(), [6])
+
+    def test_add_vertices_vertex_array(self):
+        """Test batch insertion into a VertexArray-backed graph."""
+        graph = Graph(VertexArray2D(np.zeros((2, 2))))
+        indices = graph.add_vertices(VertexArray2D(np.ones((1000, 2))))
+        self.assertEqual(indices[[0, -1]].tolist(), [2, 1001])
+        self.assertEqual(len(graph.vertices), 1002)
+        self.assertGreaterEqual(graph.vertices.capacity, 1002)
+        self.graph.add_vertices(VertexArray2D(np.ones((2, 2))))
+        self.assertIsInstance(self.graph.vertices[-1], Vertex2D)
+
+    def test_add_batch_errors(self):
+        """Test batch insertion with invalid arguments."""
+        with self.assertRaises(TypeError):
+            self.graph.add_vertices("not a list")
+        with self.assertRaises(TypeError):
+            self.graph.add_vertices([Vertex3D(0.0, 0.0, 0.0)])
+        with self.assertRaises(ValueError):
+            self.graph.add_edges([0, 1], [2])
+        with self.assertRaises(ValueError):
+            self.graph.add_edges([0], [5])
+        with self.assertRaises(ValueError):
+            self.graph.add_vertex(Vertex2D(x=5.0, y=5.0, id=5), connections=[9])
+
 if __name__ == '__main__':
     unittest.main()
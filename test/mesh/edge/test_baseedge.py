@@ -1,5 +1,6 @@
 import unittest
-from comgeo.core.vertex import Vertex2D, Vertex3D
+import numpy as np
+from comgeo.core.vertex import Vertex2D, Vertex3D, VertexArray2D
 from comgeo.core.mesh.edges.base import BaseEdge, BaseEdge2D, BaseEdge3D
 
 class TestBaseEdge(unittest.TestCase):
@@ -43,5 +44,17 @@ class TestBaseEdge(unittest.TestCase):
         edge4 = BaseEdge(Vertex2D(2.0, 2.0), Vertex2D(3.0, 3.0))
         self.assertFalse(edge3.intersect(edge4))
 
+    def test_intersect_vertex_views(self):
+        # Views of a VertexArray mix with plain vertices of the same dimension
+        array = VertexArray2D(np.array([[0.0, 0.0], [4.0, 4.0]]))
+        edge1 = BaseEdge(array[0], Vertex2D(4.0, 4.0))
+        edge2 = BaseEdge(Vertex2D(0.0, 4.0), Vertex2D(4.0, 0.0))
+        self.assertTrue(edge1.intersect(edge2))
+        self.assertTrue(edge2.intersect(BaseEdge(array[0], array[1])))
+        with self.assertRaises(TypeError):
+            BaseEdge(array[0], Vertex3D(1.0, 1.0, 1.0))
+        with self.assertRaises(TypeError):
+            edge1.intersect(BaseEdge(Vertex3D(0.0, 0.0, 0.0), Vertex3D(1.0, 1.0, 1.0)))
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import numpy as np
+from comgeo.core.mesh.edges import EdgeTable
+from comgeo.core.mesh.triangle_mesh import TriangleMesh3D
+from comgeo.core.vertex import VertexArray3D
+
+
+class TestEdgeTable(unittest.TestCase):
+    def setUp(self):
+        # Square split along the 0-2 diagonal plus a fin on the same diagonal
+        self.table = EdgeTable.from_faces([[0, 1, 2], [0, 2, 3], [0, 2, 4]], 5)
+
+    def test_edges(self):
+        table = self.table
+        self.assertEqual(table.num_edges, 7)
+        self.assertEqual(table.edges.tolist(), [[0, 1], [0, 2], [0, 3], [0, 4], [1, 2], [2, 3], [2, 4]])
+        self.assertEqual(table.face_edges(1).tolist(), [1, 5, 2])
+        offsets, corner_edges = table.face2edge
+        self.assertEqual(corner_edges[offsets[2]:offsets[3]].tolist(), [1, 6, 3])
+
+    def test_edge_to_face(self):
+        table = self.table
+        self.assertEqual(table.edge_faces(1).tolist(), [0, 1, 2])
+        self.assertEqual(table.edge_faces(4).tolist(), [0])
+        self.assertEqual(table.edge2face.shape, (7, 3))
+        self.assertEqual(table.valence.tolist(), [1, 3, 1, 1, 1, 1, 1])
+
+    def test_boundary_and_non_manifold(self):
+        table = self.table
+        self.assertEqual(table.non_manifold_mask.tolist(), [False, True, False, False, False, False, False])
+        self.assertEqual(int(table.boundary_mask.sum()), 6)
+        self.assertEqual(table.boundary_edges.tolist(), [[0, 1], [1, 2], [2, 3], [3, 0], [2, 4], [4, 0]])
+
+    def test_degenerate_corner(self):
+        table = EdgeTable.from_faces([[0, 1, 1, 2]], 3)
+        self.assertEqual(table.num_edges, 3)
+        self.assertEqual(table.face_edges(0).tolist(), [0, -1, 2, 1])
+        self.assertTrue(table.boundary_mask.all())
+
+    def test_lengths(self):
+        coordinates = np.array([[0.0, 0.0], [3.0, 0.0], [3.0, 4.0], [0.0, 4.0], [1.0, 1.0]])
+        self.assertTrue(np.allclose(self.table.lengths(coordinates), [3.0, 5.0, 4.0, np.sqrt(2.0), 4.0, 3.0, np.sqrt(13.0)]))
+
+
+class TestMeshEdgeTable(unittest.TestCase):
+    def test_mesh_edge_table(self):
+        vertices = VertexArray3D(np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0]]))
+        mesh = TriangleMesh3D(vertices, [[0, 1, 2], [0, 2, 3]])
+        self.assertIs(mesh.edge_table, mesh.edge_table)
+        self.assertEqual(mesh.edge_table.num_edges, 5)
+        self.assertTrue(np.allclose(mesh.edge_lengths, [1.0, np.sqrt(2.0), 1.0, 1.0, 1.0]))
+        vertices[3].y = 2.0
+        self.assertTrue(mesh.has_edge_table)
+        self.assertAlmostEqual(mesh.edge_lengths[2], 2.0)
+        mesh.faces = [[0, 1, 2]]
+        self.assertFalse(mesh.has_edge_table)
+        self.assertEqual(mesh.edge_table.num_edges, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+import numpy as np
+from comgeo.core.mesh.edges import HalfEdgeStructure
+from comgeo.core.mesh.triangle_mesh import TriangleMesh2D
+from comgeo.core.vertex import Vertex2D
+from comgeo.functional.mesh.topology import face_adjacency, flatten_faces
+
+
+def grid_faces(n):
+    """Triangulated n x n grid of (n + 1) ** 2 vertices, all triangles counter-clockwise."""
+    faces = []
+    for i in range(n):
+        for j in range(n):
+            v = i * (n + 1) + j
+            faces.append([v, v + 1, v + n + 2])
+            faces.append([v, v + n + 2, v + n + 1])
+    return faces
+
+
+class TestHalfEdgeStructure(unittest.TestCase):
+    def setUp(self):
+        # Square split along the 0-2 diagonal
+        self.faces = [[0, 1, 2], [0, 2, 3]]
+        self.half_edges = HalfEdgeStructure.from_faces(self.faces, 4)
+
+    def test_arrays(self):
+        he = self.half_edges
+        self.assertEqual(he.num_halfedges, 6)
+        self.assertEqual(he.vertex.tolist(), [0, 1, 2, 0, 2, 3])
+        self.assertEqual(he.face.tolist(), [0, 0, 0, 1, 1, 1])
+        self.assertEqual(he.next.tolist(), [1, 2, 0, 4, 5, 3])
+        self.assertEqual(he.prev.tolist(), [2, 0, 1, 5, 3, 4])
+        self.assertEqual(he.twin.tolist(), [-1, -1, 3, 2, -1, -1])
+        self.assertTrue(he.is_manifold)
+        self.assertTrue(he.is_oriented)
+
+    def test_boundary(self):
+        he = self.half_edges
+        self.assertEqual(he.boundary_halfedges.tolist(), [True, True, False, False, True, True])
+        self.assertTrue(he.boundary_vertices.all())
+        self.assertTrue(all(he.is_boundary_vertex(v) for v in range(4)))
+
+    def test_one_ring(self):
+        he = self.half_edges
+        self.assertEqual(he.one_ring(0).tolist(), [1, 2, 3])
+        self.assertEqual(he.one_ring(1).tolist(), [2, 0])
+        self.assertEqual(sorted(he.vertex_faces(2).tolist()), [0, 1])
+        self.assertEqual(he.face_neighbors(0).tolist(), [1])
+        self.assertEqual(he.face_vertices(1).tolist(), [0, 2, 3])
+
+    def test_interior_vertex(self):
+        he = HalfEdgeStructure.from_faces(grid_faces(2), 9)
+        self.assertFalse(he.is_boundary_vertex(4))
+        self.assertTrue(he.is_boundary_vertex(0))
+        self.assertEqual(sorted(he.one_ring(4).tolist()), [0, 1, 3, 5, 7, 8])
+        self.assertEqual(len(he.vertex_faces(4)), 6)
+        self.assertEqual(int(he.boundary_halfedges.sum()), 8)
+
+    def test_flip(self):
+        he = self.half_edges
+        he.flip(2)
+        offsets, indices = he.to_flat_faces()
+        faces = [sorted(indices[offsets[i]:offsets[i + 1]].tolist()) for i in range(2)]
+        self.assertEqual(sorted(faces), [[0, 1, 3], [1, 2, 3]])
+        self.assertEqual(sorted(he.one_ring(1).tolist()), [0, 2, 3])
+        self.assertEqual(sorted(he.one_ring(0).tolist()), [1, 3])
+        # Flipping back restores the original diagonal
+        he.flip(2)
+        offsets, indices = he.to_flat_faces()
+        self.assertEqual(sorted(sorted(indices[offsets[i]:offsets[i + 1]].tolist()) for i in range(2)), [[0, 1, 2], [0, 2, 3]])
+
+    def test_flip_errors(self):
+        with self.assertRaises(ValueError):
+            self.half_edges.flip(0)
+        quads = HalfEdgeStructure.from_faces([[0, 1, 2, 3], [1, 4, 5, 2]], 6)
+        with self.assertRaises(ValueError):
+            quads.flip(int(np.flatnonzero(quads.twin >= 0)[0]))
+
+    def test_non_manifold_and_unoriented(self):
+        he = HalfEdgeStructure.from_faces([[0, 1, 2], [1, 0, 3], [0, 1, 4]], 5)
+        self.assertFalse(he.is_manifold)
+        with self.assertRaises(ValueError):
+            he.one_ring(0)
+        he = HalfEdgeStructure.from_faces([[0, 1, 2], [0, 1, 3]], 4)
+        self.assertTrue(he.is_manifold)
+        self.assertFalse(he.is_oriented)
+        self.assertEqual(he.face_neighbors(0).tolist(), [1])
+
+    def test_face_adjacency_matches_edge_sort(self):
+        faces = grid_faces(5)
+        he = HalfEdgeStructure.from_faces(faces, 36)
+        rows, cols = he.face_adjacency_pairs()
+        dense = np.zeros((len(faces), len(faces)))
+        dense[rows, cols] = 1.0
+        self.assertTrue(np.array_equal(dense, face_adjacency(*flatten_faces(faces), 36).toarray()))
+
+
+class TestMeshHalfEdges(unittest.TestCase):
+    def test_mesh_uses_half_edges(self):
+        vertices = [Vertex2D(0.0, 0.0), Vertex2D(1.0, 0.0), Vertex2D(1.0, 1.0), Vertex2D(0.0, 1.0)]
+        mesh = TriangleMesh2D(vertices, [[0, 1, 2], [0, 2, 3]])
+        self.assertIs(mesh.half_edges, mesh.half_edges)
+        self.assertEqual(mesh.face_adjacency_matrix.row(0).tolist(), [1])
+        self.assertEqual(mesh.construct_vertex_adjacency_list()[1], [0, 2])
+        mesh.faces = [[0, 1, 3]]
+        self.assertEqual(mesh.half_edges.num_faces, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from comgeo.core.mesh.primitives.face import Face
+from comgeo.core.mesh.primitives.triangle_face import TriangleFace
 from comgeo.core.vertex import Vertex2D, Vertex3D, Vertex
 
 class TestFace(unittest.TestCase):
@@ -56,16 +57,43 @@ class TestFace(unittest.TestCase):
 		other2 = Face([0, 1, 3], id=5, visited=True, max_num_vertices=4)
 		self.assertFalse(self.face == other2)
 
-	def test_center_property(self):
-		# Should raise TypeError due to incorrect property usage
-		with self.assertRaises(TypeError):
-			_ = self.face.center(self.vertices2d)
+	def test_center(self):
+		center = self.face.center(self.vertices2d)
+		self.assertAlmostEqual(center.x, 1.0 / 3.0)
+		self.assertAlmostEqual(center.y, 1.0 / 3.0)
+		self.assertIs(self.face.center(self.vertices3d), center)
+
+	def test_center_follows_vertices(self):
+		self.face.center(self.vertices2d)
+		self.vertices2d[0].set_coordinates(3.0, 0.0)
+		self.assertAlmostEqual(self.face.center(self.vertices2d).x, 4.0 / 3.0)
+		self.face[0] = 1
+		self.assertIsNone(self.face._center)
 
-	def test_center_setter(self):
-		from comgeo.core.vertex import Vertex2D
+	def test_set_center(self):
 		v = Vertex2D(0.5, 0.5)
-		self.face.center = v
-		self.assertEqual(self.face._center, v)
+		self.face.set_center(v)
+		self.assertEqual(self.face.center(self.vertices2d), v)
+		with self.assertRaises(TypeError):
+			self.face.set_center((0.5, 0.5))
+
+	def test_set_values_survive_moves(self):
+		# Whether or not the values were computed before, hand-set ones are kept until the face changes
+		face = TriangleFace([0, 1, 2])
+		face.center(self.vertices2d)
+		self.assertAlmostEqual(face.area(self.vertices2d), 0.5)
+		center = Vertex2D(0.5, 0.5)
+		face.set_center(center)
+		face.set_area(2.0)
+		self.vertices2d[0].set_coordinates(3.0, 0.0)
+		self.assertIs(face.center(self.vertices2d), center)
+		self.assertEqual(face.area(self.vertices2d), 2.0)
+		other = TriangleFace([0, 1, 2])
+		other.set_area(2.0)
+		self.vertices2d[0].set_coordinates(4.0, 0.0)
+		self.assertEqual(other.area(self.vertices2d), 2.0)
+		face[0] = 0
+		self.assertNotEqual(face.area(self.vertices2d), 2.0)
 
 	def test_area_property_not_implemented(self):
 		with self.assertRaises(NotImplementedError):
@@ -95,5 +123,18 @@ class TestFace(unittest.TestCase):
 		with self.assertRaises(NotImplementedError):
 			self.face.point_cloud_sampling(10, self.vertices2d)
 
+	def test_slots_and_unchecked(self):
+		from comgeo.core.mesh.primitives.triangle_face import TriangleFace
+		face = TriangleFace.unchecked([0, 1, 2], id=3)
+		self.assertFalse(hasattr(face, "__dict__"))
+		self.assertEqual(face, TriangleFace([0, 1, 2], id=3))
+		with self.assertRaises(AssertionError):
+			face.vertex_ids = [0, 1, 2, 3]
+
+	def test_from_array_exceeds_max(self):
+		from comgeo.core.mesh.primitives.triangle_face import TriangleFace
+		with self.assertRaises(ValueError):
+			TriangleFace.from_array([[0, 1, 2, 3]])
+
 if __name__ == "__main__":
 	unittest.main()
@@ -3,6 +3,7 @@ import unittest
 import numpy as np
 from comgeo.core.mesh.base import Mesh
 from comgeo.core.vertex import Vertex2D
+from comgeo.core.utils.sparse import CSRMatrix
 
 class DummyVertex:
 	pass
@@ -15,7 +16,8 @@ class TestMesh(unittest.TestCase):
 
 	def test_init(self):
 		self.assertEqual(self.mesh.faces, self.faces)
-		self.assertIsInstance(self.mesh.face_adjacency_matrix, np.ndarray)
+		self.assertIsNone(self.mesh._face_adjacency_matrix)
+		self.assertIsInstance(self.mesh.face_adjacency_matrix, CSRMatrix)
 		self.assertEqual(self.mesh.face_adjacency_matrix.shape, (1, 1))
 		self.assertFalse(self.mesh.has_face_adjacency_matrix)
 
@@ -33,48 +35,167 @@ class TestMesh(unittest.TestCase):
 			Mesh(verts, faces)
 
 	def test_face_adjacency_matrix_properties(self):
-		self.assertIsInstance(self.mesh.face_adjacency_matrix, np.ndarray)
+		self.assertIsInstance(self.mesh.face_adjacency_matrix, CSRMatrix)
 		self.assertFalse(self.mesh.has_face_adjacency_matrix)
 
+	def test_construct_face_adjacency_matrix(self):
+		verts = [Vertex2D(0.0,0.0), Vertex2D(1.0,0.0), Vertex2D(1.0,1.0), Vertex2D(0.0,1.0), Vertex2D(2.0,0.0)]
+		mesh = Mesh(verts, [[0, 1, 2], [0, 2, 3], [1, 4, 2], [3, 2, 4, 0]])
+		self.assertFalse(mesh.has_face_adjacency_matrix)
+		adjacency = mesh.construct_face_adjacency_matrix()
+		self.assertEqual(adjacency.shape, (4, 4))
+		self.assertEqual(adjacency.row(0).tolist(), [1, 2])
+		self.assertEqual(adjacency.row(1).tolist(), [0, 3])
+		self.assertEqual(adjacency.row(3).tolist(), [1, 2])
+		self.assertTrue(np.array_equal(adjacency.toarray(), adjacency.toarray().T))
+		self.assertTrue(mesh.has_face_adjacency_matrix)
+
+	def test_construct_vertex_adjacency_matrix(self):
+		adjacency = self.mesh.construct_vertex_adjacency_matrix()
+		self.assertEqual(adjacency.shape, (3, 3))
+		self.assertEqual(adjacency.toarray().tolist(), [[0, 1, 1], [1, 0, 1], [1, 1, 0]])
+		self.assertTrue(self.mesh.has_vertex_adjacency_matrix)
+
+	def test_faces_setter_resets_adjacency(self):
+		self.assertEqual(self.mesh.face_adjacency_matrix.shape, (1, 1))
+		self.mesh.faces = [[0, 1, 2], [2, 1, 0]]
+		self.assertEqual(self.mesh.face_adjacency_matrix.shape, (2, 2))
+		self.assertTrue(self.mesh.has_face_adjacency_matrix)
+
 	def test_connected_components_properties(self):
-		self.assertIsInstance(self.mesh.connected_components, list)
 		self.assertFalse(self.mesh.has_connected_components)
+		self.assertEqual(self.mesh.connected_components, [[0]])
+		self.assertTrue(self.mesh.has_connected_components)
+
+	def test_construct_connected_components(self):
+		verts = [Vertex2D(float(i), float(i % 3)) for i in range(11)]
+		mesh = Mesh(verts, [[0, 1, 2], [5, 6, 7], [2, 3, 4], [6, 8, 9]])
+		self.assertEqual(mesh.construct_connected_components(), [[0, 2], [1, 3]])
+		self.assertEqual(mesh.vertex2cc, [0, 0, 0, 0, 0, 1, 1, 1, 1, 1, -1])
+		mesh.faces = [[0, 1, 2], [5, 6, 7], [2, 3, 4], [4, 8, 5]]
+		self.assertEqual(mesh.connected_components, [[0, 1, 2, 3]])
 
 	def test_vertex2face_properties(self):
-		self.assertIsInstance(self.mesh.vertex2face, list)
 		self.assertFalse(self.mesh.has_vertex2face)
+		self.assertIsInstance(self.mesh.vertex2face, CSRMatrix)
+		self.assertTrue(self.mesh.has_vertex2face)
+
+	def test_construct_vertex2face(self):
+		verts = [Vertex2D(0.0,0.0), Vertex2D(1.0,0.0), Vertex2D(1.0,1.0), Vertex2D(0.0,1.0), Vertex2D(2.0,0.0), Vertex2D(3.0,3.0)]
+		mesh = Mesh(verts, [[0, 1, 2], [0, 2, 3], [1, 4, 2], [3, 2, 4, 0]])
+		incidence = mesh.construct_vertex2face()
+		self.assertEqual(incidence.shape, (6, 4))
+		self.assertEqual(incidence.indptr.tolist(), [0, 3, 5, 9, 11, 13, 13])
+		self.assertEqual(mesh.vertex_faces(2).tolist(), [0, 1, 2, 3])
+		self.assertEqual(mesh.vertex_faces(5).tolist(), [])
+		self.assertTrue(np.shares_memory(mesh.vertex_faces(0), incidence.indices))
+		mesh.faces = [[0, 1, 2]]
+		self.assertFalse(mesh.has_vertex2face)
+		self.assertEqual(mesh.vertex2face.shape, (6, 1))
+
+	def test_face_geometry_properties(self):
+		self.assertFalse(self.mesh.has_face_geometry)
+		self.assertEqual(self.mesh.face_areas.tolist(), [0.5])
+		self.assertTrue(self.mesh.has_face_geometry)
+		self.assertIsNone(self.mesh.face_normals)
+		self.mesh.faces = [[0, 2, 1]]
+		self.assertFalse(self.mesh.has_face_geometry)
+
+	def test_construct_face_geometry(self):
+		from comgeo.core.vertex import Vertex3D
+		from comgeo.core.mesh.primitives.quad_face import QuadFace
+		from comgeo.core.mesh.primitives.triangle_face import TriangleFace
+		verts = [Vertex3D(0.0,0.0,0.0), Vertex3D(2.0,0.0,0.0), Vertex3D(2.0,2.0,0.0), Vertex3D(0.0,2.0,0.0), Vertex3D(0.0,0.0,3.0)]
+		faces = [[0, 1, 2, 3], [0, 4, 1], [1, 2, 4]]
+		mesh = Mesh(verts, faces)
+		geometry = mesh.construct_face_geometry()
+		self.assertTrue(np.allclose(geometry["areas"], [4.0, 3.0, np.sqrt(13.0)]))
+		self.assertAlmostEqual(mesh.face_area(0), QuadFace(faces[0]).area(verts))
+		self.assertAlmostEqual(mesh.face_area(2), TriangleFace(faces[2]).area(verts))
+		self.assertTrue(np.allclose(mesh.face_centroid(0), [1.0, 1.0, 0.0]))
+		self.assertTrue(np.allclose(mesh.face_bounds[1], [[0.0, 0.0, 0.0], [2.0, 0.0, 3.0]]))
+		self.assertTrue(np.allclose(mesh.face_normals[:2], [[0.0, 0.0, 1.0], [0.0, 1.0, 0.0]]))
+		self.assertTrue(np.allclose(np.linalg.norm(mesh.face_normals, axis=1), 1.0))
+
+	def test_caches_follow_versions(self):
+		from comgeo.core.vertex import VertexArray2D
+		from comgeo.core.mesh.primitives.triangle_face import TriangleFace
+		mesh = Mesh(VertexArray2D(np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])), [[0, 1, 2]])
+		self.assertEqual(mesh.face_areas.tolist(), [0.5])
+		adjacency = mesh.vertex_adjacency_matrix
+		mesh.vertices[1].x = 2.0
+		self.assertEqual(mesh.face_areas.tolist(), [1.0])
+		# Moving vertices keeps the topology
+		self.assertIs(mesh.vertex_adjacency_matrix, adjacency)
+		mesh.vertices.coordinates[1, 0] = 3.0
+		self.assertEqual(mesh.face_areas.tolist(), [1.0])
+		mesh.vertices.mark_modified()
+		self.assertEqual(mesh.face_areas.tolist(), [1.5])
+		mesh.faces[0][2] = 3
+		self.assertEqual(mesh.vertex_faces(3).tolist(), [])
+		mesh.invalidate_caches()
+		self.assertEqual(mesh.vertex_faces(3).tolist(), [0])
+		self.assertIsNot(mesh.vertex_adjacency_matrix, adjacency)
+		# Face objects report their own edits
+		mesh.faces = [TriangleFace([0, 1, 2])]
+		version = mesh.topology_version
+		self.assertEqual(mesh.vertex_faces(2).tolist(), [0])
+		mesh.faces[0][2] = 3
+		self.assertNotEqual(mesh.topology_version, version)
+		self.assertEqual(mesh.vertex_faces(2).tolist(), [])
+
+	def test_caches_are_per_mesh(self):
+		from comgeo.core.vertex import Vertex2D, VertexArray2D
+		from comgeo.core.mesh.primitives.triangle_face import TriangleFace
+		square = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+		mesh_b = Mesh([Vertex2D(*point) for point in square.tolist()], [TriangleFace([0, 1, 2])])
+		array_b = Mesh(VertexArray2D(square.copy()), [TriangleFace([0, 1, 2])])
+		geometry, array_geometry = mesh_b.face_geometry, array_b.face_geometry
+		adjacency = mesh_b.face_adjacency_matrix
+
+		# Building, slicing, editing and replacing the faces of mesh A
+		vertices = VertexArray2D(square.copy())
+		mesh_a = Mesh(vertices[:4], [TriangleFace([0, 1, 2]), TriangleFace([1, 3, 2])])
+		self.assertEqual(mesh_a.face_areas.tolist(), [0.5, 0.5])
+		mesh_a.vertices.coordinates[3, 0] = 2.0
+		mesh_a.vertices.mark_modified()
+		self.assertEqual(mesh_a.face_areas.tolist(), [0.5, 1.0])
+		mesh_a.faces[0][1] = 3
+		self.assertEqual(mesh_a.face_areas.tolist(), [1.0, 1.0])
+		mesh_a.faces = [TriangleFace([0, 1, 2])]
+		mesh_a.invalidate_caches()
+		self.assertEqual(mesh_a.face_areas.tolist(), [0.5])
+
+		self.assertIs(mesh_b.face_geometry, geometry)
+		self.assertIs(mesh_b.face_adjacency_matrix, adjacency)
+		self.assertIs(array_b.face_geometry, array_geometry)
 
 	def test_vertex2cc_properties(self):
-		self.assertIsInstance(self.mesh.vertex2cc, list)
 		self.assertFalse(self.mesh.has_vertex2cc)
+		self.assertEqual(self.mesh.vertex2cc, [0, 0, 0])
+		self.assertTrue(self.mesh.has_vertex2cc)
 
 	def test_vertex_adjacency_matrix_properties(self):
-		self.assertIsInstance(self.mesh.vertex_adjacency_matrix, np.ndarray)
 		self.assertFalse(self.mesh.has_vertex_adjacency_matrix)
+		self.assertIsInstance(self.mesh.vertex_adjacency_matrix, CSRMatrix)
+		self.assertTrue(self.mesh.has_vertex_adjacency_matrix)
 
 	def test_vertex_adjacency_list_properties(self):
 		# Accept dict or list for compatibility with implementation
 		self.assertTrue(isinstance(self.mesh.vertex_adjacency_list, (list, dict)))
 		self.assertFalse(self.mesh.has_vertex_adjacency_list)
 
+	def test_construct_vertex_adjacency_list(self):
+		adjacency = self.mesh.construct_vertex_adjacency_list()
+		self.assertEqual(adjacency, {0: [1, 2], 1: [0, 2], 2: [0, 1]})
+		self.assertTrue(self.mesh.has_vertex_adjacency_list)
+
 	def test_not_self_implemented_methods(self):
 		# All should raise NotImplementedError
 		with self.assertRaises(NotImplementedError):
 			Mesh.from_file_path('dummy.obj')
 		with self.assertRaises(NotImplementedError):
 			self.mesh.export_to_file_path('dummy.obj')
-		with self.assertRaises(NotImplementedError):
-			self.mesh.construct_face_adjacency_matrix()
-		with self.assertRaises(NotImplementedError):
-			self.mesh.construct_connected_components()
-		with self.assertRaises(NotImplementedError):
-			self.mesh.construct_vertex2face()
-		with self.assertRaises(NotImplementedError):
-			self.mesh.construct_vertex2cc()
-		with self.assertRaises(NotImplementedError):
-			self.mesh.construct_vertex_adjacency_matrix()
-		with self.assertRaises(NotImplementedError):
-			self.mesh.construct_vertex_adjacency_list()
 		with self.assertRaises(NotImplementedError):
 			self.mesh.point_cloud_sampling(10)
 		with self.assertRaises(NotImplementedError):
@@ -0,0 +1,162 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from comgeo.core.mesh.triangle_mesh import TriangleMesh2D, TriangleMesh3D
+from comgeo.core.mesh.quad_mesh import QuadMesh2D, QuadMesh3D
+from comgeo.core.vertex import Vertex2D, Vertex3D, VertexArray2D, VertexArray3D
+from comgeo.core.utils.parallel import backend
+from comgeo.functional.mesh.geometry import face_areas, triangle_areas
+from comgeo.functional.polygon.area import get_area
+
+
+class TestBasicMeshSampling(unittest.TestCase):
+	def setUp(self):
+		# Unit square split into a small and a large triangle (areas 0.25 and 0.75)
+		self.vertices = [Vertex2D(0.0, 0.0), Vertex2D(1.0, 0.0), Vertex2D(1.0, 1.0), Vertex2D(0.0, 1.0), Vertex2D(0.5, 0.0)]
+		self.mesh = TriangleMesh2D(self.vertices, [[0, 4, 3], [4, 1, 2], [4, 2, 3]])
+
+	def test_face_areas(self):
+		areas = face_areas(self.mesh.vertex_coordinates, self.mesh.face_array)
+		np.testing.assert_allclose(areas, [0.25, 0.25, 0.5])
+
+	def test_point_cloud_sampling(self):
+		points = self.mesh.point_cloud_sampling(100, rng=0)
+		self.assertIsInstance(points, list)
+		self.assertEqual(len(points), 100)
+		self.assertTrue(all(isinstance(point, Vertex2D) for point in points))
+		coordinates = np.array([point.coordinates for point in points])
+		np.testing.assert_array_equal(coordinates, self.mesh.point_cloud_sampling_array(100, rng=0))
+		self.assertTrue(np.all((coordinates >= 0.0) & (coordinates <= 1.0)))
+
+	def test_seed_is_reproducible(self):
+		a = self.mesh.point_cloud_sampling_array(50, rng=1)
+		b = self.mesh.point_cloud_sampling_array(50, rng=np.random.default_rng(1))
+		np.testing.assert_array_equal(a, b)
+
+	def test_face_index_and_barycentric(self):
+		points, face_index, weights = self.mesh.point_cloud_sampling_array(
+			1000, rng=2, return_face_index=True, return_barycentric=True
+		)
+		self.assertEqual(points.shape, (1000, 2))
+		self.assertEqual(weights.shape, (1000, 3))
+		np.testing.assert_allclose(weights.sum(axis=1), 1.0)
+		corners = self.mesh.vertex_coordinates[self.mesh.face_array[face_index]]
+		np.testing.assert_allclose(np.einsum("nk,nkd->nd", weights, corners), points)
+
+	def test_area_proportional_allocation(self):
+		_, face_index = self.mesh.point_cloud_sampling_array(40000, rng=3, return_face_index=True)
+		fractions = np.bincount(face_index, minlength=3) / 40000
+		np.testing.assert_allclose(fractions, [0.25, 0.25, 0.5], atol=0.02)
+
+	def test_quad_mesh(self):
+		vertices = VertexArray2D(np.array([[0.0, 0.0], [2.0, 0.0], [2.0, 1.0], [0.0, 1.0]]))
+		mesh = QuadMesh2D(vertices, [[0, 1, 2, 3]])
+		points, weights = mesh.point_cloud_sampling_array(200, rng=4, return_barycentric=True)
+		self.assertEqual(weights.shape, (200, 4))
+		self.assertTrue(np.all(points[:, 0] <= 2.0) and np.all(points[:, 1] <= 1.0))
+
+	def test_quad_mesh_is_area_uniform(self):
+		# Symmetric trapezoid with area centroid (1, 4 / 9)
+		vertices = VertexArray2D(np.array([[0.0, 0.0], [2.0, 0.0], [1.5, 1.0], [0.5, 1.0]]))
+		mesh = QuadMesh2D(vertices, [[0, 1, 2, 3]])
+		points = mesh.point_cloud_sampling_array(200000, rng=11)
+		np.testing.assert_allclose(points.mean(axis=0), [1.0, 4.0 / 9.0], atol=5e-3)
+
+	def test_concave_and_convex_quads(self):
+		# Planar dart (area 1.5) whose 0-2 diagonal lies outside, a unit square and a non-planar dart
+		coordinates = np.array([
+			[0.0, 0.0, 0.0], [2.0, 1.0, 0.0], [0.0, 2.0, 0.0], [0.5, 1.0, 0.0],
+			[3.0, 0.0, 0.0], [4.0, 0.0, 0.0], [4.0, 1.0, 0.0], [3.0, 1.0, 0.0],
+			[5.0, 0.0, 0.0], [7.0, 1.0, 0.0], [5.0, 2.0, 0.0], [5.5, 1.0, 0.5]
+		])
+		mesh = QuadMesh3D(VertexArray3D(coordinates), [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 10, 11]])
+		areas = face_areas(mesh.vertex_coordinates, mesh.face_array)
+		np.testing.assert_allclose(areas[:2], [1.5, 1.0])
+		np.testing.assert_allclose(mesh.face_areas, areas)
+		np.testing.assert_allclose([get_area(Vertex3D.from_array(coordinates[face])) for face in mesh.face_array], areas)
+
+		# The non-planar dart is measured on the 0-1-3 and 1-2-3 triangles the sampler draws from
+		split = triangle_areas(coordinates[[8, 9]], coordinates[[9, 10]], coordinates[[11, 11]])
+		self.assertAlmostEqual(areas[2], split.sum())
+
+		points, face_index, weights = mesh.point_cloud_sampling_array(
+			200000, rng=12, return_face_index=True, return_barycentric=True
+		)
+		darts = face_index != 1
+		self.assertTrue(np.all(np.minimum(weights[darts, 0], weights[darts, 2]) == 0.0))
+		np.testing.assert_allclose(np.bincount(face_index) / len(points), areas / areas.sum(), atol=5e-3)
+		dart = points[face_index == 0]
+		np.testing.assert_allclose(dart.mean(axis=0)[:2], [5.0 / 6.0, 1.0], atol=1e-2)
+
+	def test_3d_mesh(self):
+		vertices = [Vertex3D(0.0, 0.0, 0.0), Vertex3D(1.0, 0.0, 0.0), Vertex3D(0.0, 1.0, 1.0)]
+		mesh = TriangleMesh3D(vertices, [[0, 1, 2]])
+		points = mesh.point_cloud_sampling(10, rng=5)
+		self.assertTrue(all(isinstance(point, Vertex3D) for point in points))
+		np.testing.assert_allclose([point.y for point in points], [point.z for point in points])
+
+	def test_chunked_sampling_is_backend_independent(self):
+		points, face_index, weights = self.mesh.point_cloud_sampling_array(
+			1000, rng=6, return_face_index=True, return_barycentric=True, chunk_size=128
+		)
+		corners = self.mesh.vertex_coordinates[self.mesh.face_array[face_index]]
+		np.testing.assert_allclose(np.einsum("nk,nkd->nd", weights, corners), points)
+		for kind in ("thread", "process"):
+			with backend(kind, num_workers=2, chunk_size=128):
+				np.testing.assert_array_equal(self.mesh.point_cloud_sampling_array(1000, rng=6), points)
+		# A single chunk matches the unchunked draw
+		np.testing.assert_array_equal(
+			self.mesh.point_cloud_sampling_array(100, rng=7, chunk_size=100),
+			self.mesh.point_cloud_sampling_array(100, rng=7)
+		)
+
+	def test_streaming_chunks(self):
+		chunks = list(self.mesh.point_cloud_sampling_chunks(1000, 300, rng=8, return_face_index=True))
+		self.assertEqual([len(points) for points, _ in chunks], [300, 300, 300, 100])
+		points, face_index = self.mesh.point_cloud_sampling_array(1000, rng=8, return_face_index=True, chunk_size=300)
+		np.testing.assert_array_equal(np.concatenate([chunk[0] for chunk in chunks]), points)
+		np.testing.assert_array_equal(np.concatenate([chunk[1] for chunk in chunks]), face_index)
+		with backend("thread", num_workers=3):
+			np.testing.assert_array_equal(np.concatenate(list(self.mesh.point_cloud_sampling_chunks(1000, 300, rng=8))), points)
+
+	def test_streaming_keeps_area_distribution(self):
+		counts = np.zeros(3)
+		for _, face_index in self.mesh.point_cloud_sampling_chunks(40000, 1000, rng=9, return_face_index=True):
+			counts += np.bincount(face_index, minlength=3)
+		np.testing.assert_allclose(counts / 40000, [0.25, 0.25, 0.5], atol=0.02)
+
+	def test_streaming_to_file(self):
+		expected = self.mesh.point_cloud_sampling_array(500, rng=10, chunk_size=128)
+		with tempfile.TemporaryDirectory() as directory:
+			out = self.mesh.point_cloud_sampling_to_file(500, os.path.join(directory, "points.npy"), 128, rng=10)
+			np.testing.assert_array_equal(out, expected)
+			del out
+			np.testing.assert_array_equal(np.load(os.path.join(directory, "points.npy")), expected)
+			path = os.path.join(directory, "points.bin")
+			self.mesh.point_cloud_sampling_to_file(500, path, 128, rng=10)
+			np.testing.assert_array_equal(np.fromfile(path).reshape(500, 2), expected)
+		out = np.empty((500, 2))
+		self.assertIs(self.mesh.point_cloud_sampling_to_file(500, out, 128, rng=10), out)
+		np.testing.assert_array_equal(out, expected)
+		with self.assertRaises(ValueError):
+			self.mesh.point_cloud_sampling_to_file(500, np.empty((10, 2)), 128)
+		with self.assertRaises(ValueError):
+			self.mesh.point_cloud_sampling_chunks(10, 0)
+
+	def test_numpy_integer_counts(self):
+		points = self.mesh.point_cloud_sampling_array(np.int64(20), rng=12, chunk_size=np.int32(8))
+		self.assertEqual(points.shape, (20, 2))
+		self.assertEqual(sum(len(chunk) for chunk in self.mesh.point_cloud_sampling_chunks(np.uint32(20), np.int64(8))), 20)
+
+	def test_invalid_num_points(self):
+		with self.assertRaises(ValueError):
+			self.mesh.point_cloud_sampling(-1)
+		with self.assertRaises(ValueError):
+			self.mesh.point_cloud_sampling_array(2.0)
+		with self.assertRaises(ValueError):
+			self.mesh.point_cloud_sampling_array(True)
+
+if __name__ == "__main__":
+	unittest.main()
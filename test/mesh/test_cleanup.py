@@ -0,0 +1,154 @@
+import unittest
+from unittest import mock
+import numpy as np
+
+from comgeo.core.mesh.base import Mesh
+from comgeo.core.mesh.quad_mesh import QuadMesh2D
+from comgeo.core.mesh.triangle_mesh import TriangleMesh3D
+from comgeo.core.mesh.primitives.triangle_face import TriangleFace
+from comgeo.core.vertex import Vertex2D, Vertex3D, VertexArray3D
+from comgeo.functional.mesh import cleanup
+from comgeo.functional.mesh.cleanup import clean_mesh, degenerate_faces, duplicate_faces, weld_vertices
+from comgeo.functional.mesh.topology import flatten_faces
+
+
+class TestWeldVertices(unittest.TestCase):
+	def test_exact(self):
+		coordinates = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 0.0], [1.0, 0.0], [2.0, 0.0]])
+		self.assertEqual(weld_vertices(coordinates).tolist(), [0, 1, 0, 1, 4])
+
+	def test_tolerance_across_cells(self):
+		# 0.099 and 0.101 fall into different cells of size 0.1
+		coordinates = np.array([[0.099, 0.0], [0.101, 0.0], [0.5, 0.5]])
+		self.assertEqual(weld_vertices(coordinates, 0.1).tolist(), [0, 0, 2])
+
+	def test_tolerance_is_transitive(self):
+		coordinates = np.array([[0.0, 0.0, 0.0], [0.08, 0.0, 0.0], [0.16, 0.0, 0.0], [1.0, 1.0, 1.0]])
+		self.assertEqual(weld_vertices(coordinates, 0.1).tolist(), [0, 0, 0, 3])
+
+	def test_matches_brute_force(self):
+		rng = np.random.default_rng(3)
+		coordinates = rng.random((200, 2))
+		tolerance = 0.04
+		close = np.linalg.norm(coordinates[:, None] - coordinates[None], axis=2) <= tolerance
+		labels = np.arange(len(coordinates))
+		for _ in range(len(coordinates)):
+			labels = np.array([labels[row].min() for row in close])
+		self.assertEqual(weld_vertices(coordinates, tolerance).tolist(), labels.tolist())
+
+	def test_every_point_in_one_cell(self):
+		# 200k points within one cell are welded without comparing any pair
+		coordinates = np.random.default_rng(4).random((200000, 3)) * 1e-4
+		with mock.patch.object(cleanup, "_PAIR_BUDGET", 1000):
+			self.assertTrue(np.all(weld_vertices(coordinates, 1.0) == 0))
+
+	def test_dense_neighbouring_cells(self):
+		# Two dense clusters in neighbouring cells, compared under a tiny pair budget
+		rng = np.random.default_rng(5)
+		cluster = rng.random((3000, 2)) * 0.01
+		coordinates = np.concatenate([cluster, cluster + [0.05, 0.0]])
+		with mock.patch.object(cleanup, "_PAIR_BUDGET", 64):
+			self.assertEqual(np.unique(weld_vertices(coordinates, 0.045)).tolist(), [0])
+			self.assertEqual(len(np.unique(weld_vertices(coordinates, 0.035))), 2)
+
+	def test_bounded_batches_match_brute_force(self):
+		rng = np.random.default_rng(6)
+		for dim in (2, 3):
+			coordinates = rng.random((150, dim))
+			expected = weld_vertices(coordinates, 0.1)
+			with mock.patch.object(cleanup, "_PAIR_BUDGET", 5):
+				self.assertEqual(weld_vertices(coordinates, 0.1).tolist(), expected.tolist())
+
+	def test_negative_tolerance(self):
+		with self.assertRaises(ValueError):
+			weld_vertices(np.zeros((2, 2)), -1.0)
+
+
+class TestFaceFilters(unittest.TestCase):
+	def setUp(self):
+		self.coordinates = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0], [2.0, 2.0]])
+
+	def test_degenerate_faces(self):
+		offsets, indices = flatten_faces([[0, 1, 2], [0, 0, 1], [0, 3, 4], [0, 1, 3, 1], [0, 1, 3, 2]])
+		self.assertEqual(degenerate_faces(self.coordinates, offsets, indices).tolist(), [False, True, True, True, False])
+
+	def test_area_tolerance(self):
+		offsets, indices = flatten_faces([[0, 1, 2], [0, 1, 3, 2]])
+		self.assertEqual(degenerate_faces(self.coordinates, offsets, indices, area_tolerance=0.75).tolist(), [True, False])
+
+	def test_duplicate_faces(self):
+		offsets, indices = flatten_faces([[0, 1, 2], [2, 1, 0], [1, 2, 0], [1, 2, 3], [0, 1, 2, 3]])
+		self.assertEqual(duplicate_faces(offsets, indices).tolist(), [False, True, True, False, False])
+
+
+class TestCleanMesh(unittest.TestCase):
+	def test_report(self):
+		coordinates = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0], [0.0, 0.0], [2.0, 2.0], [5.0, 5.0]])
+		offsets, indices = flatten_faces([[0, 1, 2], [4, 1, 2], [1, 3, 2], [2, 1, 3], [0, 1, 3, 0], [0, 1, 5], [0, 3, 5]])
+		coordinates, offsets, indices, report = clean_mesh(coordinates, offsets, indices)
+		self.assertEqual(report["welded_vertices"], 1)
+		self.assertEqual(report["degenerate_faces"], 2)
+		self.assertEqual(report["duplicate_faces"], 2)
+		self.assertEqual(report["unused_vertices"], 1)
+		self.assertEqual(report["vertex_map"].tolist(), [0, 1, 2, 3, 0, 4, -1])
+		self.assertEqual(report["kept_vertices"].tolist(), [0, 1, 2, 3, 5])
+		self.assertEqual(report["kept_faces"].tolist(), [0, 2, 5])
+		self.assertEqual(coordinates.tolist(), [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0], [2.0, 2.0]])
+		self.assertEqual(offsets.tolist(), [0, 3, 6, 9])
+		self.assertEqual(indices.tolist(), [0, 1, 2, 1, 3, 2, 0, 1, 4])
+
+
+class TestMeshCleanup(unittest.TestCase):
+	def setUp(self):
+		self.coordinates = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 1.0, 0.0], [0.0, 0.0, 1e-9], [9.0, 9.0, 9.0]])
+		self.faces = [[0, 1, 2], [4, 1, 2], [1, 3, 2], [0, 1, 3]]
+
+	def test_triangle_mesh_vertex_array(self):
+		mesh = TriangleMesh3D(VertexArray3D(self.coordinates, ids=np.arange(6)), self.faces)
+		mesh.construct_face_adjacency_matrix()
+		report = mesh.cleanup(tolerance=1e-6)
+		self.assertEqual((report["welded_vertices"], report["duplicate_faces"], report["unused_vertices"]), (1, 1, 1))
+		self.assertIsInstance(mesh.vertices, VertexArray3D)
+		self.assertEqual(mesh.vertices.ids.tolist(), [0, 1, 2, 3])
+		self.assertIsInstance(mesh.faces[0], TriangleFace)
+		self.assertEqual(mesh.face_array.tolist(), [[0, 1, 2], [1, 3, 2], [0, 1, 3]])
+		self.assertEqual(mesh.face_adjacency_matrix.shape, (3, 3))
+
+	def test_triangle_mesh_vertex_list(self):
+		vertices = Vertex3D.from_array(self.coordinates, ids=np.arange(6))
+		mesh = TriangleMesh3D(vertices, self.faces)
+		report = mesh.cleanup()
+		self.assertEqual(report["welded_vertices"], 0)
+		self.assertEqual([v.id for v in mesh.vertices], [0, 1, 2, 3, 4])
+		self.assertIs(mesh.vertices[4], vertices[4])
+
+	def test_quad_mesh(self):
+		vertices = [Vertex2D(0.0, 0.0), Vertex2D(1.0, 0.0), Vertex2D(1.0, 1.0), Vertex2D(0.0, 1.0), Vertex2D(2.0, 0.0)]
+		mesh = QuadMesh2D(vertices, [[0, 1, 2, 3], [3, 2, 1, 0], [0, 1, 4, 1]])
+		report = mesh.cleanup()
+		self.assertEqual((report["duplicate_faces"], report["degenerate_faces"], report["unused_vertices"]), (1, 1, 1))
+		self.assertEqual(mesh.face_array.tolist(), [[0, 1, 2, 3]])
+
+	def test_base_mesh_edges(self):
+		vertices = [Vertex2D(0.0, 0.0), Vertex2D(5.0, 5.0), Vertex2D(1.0, 0.0), Vertex2D(0.0, 1.0)]
+		mesh = Mesh(vertices, [[0, 2, 3]])
+		mesh.add_vertex(Vertex2D(3.0, 3.0), [0, 1])
+		mesh.cleanup()
+		self.assertEqual(mesh.faces, [[0, 1, 2]])
+		self.assertEqual(len(mesh.vertices), 3)
+		self.assertEqual(mesh.adjacency_list[-1], [0])
+
+	def test_removing_every_face(self):
+		mesh = Mesh([Vertex2D(0.0, 0.0), Vertex2D(1.0, 0.0), Vertex2D(2.0, 0.0)], [[0, 1, 2]])
+		with self.assertRaises(ValueError):
+			mesh.cleanup()
+		self.assertEqual(mesh.faces, [[0, 1, 2]])
+
+	def test_invalid_tolerance(self):
+		mesh = Mesh([Vertex2D(0.0, 0.0), Vertex2D(1.0, 0.0), Vertex2D(0.0, 1.0)], [[0, 1, 2]])
+		with self.assertRaises(TypeError):
+			mesh.cleanup(tolerance=1)
+
+
+if __name__ == "__main__":
+	unittest.main()
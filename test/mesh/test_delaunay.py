@@ -0,0 +1,75 @@
+import unittest
+import numpy as np
+
+from comgeo.core.mesh.triangle_mesh import TriangleMesh2D
+from comgeo.core.vertex import Vertex2D, VertexArray2D
+from comgeo.functional.mesh.delaunay.dt import delaunay_triangulation
+
+
+def _signed_areas(points, faces):
+	a, b, c = points[faces[:, 0]], points[faces[:, 1]], points[faces[:, 2]]
+	return (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+
+
+def _empty_circumcircles(points, faces, tol=1e-9):
+	for face in faces:
+		a, b, c = points[face]
+		d = points - points[face[0]]
+		ba, ca = b - a, c - a
+		# Incircle determinant of (a, b, c, p) relative to a, positive when p lies inside
+		inside = (
+			(ca @ ca) * (ba[0] * d[:, 1] - ba[1] * d[:, 0])
+			- (ba @ ba) * (ca[0] * d[:, 1] - ca[1] * d[:, 0])
+			- (d * d).sum(axis=1) * (ba[0] * ca[1] - ba[1] * ca[0])
+		)
+		inside[face] = 0.0
+		if np.any(inside > tol):
+			return False
+	return True
+
+
+class TestDelaunayTriangulation(unittest.TestCase):
+	def test_square(self):
+		vertices = [Vertex2D(0.0, 0.0), Vertex2D(1.0, 0.0), Vertex2D(1.0, 1.0), Vertex2D(0.0, 1.0), Vertex2D(0.5, 0.4)]
+		mesh = delaunay_triangulation(vertices)
+		self.assertIsInstance(mesh, TriangleMesh2D)
+		self.assertEqual(len(mesh.faces), 4)
+		self.assertEqual([v.id for v in vertices], [0, 1, 2, 3, 4])
+
+	def test_random_points_are_delaunay(self):
+		points = np.random.default_rng(0).random((300, 2))
+		mesh = delaunay_triangulation(VertexArray2D(points))
+		faces = mesh.face_array
+		self.assertTrue(np.all(_signed_areas(points, faces) > 0.0))
+		self.assertTrue(_empty_circumcircles(points, faces))
+		# The triangles tile the convex hull of the unit-square sample
+		self.assertLess(len(faces), 2 * len(points))
+
+	def test_grid_with_cocircular_points(self):
+		x, y = np.meshgrid(np.arange(6.0), np.arange(6.0))
+		points = np.stack([x.ravel(), y.ravel()], axis=1)
+		mesh = delaunay_triangulation(VertexArray2D(points))
+		# Euler: 2n - 2 - h triangles for n points with h on the hull
+		self.assertEqual(len(mesh.faces), 2 * 36 - 2 - 20)
+		self.assertAlmostEqual(_signed_areas(points, mesh.face_array).sum() / 2.0, 25.0)
+
+	def test_duplicates_are_skipped(self):
+		points = np.random.default_rng(1).random((40, 2))
+		mesh = delaunay_triangulation(VertexArray2D(np.concatenate([points, points[:10]])))
+		faces = mesh.face_array
+		# Each location is referenced through exactly one of its copies
+		self.assertEqual(len(np.unique(faces)), 40)
+		self.assertEqual(len(np.unique(np.sort(faces, axis=1), axis=0)), len(faces))
+		self.assertTrue(_empty_circumcircles(mesh.vertex_coordinates, faces))
+
+	def test_invalid_input(self):
+		with self.assertRaises(TypeError):
+			delaunay_triangulation(np.zeros((3, 2)))
+		with self.assertRaises(ValueError):
+			delaunay_triangulation([Vertex2D(0.0, 0.0), Vertex2D(1.0, 0.0)])
+		with self.assertRaises(ValueError):
+			delaunay_triangulation([Vertex2D(0.0, 0.0), Vertex2D(1.0, 1.0), Vertex2D(2.0, 2.0)])
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,199 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+
+from comgeo.core.mesh.hybrid import HybridMesh
+from comgeo.core.mesh.triangle_mesh import TriangleMesh3D
+from comgeo.core.vertex import Vertex3D, VertexArray3D
+from comgeo.functional.mesh.io.cgm import ALIGNMENT, load_cgm, save_cgm
+from comgeo.functional.mesh.io.load import load_mesh
+from comgeo.functional.mesh.io.obj import read_obj, read_obj_arrays
+from comgeo.functional.mesh.topology import face_lists
+
+
+OBJ = """# unit square with a triangle fan
+o square
+v 0 0 0
+v 1 0 0
+vt 0.5 0.5
+vn 0 0 1
+v 1.0 1.0 0.0
+v 0 1 0
+f 1/1/1 2/1/1 3/1/1
+f -4//1 -2//1 -1//1
+f 1 2 3 4
+"""
+
+
+class TestReadObj(unittest.TestCase):
+	def setUp(self):
+		handle, self.path = tempfile.mkstemp(suffix=".obj")
+		with os.fdopen(handle, "w") as file:
+			file.write(OBJ)
+
+	def tearDown(self):
+		os.remove(self.path)
+
+	def test_read_obj_arrays(self):
+		vertices, normals, faces = read_obj_arrays(self.path)
+		np.testing.assert_array_equal(vertices, [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+		np.testing.assert_array_equal(normals, [[0, 0, 1]])
+		self.assertEqual(faces.dtype, np.int64)
+		np.testing.assert_array_equal(faces, [[0, 1, 2, -1], [0, 2, 3, -1], [0, 1, 2, 3]])
+
+	def test_matches_read_obj(self):
+		vertices, normals, faces = read_obj_arrays(self.path)
+		legacy_vertices, legacy_normals, legacy_faces = read_obj(self.path)
+		np.testing.assert_array_equal(vertices, legacy_vertices)
+		np.testing.assert_array_equal(normals, legacy_normals)
+		self.assertEqual(face_lists(faces)[0], legacy_faces[0])
+		self.assertEqual(face_lists(faces)[2], legacy_faces[2])
+
+	def test_indented_and_tab_separated_records(self):
+		with open(self.path, "w") as file:
+			file.write("  v 1 0 0\n\tv\t0\t1\t0\nv 0 0 1\n \n\t vn 0 0 1\n   f 1 2 3\nf\t3/1\t2/1\t1/1\n")
+		vertices, normals, faces = read_obj_arrays(self.path)
+		np.testing.assert_array_equal(vertices, [[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+		np.testing.assert_array_equal(normals, [[0, 0, 1]])
+		np.testing.assert_array_equal(faces, [[0, 1, 2], [2, 1, 0]])
+		legacy_vertices, legacy_normals, legacy_faces = read_obj(self.path)
+		np.testing.assert_array_equal(vertices, legacy_vertices)
+		np.testing.assert_array_equal(normals, legacy_normals)
+		self.assertEqual(face_lists(faces), legacy_faces)
+
+	def test_load_mesh(self):
+		vertices, faces = load_mesh(self.path, dim=3)
+		self.assertIsInstance(vertices[0], Vertex3D)
+		self.assertEqual([v.id for v in vertices], [0, 1, 2, 3])
+		self.assertEqual(faces, [[0, 1, 2], [0, 2, 3], [0, 1, 2, 3]])
+
+	def test_load_mesh_normals(self):
+		with open(self.path, "a") as file:
+			file.write("vn 0 0 1\nvn 0 0 1\nvn 0 0 -1\n")
+		vertices, _ = load_mesh(self.path, dim=3)
+		self.assertEqual([v.normal for v in vertices], [(0.0, 0.0, 1.0)] * 3 + [(0.0, 0.0, -1.0)])
+		vertices, _ = load_mesh(self.path, dim=3, as_array=True)
+		np.testing.assert_array_equal(vertices.normals, [[0.0, 0.0, 1.0]] * 3 + [[0.0, 0.0, -1.0]])
+
+	def test_load_mesh_as_array(self):
+		vertices, faces = load_mesh(self.path, dim=3, as_array=True)
+		self.assertIsInstance(vertices, VertexArray3D)
+		np.testing.assert_array_equal(vertices.ids, [0, 1, 2, 3])
+		self.assertEqual(faces.shape, (3, 4))
+
+	def test_load_mesh_wrong_dim(self):
+		with self.assertRaises(Warning):
+			load_mesh(self.path, dim=2)
+
+	def test_mesh_from_face_array(self):
+		vertices, faces = load_mesh(self.path, dim=3, as_array=True)
+		mesh = HybridMesh(vertices, faces, dim=3)
+		self.assertEqual([face.vertex_ids for face in mesh.faces], [[0, 1, 2], [0, 2, 3], [0, 1, 2, 3]])
+		offsets, indices = mesh.flat_faces
+		np.testing.assert_array_equal(offsets, [0, 3, 6, 10])
+		np.testing.assert_array_equal(indices, [0, 1, 2, 0, 2, 3, 0, 1, 2, 3])
+
+	def test_triangle_mesh_from_file_path(self):
+		with open(self.path, "w") as file:
+			file.write("v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n")
+		mesh = TriangleMesh3D.from_file_path(self.path, as_array=True)
+		self.assertIsInstance(mesh.vertices, VertexArray3D)
+		np.testing.assert_array_equal(mesh.face_array, [[0, 1, 2]])
+
+
+if __name__ == '__main__':
+	unittest.main()
+
+
+class TestCgm(unittest.TestCase):
+	def setUp(self):
+		self.directory = tempfile.TemporaryDirectory()
+		self.path = os.path.join(self.directory.name, "mesh.cgm")
+		self.vertices = np.random.default_rng(0).random((5, 3))
+		self.faces = np.array([[0, 1, 2, -1], [1, 2, 3, 4]])
+
+	def tearDown(self):
+		self.directory.cleanup()
+
+	def test_round_trip(self):
+		normals = np.tile([0.0, 0.0, 1.0], (5, 1))
+		save_cgm(self.path, self.vertices, self.faces, {"normals": normals, "empty": np.zeros((0, 2))})
+		vertices, faces, attributes = load_cgm(self.path)
+		self.assertIsInstance(vertices, np.memmap)
+		self.assertEqual(vertices.offset % ALIGNMENT, 0)
+		self.assertEqual(faces.offset % ALIGNMENT, 0)
+		np.testing.assert_array_equal(vertices, self.vertices)
+		np.testing.assert_array_equal(faces, self.faces)
+		np.testing.assert_array_equal(attributes["normals"], normals)
+		self.assertEqual(attributes["empty"].shape, (0, 2))
+		self.assertFalse(vertices.flags.writeable)
+
+	def test_invalid_file(self):
+		with open(self.path, "wb") as file:
+			file.write(b"v 0 0 0\n" * 4)
+		with self.assertRaises(ValueError):
+			load_cgm(self.path)
+		with self.assertRaises(ValueError):
+			save_cgm(self.path, self.vertices, self.faces, {"faces": self.faces})
+
+	def test_mesh_export_and_load(self):
+		mesh = HybridMesh(VertexArray3D(self.vertices), self.faces, dim=3)
+		mesh.export_to_file_path(self.path)
+		loaded = HybridMesh.from_file_path(self.path, dim=3, as_array=True)
+		self.assertIsInstance(loaded.vertices.coordinates.base, np.memmap)
+		np.testing.assert_array_equal(loaded.vertex_coordinates, self.vertices)
+		self.assertEqual([face.vertex_ids for face in loaded.faces], [[0, 1, 2], [1, 2, 3, 4]])
+
+		loaded = HybridMesh.from_file_path(self.path, dim=3)
+		self.assertIsInstance(loaded.vertices[0], Vertex3D)
+
+	def test_mesh_keeps_mapped_faces(self):
+		save_cgm(self.path, self.vertices, np.array([[0, 1, 2], [1, 2, 3], [2, 3, 4]]))
+		vertices, faces = load_mesh(self.path, dim=3, as_array=True)
+		# Creating the mesh does not read the faces
+		with mock.patch("comgeo.core.mesh.base.flatten_faces") as flatten:
+			TriangleMesh3D(vertices, faces)
+		flatten.assert_not_called()
+		mesh = TriangleMesh3D(vertices, faces)
+		self.assertTrue(np.shares_memory(mesh.face_array, faces))
+		self.assertTrue(np.shares_memory(mesh.flat_faces[1], faces))
+		self.assertEqual(mesh.face_areas.shape, (3,))
+		# Face objects are only built on first access
+		self.assertEqual([face.vertex_ids for face in mesh.faces], faces.tolist())
+		mesh.faces[0][2] = 4
+		self.assertEqual(mesh.face_array[0].tolist(), [0, 1, 4])
+		self.assertEqual(faces[0].tolist(), [0, 1, 2])
+
+		loaded = TriangleMesh3D.from_file_path(self.path, as_array=True)
+		self.assertIsInstance(loaded.face_array.base, np.memmap)
+		with self.assertRaises(ValueError):
+			TriangleMesh3D(vertices, self.faces)
+
+	def test_normals_round_trip(self):
+		normals = np.tile([0.0, 0.0, 1.0], (5, 1))
+		mesh = HybridMesh(VertexArray3D(self.vertices, normals=normals), self.faces, dim=3)
+		for path in (self.path, os.path.join(self.directory.name, "mesh.obj")):
+			mesh.export_to_file_path(path)
+			vertices, _ = load_mesh(path, dim=3, as_array=True)
+			np.testing.assert_array_equal(vertices.normals, normals)
+			self.assertEqual(load_mesh(path, dim=3)[0][0].normal, (0.0, 0.0, 1.0))
+
+		vertices = Vertex3D.from_array(self.vertices)
+		vertices[1].normal = (1.0, 0.0, 0.0)
+		HybridMesh(vertices, self.faces, dim=3).export_to_file_path(self.path)
+		loaded = HybridMesh.from_file_path(self.path, dim=3, as_array=True)
+		self.assertEqual(loaded.vertices[1].normal, (1.0, 0.0, 0.0))
+		self.assertEqual(loaded.vertices[0].normal, (None, None, None))
+
+		mesh = HybridMesh(VertexArray3D(self.vertices), self.faces, dim=3)
+		mesh.export_to_file_path(self.path)
+		self.assertNotIn("normals", load_cgm(self.path)[2])
+
+	def test_obj_export(self):
+		path = os.path.join(self.directory.name, "mesh.obj")
+		HybridMesh(VertexArray3D(self.vertices), self.faces, dim=3).export_to_file_path(path)
+		vertices, _, faces = read_obj_arrays(path)
+		np.testing.assert_array_equal(vertices, self.vertices)
+		np.testing.assert_array_equal(faces, self.faces)
@@ -0,0 +1,95 @@
+import unittest
+import numpy as np
+
+from comgeo.core.mesh.triangle_mesh import TriangleMesh2D, TriangleMesh3D
+from comgeo.core.vertex import Vertex2D, Vertex3D, VertexArray3D
+from comgeo.functional.mesh.geometry import vertex_normals
+from comgeo.functional.mesh.topology import flatten_faces
+
+
+# Square pyramid without its base: apex 4 above the square 0-1-2-3, faces pointing outwards
+PYRAMID = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.5, 0.5, 1.0]])
+PYRAMID_FACES = [[0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4]]
+
+
+def reference_normals(coordinates, faces, weighting):
+	"""Per-face Python loop accumulating weighted face normals."""
+	sums = np.zeros_like(coordinates)
+	for face in faces:
+		points = coordinates[face]
+		cross = np.cross(points[1] - points[0], points[2] - points[0])
+		normal = cross / np.linalg.norm(cross)
+		for k, vertex in enumerate(face):
+			if weighting == "area":
+				weight = np.linalg.norm(cross)
+			elif weighting == "angle":
+				u = points[(k + 1) % 3] - points[k]
+				v = points[k - 1] - points[k]
+				weight = np.arccos(np.dot(u, v) / np.linalg.norm(u) / np.linalg.norm(v))
+			else:
+				weight = 1.0
+			sums[vertex] += weight * normal
+	lengths = np.linalg.norm(sums, axis=1, keepdims=True)
+	return np.divide(sums, lengths, out=np.zeros_like(sums), where=lengths > 0)
+
+
+class TestVertexNormals(unittest.TestCase):
+	def test_pyramid(self):
+		normals = vertex_normals(PYRAMID, *flatten_faces(PYRAMID_FACES))
+		self.assertTrue(np.allclose(normals[4], [0.0, 0.0, 1.0]))
+		self.assertTrue(np.allclose(np.linalg.norm(normals, axis=1), 1.0))
+		self.assertTrue(np.all(normals[:4, :2] * (PYRAMID[:4, :2] - 0.5) > 0))
+
+	def test_matches_reference(self):
+		rng = np.random.default_rng(5)
+		coordinates = rng.random((40, 3))
+		faces = [list(rng.choice(40, 3, replace=False)) for _ in range(80)]
+		for weighting in ("area", "angle", "uniform"):
+			normals = vertex_normals(coordinates, *flatten_faces(faces), weighting)
+			self.assertTrue(np.allclose(normals, reference_normals(coordinates, faces, weighting)))
+
+	def test_quads_and_unused_vertices(self):
+		coordinates = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0], [5.0, 5.0, 5.0]])
+		normals = vertex_normals(coordinates, *flatten_faces([[0, 1, 2, 3]]), "angle")
+		self.assertTrue(np.allclose(normals, [[0.0, 0.0, 1.0]] * 4 + [[0.0, 0.0, 0.0]]))
+
+	def test_errors(self):
+		with self.assertRaises(ValueError):
+			vertex_normals(PYRAMID[:, :2], *flatten_faces(PYRAMID_FACES))
+		with self.assertRaises(ValueError):
+			vertex_normals(PYRAMID, *flatten_faces(PYRAMID_FACES), "random")
+
+
+class TestMeshNormals(unittest.TestCase):
+	def test_cached_and_invalidated(self):
+		mesh = TriangleMesh3D(VertexArray3D(PYRAMID.copy()), PYRAMID_FACES)
+		self.assertFalse(mesh.has_vertex_normals)
+		normals = mesh.vertex_normals
+		self.assertIs(mesh.vertex_normals, normals)
+		mesh.vertices[4].x = 3.0
+		self.assertFalse(mesh.has_vertex_normals)
+		expected = reference_normals(mesh.vertex_coordinates, np.array(PYRAMID_FACES), "area")
+		self.assertTrue(np.allclose(mesh.vertex_normals, expected))
+		self.assertFalse(np.allclose(normals, expected))
+		angle = mesh.construct_vertex_normals("angle")
+		self.assertIs(mesh.vertex_normals, angle)
+		mesh.assign_vertex_normals()
+		np.testing.assert_array_equal(mesh.vertices.normals, angle)
+		self.assertEqual(mesh.vertices[4].normal, tuple(angle[4].tolist()))
+		self.assertTrue(mesh.has_vertex_normals)
+
+	def test_assign_vertex_normals(self):
+		vertices = Vertex3D.from_array(PYRAMID)
+		mesh = TriangleMesh3D(vertices, PYRAMID_FACES)
+		mesh.assign_vertex_normals()
+		self.assertTrue(np.allclose(vertices[4].normal, (0.0, 0.0, 1.0)))
+		self.assertEqual(vertices[0].normal, tuple(mesh.vertex_normals[0].tolist()))
+
+	def test_2d_mesh(self):
+		mesh = TriangleMesh2D([Vertex2D(0.0, 0.0), Vertex2D(1.0, 0.0), Vertex2D(0.0, 1.0)], [[0, 1, 2]])
+		with self.assertRaises(ValueError):
+			mesh.vertex_normals
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,42 @@
+import pickle
+import unittest
+import numpy as np
+
+from comgeo.core.mesh.shared import SharedMesh
+from comgeo.core.mesh.triangle_mesh import TriangleMesh3D
+from comgeo.core.utils.parallel import ProcessBackend
+from comgeo.core.vertex import VertexArray3D
+
+
+def total_area(mesh):
+	return float(mesh.face_geometry()["areas"].sum())
+
+
+class TestSharedMesh(unittest.TestCase):
+	def setUp(self):
+		coordinates = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0]])
+		self.mesh = TriangleMesh3D(VertexArray3D(coordinates), [[0, 1, 2], [0, 2, 3]])
+
+	def test_to_shared(self):
+		with self.mesh.to_shared() as shared:
+			self.assertEqual((shared.num_vertices, shared.num_faces, shared.dim), (4, 2, 3))
+			np.testing.assert_array_equal(shared.coordinates, self.mesh.vertex_coordinates)
+			np.testing.assert_array_equal(shared.face_array, self.mesh.face_array)
+			self.assertAlmostEqual(total_area(shared), 1.0)
+
+	def test_pickle_is_constant_size(self):
+		rng = np.random.default_rng(1)
+		with self.mesh.to_shared() as small, SharedMesh.from_arrays(rng.random((100000, 3)), np.arange(0, 3001, 3), rng.integers(0, 100000, 3000)) as large:
+			self.assertLess(len(pickle.dumps(large)), len(pickle.dumps(small)) + 32)
+
+	def test_process_workers(self):
+		with self.mesh.to_shared() as shared, ProcessBackend(num_workers=2) as executor:
+			self.assertEqual(executor.map(total_area, [shared] * 3), [1.0, 1.0, 1.0])
+
+	def test_invalid_coordinates(self):
+		with self.assertRaises(ValueError):
+			SharedMesh.from_arrays(np.zeros(3), [0, 3], [0, 1, 2])
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import numpy as np
+
+from comgeo.functional.mesh.topology import component_labels, connected_components, flatten_faces, union_find, unique_edges
+
+
+def reference_labels(num_nodes, rows, cols):
+	"""Component labels by depth-first search, numbered by first appearance."""
+	neighbours = [[] for _ in range(num_nodes)]
+	for a, b in zip(rows.tolist(), cols.tolist()):
+		neighbours[a].append(b)
+		neighbours[b].append(a)
+	labels = [-1] * num_nodes
+	label = 0
+	for start in range(num_nodes):
+		if labels[start] >= 0:
+			continue
+		labels[start] = label
+		stack = [start]
+		while stack:
+			node = stack.pop()
+			for other in neighbours[node]:
+				if labels[other] < 0:
+					labels[other] = label
+					stack.append(other)
+		label += 1
+	return labels
+
+
+class TestUnionFind(unittest.TestCase):
+	def test_matches_depth_first_search(self):
+		rng = np.random.default_rng(7)
+		for num_nodes, num_pairs in ((50, 20), (500, 400), (2000, 3000)):
+			rows = rng.integers(0, num_nodes, num_pairs)
+			cols = rng.integers(0, num_nodes, num_pairs)
+			roots = union_find(num_nodes, rows, cols)
+			self.assertTrue(np.array_equal(roots[roots], roots))
+			self.assertEqual(component_labels(roots).tolist(), reference_labels(num_nodes, rows, cols))
+
+	def test_chain(self):
+		# A long path needs many hooks on the same roots
+		rows = np.arange(999)
+		roots = union_find(1000, rows, rows + 1)
+		self.assertEqual(len(np.unique(roots)), 1)
+
+	def test_no_pairs(self):
+		self.assertEqual(union_find(3, [], []).tolist(), [0, 1, 2])
+
+
+class TestFlattenFaces(unittest.TestCase):
+	def test_arrays(self):
+		triangles = np.array([[0, 1, 2], [2, 1, 3]])
+		offsets, indices = flatten_faces(triangles)
+		self.assertEqual(offsets.tolist(), [0, 3, 6])
+		self.assertTrue(np.shares_memory(indices, triangles))
+		offsets, indices = flatten_faces(np.array([[0, 1, 2, -1], [2, 1, 3, 4]]))
+		self.assertEqual(offsets.tolist(), [0, 3, 7])
+		self.assertEqual(indices.tolist(), [0, 1, 2, 2, 1, 3, 4])
+
+
+class TestConnectedComponents(unittest.TestCase):
+	def test_faces_and_vertices(self):
+		offsets, indices = flatten_faces([[5, 6, 7], [0, 1, 2], [6, 8, 9, 10], [2, 3, 4]])
+		vertex_labels, face_labels = connected_components(offsets, indices, 12)
+		self.assertEqual(face_labels.tolist(), [0, 1, 0, 1])
+		self.assertEqual(vertex_labels.tolist(), [1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, -1])
+
+
+
+class TestUniqueEdges(unittest.TestCase):
+	def test_matches_python_set(self):
+		rng = np.random.default_rng(11)
+		faces = rng.integers(0, 30, (100, 4))
+		edges, corner_edges = unique_edges(*flatten_faces(faces), 30)
+		expected = {tuple(sorted((int(face[k]), int(face[(k + 1) % 4])))) for face in faces for k in range(4) if face[k] != face[(k + 1) % 4]}
+		self.assertEqual([tuple(edge) for edge in edges.tolist()], sorted(expected))
+		starts = faces.ravel()
+		ends = np.roll(faces, -1, axis=1).ravel()
+		valid = corner_edges >= 0
+		self.assertTrue(np.array_equal(np.sort(edges[corner_edges[valid]], axis=1), np.sort(np.stack([starts, ends], axis=1)[valid], axis=1)))
+		self.assertTrue(np.array_equal(~valid, starts == ends))
+
+
+if __name__ == "__main__":
+	unittest.main()
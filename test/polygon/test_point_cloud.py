@@ -0,0 +1,131 @@
+import unittest
+import numpy as np
+
+from comgeo.core.vertex import Vertex2D, Vertex3D
+from comgeo.functional.polygon.point_cloud import (
+    halton_sequence,
+    point_cloud_sampling_quad,
+    poisson_disk_sampling,
+    sample_polygon,
+    sobol_sequence,
+    unit_square_samples
+)
+
+
+def polygon_centroid(coordinates):
+    """Area centroid of a simple 2D polygon by the shoelace formula."""
+    x, y = coordinates[:, 0], coordinates[:, 1]
+    cross = x * np.roll(y, -1) - np.roll(x, -1) * y
+    area = cross.sum() / 2.0
+    return np.array([((x + np.roll(x, -1)) * cross).sum(), ((y + np.roll(y, -1)) * cross).sum()]) / (6.0 * area)
+
+
+def inside_polygon(points, coordinates):
+    """Even-odd rule point in polygon test."""
+    inside = np.zeros(len(points), dtype=bool)
+    for a, b in zip(coordinates, np.roll(coordinates, -1, axis=0)):
+        crosses = (a[1] > points[:, 1]) != (b[1] > points[:, 1])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = a[0] + (points[:, 1] - a[1]) * (b[0] - a[0]) / (b[1] - a[1])
+        inside ^= crosses & (points[:, 0] < x)
+    return inside
+
+
+class TestSequences(unittest.TestCase):
+
+    def test_halton(self):
+        """Test the first Halton points in bases 2 and 3."""
+        expected = [[0.0, 0.0], [0.5, 1 / 3], [0.25, 2 / 3], [0.75, 1 / 9]]
+        np.testing.assert_allclose(halton_sequence(4), expected)
+        np.testing.assert_allclose(halton_sequence(2, start=2), expected[2:])
+
+    def test_sobol_is_a_net(self):
+        """Test that 2^m Sobol points put one point in every elementary dyadic box."""
+        m = 8
+        points = sobol_sequence(2 ** m, 2)
+        for i in range(m + 1):
+            cells = np.floor(points[:, 0] * 2 ** i) * 2 ** (m - i) + np.floor(points[:, 1] * 2 ** (m - i))
+            self.assertEqual(len(np.unique(cells)), 2 ** m)
+
+    def test_sobol_projections(self):
+        """Test that every Sobol coordinate of 2^m points is a permutation of k / 2^m."""
+        points = sobol_sequence(1024, 8)
+        for d in range(8):
+            self.assertEqual(sorted((points[:, d] * 1024).tolist()), list(range(1024)))
+        np.testing.assert_allclose(sobol_sequence(4, 2, start=1020), points[1020:, :2])
+
+    def test_invalid(self):
+        """Test unsupported dimensions and methods."""
+        with self.assertRaises(ValueError):
+            sobol_sequence(4, 9)
+        with self.assertRaises(ValueError):
+            halton_sequence(4, 0)
+        with self.assertRaises(ValueError):
+            unit_square_samples(4, "grid")
+
+    def test_random_shift(self):
+        """Test that a seed shifts the low-discrepancy points modulo 1."""
+        shifted = unit_square_samples(16, "sobol", rng=0)
+        difference = (shifted - sobol_sequence(16)) % 1.0
+        np.testing.assert_allclose(difference, np.broadcast_to(difference[0], difference.shape))
+
+
+class TestPolygonSampling(unittest.TestCase):
+
+    def setUp(self):
+        self.trapezoid = np.array([[0.0, 0.0], [4.0, 0.0], [1.0, 1.0], [0.0, 1.0]])
+
+    def test_quad_is_area_uniform(self):
+        """Test that the sample mean of a trapezoid converges to its area centroid."""
+        points = sample_polygon(self.trapezoid, 200000, rng=0)
+        np.testing.assert_allclose(points.mean(axis=0), polygon_centroid(self.trapezoid), atol=5e-3)
+        points = sample_polygon(self.trapezoid, 4096, "sobol")
+        np.testing.assert_allclose(points.mean(axis=0), polygon_centroid(self.trapezoid), atol=5e-3)
+
+    def test_concave_quad(self):
+        """Test that a concave quad is split along its inner diagonal."""
+        dart = np.array([[0.0, 0.0], [2.0, 1.0], [0.0, 2.0], [0.5, 1.0]])
+        points = sample_polygon(dart, 50000, rng=1)
+        self.assertTrue(np.all(inside_polygon(points, dart)))
+        np.testing.assert_allclose(points.mean(axis=0), polygon_centroid(dart), atol=1e-2)
+
+    def test_vertex_output(self):
+        """Test the vertex list interface with a low-discrepancy method."""
+        vertices = [Vertex3D(0.0, 0.0, 0.0), Vertex3D(1.0, 0.0, 0.0), Vertex3D(1.0, 1.0, 1.0), Vertex3D(0.0, 1.0, 1.0)]
+        points = point_cloud_sampling_quad(vertices, 64, method="halton")
+        self.assertEqual(len(points), 64)
+        self.assertTrue(all(isinstance(p, Vertex3D) and abs(p.y - p.z) < 1e-12 for p in points))
+
+
+class TestPoissonDisk(unittest.TestCase):
+
+    def test_minimum_distance(self):
+        """Test that samples keep the radius and cover the polygon."""
+        triangle = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]])
+        points = poisson_disk_sampling(triangle, 0.05, rng=0)
+        distances = np.linalg.norm(points[:, None] - points[None], axis=2)
+        np.fill_diagonal(distances, np.inf)
+        self.assertGreaterEqual(distances.min(), 0.05)
+        # A maximal packing of 0.05 disks over an area of 0.5 has well over 100 points
+        self.assertGreater(len(points), 100)
+        self.assertTrue(np.all(inside_polygon(points, triangle)))
+
+    def test_3d_and_vertices(self):
+        """Test sampling a quad in 3D through the Quad and Triangle classes."""
+        from comgeo.core.polygon.quad import Quad
+        quad = Quad([Vertex3D(0.0, 0.0, 0.0), Vertex3D(1.0, 0.0, 0.0), Vertex3D(1.0, 1.0, 1.0), Vertex3D(0.0, 1.0, 1.0)])
+        points = quad.poisson_disk_sampling(0.1, rng=1)
+        coordinates = np.array([p.coordinates for p in points])
+        distances = np.linalg.norm(coordinates[:, None] - coordinates[None], axis=2)
+        np.fill_diagonal(distances, np.inf)
+        self.assertGreaterEqual(distances.min(), 0.1)
+        np.testing.assert_allclose(coordinates[:, 1], coordinates[:, 2])
+
+    def test_invalid_radius(self):
+        """Test that the radius must be positive."""
+        with self.assertRaises(ValueError):
+            poisson_disk_sampling(np.zeros((3, 2)), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from comgeo.core.polygon.quad import Quad
 from comgeo.core.vertex import Vertex, Vertex2D, Vertex3D
 
@@ -85,6 +86,16 @@ class TestQuad(unittest.TestCase):
         for point in points:
             self.assertIsInstance(point, Vertex3D)
 
+    def test_point_cloud_sampling_sequences(self):
+        """Test low-discrepancy sampling methods."""
+        for method in ("halton", "sobol"):
+            points = self.quad.point_cloud_sampling(16, method=method)
+            coordinates = np.array([p.coordinates for p in points])
+            self.assertEqual(len(np.unique(coordinates, axis=0)), 16)
+            self.assertTrue(np.all((coordinates >= 0.0) & (coordinates <= 1.0)))
+        with self.assertRaises(ValueError):
+            self.quad.point_cloud_sampling(16, method="grid")
+
     def test_point_cloud_sampling_base_vertex_error(self):
         """Test Quad construction raises error for base Vertex."""
         base_vertices = [Vertex(id=1), Vertex(id=2), Vertex(id=3), Vertex(id=4)]
@@ -92,5 +103,15 @@ class TestQuad(unittest.TestCase):
             Quad(base_vertices)
         self.assertIn("Polygon must have vertices of type Vertex2D or Vertex3D", str(context.exception))
 
+    def test_point_cloud_sampling_chunks(self):
+        """Test streaming samples in fixed-size array chunks."""
+        chunks = list(self.quad3d.point_cloud_sampling_chunks(250, 100, rng=0))
+        self.assertEqual([chunk.shape for chunk in chunks], [(100, 3), (100, 3), (50, 3)])
+        points = np.concatenate(chunks)
+        self.assertTrue(np.all(points >= -1e-12))
+        again = np.concatenate(list(self.quad3d.point_cloud_sampling_chunks(250, 100, rng=0)))
+        self.assertTrue(np.array_equal(points, again))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from comgeo.core.polygon.triangle import Triangle
 from comgeo.core.vertex import Vertex, Vertex2D, Vertex3D
 
@@ -30,6 +31,15 @@ class TestTriangle(unittest.TestCase):
         self.triangle2d.vertices = new_vertices
         self.assertEqual(self.triangle2d.vertices, new_vertices)
 
+    def test_area_and_center_follow_vertices(self):
+        """Test that the cached area and center are recomputed after a vertex moves."""
+        self.assertAlmostEqual(self.triangle2d.area, 0.5)
+        self.vertices2d[1].set_coordinates(2.0, 0.0)
+        self.assertAlmostEqual(self.triangle2d.area, 1.0)
+        self.assertAlmostEqual(self.triangle2d.center.x, 2.0 / 3.0)
+        self.triangle2d.vertices = [Vertex2D(0.0, 0.0), Vertex2D(3.0, 0.0), Vertex2D(0.0, 1.0)]
+        self.assertAlmostEqual(self.triangle2d.area, 1.5)
+
     def test_vertices_setter_invalid(self):
         """Test the vertices property setter with an invalid number of vertices."""
         with self.assertRaises(ValueError) as context:
@@ -71,5 +81,15 @@ class TestTriangle(unittest.TestCase):
             Triangle(base_vertices)
         self.assertIn("Polygon must have vertices of type Vertex2D or Vertex3D", str(context.exception))
 
+    def test_point_cloud_sampling_chunks(self):
+        """Test streaming samples in fixed-size array chunks."""
+        chunks = list(self.triangle3d.point_cloud_sampling_chunks(250, 100, rng=0))
+        self.assertEqual([chunk.shape for chunk in chunks], [(100, 3), (100, 3), (50, 3)])
+        points = np.concatenate(chunks)
+        self.assertTrue(np.all(points >= -1e-12))
+        again = np.concatenate(list(self.triangle3d.point_cloud_sampling_chunks(250, 100, rng=0)))
+        self.assertTrue(np.array_equal(points, again))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+import numpy as np
+
+from comgeo.core.utils.buffer import GrowableArray
+
+
+class TestGrowableArray(unittest.TestCase):
+
+    def test_append_and_extend(self):
+        """Test row appends and the filled view."""
+        buffer = GrowableArray(np.int64, (2,), capacity=2)
+        buffer.append([0, 1])
+        buffer.extend(np.array([[1, 2], [2, 3]]))
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer.data.tolist(), [[0, 1], [1, 2], [2, 3]])
+        self.assertEqual(buffer.capacity, 4)
+
+    def test_capacity_doubles(self):
+        """Test that n appends trigger only O(log n) reallocations."""
+        buffer = GrowableArray(np.float64)
+        capacities = set()
+        for i in range(10000):
+            buffer.append(i)
+            capacities.add(buffer.capacity)
+        self.assertEqual(sorted(capacities), [16 * 2 ** k for k in range(11)])
+        self.assertTrue(np.array_equal(buffer.data, np.arange(10000)))
+
+    def test_from_array_and_clear(self):
+        """Test construction from an array and clearing."""
+        buffer = GrowableArray.from_array(np.zeros((0, 3)))
+        self.assertEqual(buffer.data.shape, (0, 3))
+        buffer.extend(np.ones(6))
+        self.assertEqual(buffer.data.shape, (2, 3))
+        buffer.clear()
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(repr(buffer), "GrowableArray(size=0, capacity=2, dtype=float64)")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import threading
+import unittest
+import numpy as np
+
+from comgeo import trusted, set_trusted, is_trusted
+from comgeo.core.utils.error import check_type, check_consistency
+from comgeo.core.vertex import Vertex2D, Vertex3D, VertexArray2D
+from comgeo.core.mesh.primitives.face import Face
+from comgeo.core.mesh.primitives.triangle_face import TriangleFace
+
+
+class TestTrustedMode(unittest.TestCase):
+    """Test cases for the trusted validation mode."""
+
+    def tearDown(self):
+        """Always leave the process in checked mode."""
+        set_trusted(False)
+
+    def test_default_is_checked(self):
+        """Test that validation runs by default."""
+        self.assertFalse(is_trusted())
+        with self.assertRaises(TypeError):
+            check_type(1, float, "value")
+        with self.assertRaises(TypeError):
+            check_consistency([1, 1.0], "values")
+        with self.assertRaises(TypeError):
+            Vertex2D(1, 2)
+
+    def test_consistency_of_vertex_views(self):
+        """Test that VertexArray views are consistent with plain vertices of their dimension."""
+        view = VertexArray2D(np.zeros((1, 2)))[0]
+        check_consistency([view, Vertex2D(1.0, 2.0)], "vertices")
+        check_consistency([Vertex2D(1.0, 2.0), view], "vertices")
+        with self.assertRaises(TypeError):
+            check_consistency([view, Vertex3D(1.0, 2.0, 3.0)], "vertices")
+
+    def test_context_manager(self):
+        """Test that the context manager skips validation and restores the previous mode."""
+        with trusted():
+            self.assertTrue(is_trusted())
+            check_type(1, float, "value")
+            check_consistency([1, 1.0], "values")
+            vertex = Vertex2D(1.0, 2.0)
+            vertex.x = 3
+            self.assertEqual(vertex.x, 3)
+            with trusted(False):
+                self.assertFalse(is_trusted())
+            self.assertTrue(is_trusted())
+        self.assertFalse(is_trusted())
+
+    def test_context_manager_restores_on_error(self):
+        """Test that the previous mode is restored when the block raises."""
+        with self.assertRaises(RuntimeError):
+            with trusted():
+                raise RuntimeError("boom")
+        self.assertFalse(is_trusted())
+
+    def test_trusted_is_per_thread(self):
+        """Test that a trusted block does not turn off validation in other threads."""
+        entered, checked = threading.Event(), threading.Event()
+        errors = []
+
+        def worker():
+            entered.wait()
+            try:
+                check_type(1, float, "value")
+            except TypeError as error:
+                errors.append(error)
+            checked.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        with trusted():
+            entered.set()
+            checked.wait()
+            self.assertTrue(is_trusted())
+        thread.join()
+        self.assertEqual(len(errors), 1)
+
+    def test_set_trusted(self):
+        """Test the switch of the current thread."""
+        set_trusted(True)
+        self.assertTrue(is_trusted())
+        Vertex3D(1, 2, 3)
+        set_trusted(False)
+        with self.assertRaises(TypeError):
+            set_trusted("yes")
+
+
+class TestBulkConstructors(unittest.TestCase):
+    """Test cases for the bulk constructors."""
+
+    def test_vertex2d_from_array(self):
+        """Test building Vertex2D objects from an array."""
+        vertices = Vertex2D.from_array(np.array([[0.0, 1.0], [2.0, 3.0]]), ids=[4, 5])
+        self.assertEqual([v.coordinates for v in vertices], [(0.0, 1.0), (2.0, 3.0)])
+        self.assertEqual([v.id for v in vertices], [4, 5])
+        self.assertIsInstance(vertices[0].x, float)
+        self.assertFalse(is_trusted())
+        with self.assertRaises(ValueError):
+            Vertex2D.from_array(np.zeros((2, 3)))
+        with self.assertRaises(ValueError):
+            Vertex2D.from_array(np.zeros((2, 2)), ids=[1])
+
+    def test_vertex3d_from_array(self):
+        """Test building Vertex3D objects from an array."""
+        vertices = Vertex3D.from_array([[0.0, 1.0, 2.0]])
+        self.assertEqual(vertices[0].coordinates, (0.0, 1.0, 2.0))
+        self.assertEqual(vertices[0].id, -1)
+
+    def test_face_from_array(self):
+        """Test building faces from an array and from lists."""
+        faces = TriangleFace.from_array(np.array([[0, 1, 2], [2, 1, 3]]))
+        self.assertTrue(all(isinstance(f, TriangleFace) for f in faces))
+        self.assertEqual(faces[1].vertex_ids, [2, 1, 3])
+        faces = Face.from_array([[0, 1, 2, 3], [0, 1, 2]])
+        self.assertEqual(len(faces), 2)
+        with self.assertRaises(ValueError):
+            Face.from_array(np.zeros((2, 3)))
+        with self.assertRaises(TypeError):
+            Face.from_array("faces")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import unittest
+from unittest import mock
+
+import comgeo
+from comgeo.core.utils.parallel import (
+    ProcessBackend, SerialBackend, ThreadBackend, backend, chunk_ranges, default_num_workers, get_backend, set_backend
+)
+
+
+def square(x):
+    return x * x
+
+
+class TestBackends(unittest.TestCase):
+
+    def test_map_keeps_order(self):
+        """Test that every backend returns results in input order."""
+        for kind in (SerialBackend, ThreadBackend, ProcessBackend):
+            with kind(num_workers=2) as executor:
+                self.assertEqual(executor.map(square, range(20)), [x * x for x in range(20)])
+                self.assertEqual(executor.map(pow, [2, 3], [3, 2]), [8, 9])
+
+    def test_executor_is_reused(self):
+        """Test that a pool backend keeps one executor across calls until shut down."""
+        executor = ThreadBackend(num_workers=2)
+        executor.map(square, range(4))
+        pool = executor.executor
+        executor.map(square, range(4))
+        self.assertIs(executor.executor, pool)
+        executor.shutdown()
+        self.assertIsNot(executor.executor, pool)
+        executor.shutdown()
+
+    def test_num_workers(self):
+        """Test explicit, environment and default worker counts."""
+        self.assertEqual(SerialBackend().num_workers, 1)
+        self.assertEqual(ThreadBackend(num_workers=3).num_workers, 3)
+        with mock.patch.dict(os.environ, {"COMGEO_NUM_WORKERS": "5"}):
+            self.assertEqual(default_num_workers(), 5)
+            self.assertEqual(ThreadBackend().num_workers, 5)
+        with mock.patch.dict(os.environ, {"COMGEO_NUM_WORKERS": "0"}):
+            with self.assertRaises(ValueError):
+                default_num_workers()
+        with mock.patch.dict(os.environ):
+            os.environ.pop("COMGEO_NUM_WORKERS", None)
+            self.assertGreaterEqual(default_num_workers(), 1)
+
+    def test_invalid_arguments(self):
+        """Test the validation of worker counts, chunk sizes and backend names."""
+        with self.assertRaises(ValueError):
+            ThreadBackend(num_workers=0)
+        with self.assertRaises(ValueError):
+            SerialBackend(chunk_size=0)
+        with self.assertRaises(ValueError):
+            set_backend("gpu")
+
+
+class TestGlobalBackend(unittest.TestCase):
+
+    def test_default_is_serial(self):
+        """Test that the package runs serially unless configured otherwise."""
+        self.assertIsInstance(get_backend(), SerialBackend)
+
+    def test_context_manager_restores(self):
+        """Test that the backend context switches and restores the global backend."""
+        previous = get_backend()
+        with backend("thread", num_workers=2, chunk_size=10) as executor:
+            self.assertIs(get_backend(), executor)
+            self.assertEqual(executor.chunk_size, 10)
+            self.assertEqual(executor.map(square, [3]), [9])
+        self.assertIs(get_backend(), previous)
+        self.assertIsNone(executor._executor)
+
+    def test_set_backend(self):
+        """Test replacing the global backend and shutting down the old one."""
+        previous = get_backend()
+        try:
+            first = comgeo.set_backend("thread", num_workers=2)
+            first.map(square, [1])
+            second = comgeo.set_backend(ThreadBackend(num_workers=2))
+            self.assertIs(comgeo.get_backend(), second)
+            self.assertIsNone(first._executor)
+        finally:
+            set_backend(previous)
+
+
+class TestChunkRanges(unittest.TestCase):
+
+    def test_chunks(self):
+        """Test that chunks cover the range in order."""
+        self.assertEqual(chunk_ranges(10, 4), [(0, 4), (4, 8), (8, 10)])
+        self.assertEqual(chunk_ranges(0, 4), [])
+        with self.assertRaises(ValueError):
+            chunk_ranges(10, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
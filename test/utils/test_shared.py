@@ -0,0 +1,61 @@
+import pickle
+import unittest
+import numpy as np
+
+from comgeo.core.utils.parallel import ProcessBackend
+from comgeo.core.utils.shared import SharedArray
+
+
+def column_sums(shared):
+    return np.asarray(shared).sum(axis=0).tolist()
+
+
+def write_row(shared, row):
+    shared.array[row] = -1.0
+    return shared.is_owner
+
+
+class TestSharedArray(unittest.TestCase):
+
+    def test_from_array(self):
+        """Test that the shared copy matches the source array."""
+        source = np.arange(12, dtype=np.float32).reshape(4, 3)
+        with SharedArray.from_array(source) as shared:
+            self.assertTrue(shared.is_owner)
+            self.assertEqual(shared.shape, (4, 3))
+            self.assertEqual(shared.dtype, np.float32)
+            self.assertEqual(len(shared), 4)
+            self.assertTrue(np.array_equal(np.asarray(shared), source))
+        self.assertFalse(shared.is_owner)
+
+    def test_pickle_sends_handle(self):
+        """Test that pickling size does not depend on the array size and attaches zero-copy."""
+        with SharedArray.from_array(np.zeros(10)) as small, SharedArray.from_array(np.zeros(1000000)) as large:
+            self.assertLess(abs(len(pickle.dumps(small)) - len(pickle.dumps(large))), 16)
+            self.assertLess(len(pickle.dumps(large)), 200)
+            copy = pickle.loads(pickle.dumps(large))
+            copy.array[5] = 3.0
+            self.assertEqual(large.array[5], 3.0)
+            self.assertFalse(copy.is_owner)
+            with self.assertRaises(ValueError):
+                copy.unlink()
+
+    def test_process_workers(self):
+        """Test that process workers read and write the same block."""
+        source = np.random.default_rng(0).random((1000, 3))
+        with SharedArray.from_array(source) as shared, ProcessBackend(num_workers=2) as executor:
+            sums = executor.map(column_sums, [shared] * 4)
+            self.assertTrue(all(np.allclose(s, source.sum(axis=0)) for s in sums))
+            self.assertEqual(executor.map(write_row, [shared] * 2, [0, 1]), [False, False])
+            self.assertTrue(np.all(shared.array[:2] == -1.0))
+
+    def test_views_outlive_unlink(self):
+        """Test that arrays taken before unlinking stay readable."""
+        shared = SharedArray.from_array(np.arange(5))
+        view = shared.array
+        shared.unlink()
+        self.assertEqual(view.tolist(), [0, 1, 2, 3, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import numpy as np
+
+from comgeo.core.utils.sparse import CSRMatrix
+
+
+class TestCSRMatrix(unittest.TestCase):
+    """Test cases for the CSRMatrix class."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.dense = np.array([
+            [0.0, 2.0, 0.0],
+            [1.0, 0.0, 3.0],
+            [0.0, 0.0, 0.0]
+        ])
+        self.matrix = CSRMatrix.from_dense(self.dense)
+
+    def test_from_dense(self):
+        """Test conversion from a dense array and back."""
+        self.assertEqual(self.matrix.shape, (3, 3))
+        self.assertEqual(self.matrix.nnz, 3)
+        self.assertTrue(np.array_equal(self.matrix.toarray(), self.dense))
+        self.assertEqual(self.matrix.indptr.tolist(), [0, 1, 3, 3])
+
+    def test_from_coo_merges_duplicates(self):
+        """Test that duplicate coordinates are merged."""
+        matrix = CSRMatrix.from_coo([1, 0, 1, 1], [2, 1, 0, 2], (3, 3))
+        self.assertEqual(matrix.nnz, 3)
+        self.assertEqual(matrix.row(1).tolist(), [0, 2])
+        self.assertEqual(matrix.row_data(1).tolist(), [1.0, 1.0])
+        weighted = CSRMatrix.from_coo([1, 1], [2, 2], (3, 3), data=np.array([1.5, 2.0]))
+        self.assertEqual(weighted[1, 2], 3.5)
+
+    def test_getitem(self):
+        """Test element access."""
+        self.assertEqual(self.matrix[0, 1], 2.0)
+        self.assertEqual(self.matrix[1, 2], 3.0)
+        self.assertEqual(self.matrix[-2, -1], 3.0)
+        self.assertEqual(self.matrix[2, 2], 0.0)
+        with self.assertRaises(TypeError):
+            self.matrix[0]
+
+    def test_degree_and_coo(self):
+        """Test per-row counts and coordinate export."""
+        self.assertEqual(self.matrix.degree().tolist(), [1, 2, 0])
+        rows, cols, data = self.matrix.to_coo()
+        self.assertEqual(rows.tolist(), [0, 1, 1])
+        self.assertEqual(cols.tolist(), [1, 0, 2])
+        self.assertEqual(data.tolist(), [2.0, 1.0, 3.0])
+
+    def test_dot(self):
+        """Test multiplication with dense vectors and matrices."""
+        vector = np.array([1.0, 2.0, 3.0])
+        self.assertTrue(np.array_equal(self.matrix.dot(vector), self.dense @ vector))
+        block = np.arange(6.0).reshape(3, 2)
+        self.assertTrue(np.array_equal(self.matrix.dot(block), self.dense @ block))
+        pattern = CSRMatrix.from_coo([0, 2], [1, 1], (3, 3))
+        self.assertEqual(pattern.dot(vector).tolist(), [2.0, 0.0, 2.0])
+        with self.assertRaises(ValueError):
+            self.matrix.dot(np.ones(2))
+
+    def test_invalid_arguments(self):
+        """Test validation of the raw constructor."""
+        with self.assertRaises(ValueError):
+            CSRMatrix(np.array([0, 1]), np.array([0]), (2, 2))
+        with self.assertRaises(ValueError):
+            CSRMatrix(np.array([0, 1, 2]), np.array([0]), (2, 2))
+        with self.assertRaises(TypeError):
+            CSRMatrix(np.array([0, 1]), np.array([0]), [1, 1])
+
+    def test_repr(self):
+        """Test the string representation."""
+        self.assertEqual(repr(self.matrix), "CSRMatrix(shape=(3, 3), nnz=3)")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+
+from comgeo.core.utils.version import VersionCounter
+
+
+class TestVersionCounter(unittest.TestCase):
+
+    def test_bump(self):
+        """Test that bump returns increasing stamps."""
+        counter = VersionCounter()
+        self.assertEqual(counter.value, 0)
+        self.assertEqual([counter.bump(), counter.bump()], [1, 2])
+        self.assertEqual(counter.value, 2)
+        self.assertEqual(repr(counter), "VersionCounter(value=2)")
+
+    def test_stamp(self):
+        """Test that stamps are unique but leave the value unchanged."""
+        counter = VersionCounter()
+        counter.bump()
+        stamps = [counter.stamp(), counter.stamp()]
+        self.assertEqual(counter.value, 1)
+        self.assertEqual(len(set(stamps + [1, counter.bump()])), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -242,4 +242,11 @@ class TestVector3D(unittest.TestCase):
         vec = Vector3D(x=1.0, y=1.0, z=1.0, id=1, visited=True)     
         with self.assertRaises(TypeError) as exc_info:
             vec.norm(p="not_int")
-        self.assertIn("'<=' not supported between instances of 'str' and 'int'", str(exc_info.exception))
\ No newline at end of file
+        self.assertIn("'<=' not supported between instances of 'str' and 'int'", str(exc_info.exception))
+
+    def test_vector3d_slots(self):
+        """Test that vectors are slotted and the unchecked constructor matches the checked one."""
+        vec = Vector3D.unchecked(1.0, 2.0, 3.0, id=4)
+        self.assertFalse(hasattr(vec, "__dict__"))
+        self.assertEqual(vec, Vector3D(x=1.0, y=2.0, z=3.0))
+        self.assertEqual(vec.id, 4)
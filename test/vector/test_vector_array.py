@@ -0,0 +1,99 @@
+import unittest
+import numpy as np
+
+from comgeo.core.vertex import VertexArray2D, VertexArray3D
+from comgeo.core.vector import Vector2D, Vector3D, VectorArray2D, VectorArray3D
+
+
+class TestVectorArray2D(unittest.TestCase):
+    """Test cases for the VectorArray2D class."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.a = VectorArray2D(np.array([[3.0, 4.0], [1.0, 0.0], [0.0, 0.0]]))
+        self.b = VectorArray2D(np.array([[1.0, 2.0], [0.0, 1.0], [2.0, 2.0]]))
+
+    def test_initialization(self):
+        """Test shape validation and element access."""
+        self.assertEqual(len(self.a), 3)
+        self.assertEqual(self.a[0], Vector2D(3.0, 4.0))
+        self.assertIsInstance(self.a[1:], VectorArray2D)
+        with self.assertRaises(ValueError):
+            VectorArray2D(np.zeros((3, 3)))
+
+    def test_from_vertices(self):
+        """Test building vectors from paired vertex arrays."""
+        v1 = VertexArray2D(np.array([[0.0, 0.0], [1.0, 1.0]]))
+        v2 = VertexArray2D(np.array([[3.0, 4.0], [2.0, 1.0]]))
+        vectors = VectorArray2D.from_vertices(v1, v2)
+        self.assertEqual(vectors.components.tolist(), [[3.0, 4.0], [1.0, 0.0]])
+        self.assertEqual(VectorArray2D.from_vertex(v2).components.tolist(), v2.coordinates.tolist())
+        with self.assertRaises(TypeError):
+            VectorArray2D.from_vertices(v1, VertexArray3D(np.zeros((2, 3))))
+
+    def test_arithmetic(self):
+        """Test addition, subtraction, scaling and division."""
+        self.assertEqual((self.a + self.b).components.tolist(), [[4.0, 6.0], [1.0, 1.0], [2.0, 2.0]])
+        self.assertEqual((self.a - self.b).components.tolist(), [[2.0, 2.0], [1.0, -1.0], [-2.0, -2.0]])
+        self.assertEqual((self.a * 2.0).components.tolist(), [[6.0, 8.0], [2.0, 0.0], [0.0, 0.0]])
+        self.assertEqual((self.b / np.array([1.0, 1.0, 2.0])).components.tolist(), [[1.0, 2.0], [0.0, 1.0], [1.0, 1.0]])
+        with self.assertRaises(ValueError):
+            self.a / 0.0
+        with self.assertRaises(TypeError):
+            self.a * "2"
+
+    def test_dot_and_cross(self):
+        """Test row-wise dot and cross products against Vector2D."""
+        self.assertEqual(self.a.dot(self.b).tolist(), [11.0, 0.0, 0.0])
+        self.assertEqual((self.a * self.b).tolist(), [11.0, 0.0, 0.0])
+        expected = [self.a[i].cross(self.b[i]) for i in range(3)]
+        self.assertEqual(self.a.cross(self.b).tolist(), expected)
+
+    def test_norm_matches_vector2d(self):
+        """Test p-norms against Vector2D.norm."""
+        for p in (1, 2, 3, 1.5, 2.0):
+            expected = [self.a[i].norm(p) for i in range(3)]
+            np.testing.assert_allclose(self.a.norm(p), expected)
+        with self.assertRaises(ValueError):
+            self.a.norm(0)
+        with self.assertRaises(TypeError):
+            self.a.norm("2")
+
+    def test_normalize(self):
+        """Test normalization leaves zero vectors untouched."""
+        unit = self.a.normalize()
+        np.testing.assert_allclose(unit.components, [[0.6, 0.8], [1.0, 0.0], [0.0, 0.0]])
+
+
+class TestVectorArray3D(unittest.TestCase):
+    """Test cases for the VectorArray3D class."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        rng = np.random.default_rng(0)
+        self.a = VectorArray3D(rng.normal(size=(5, 3)))
+        self.b = VectorArray3D(rng.normal(size=(5, 3)))
+
+    def test_cross_matches_vector3d(self):
+        """Test row-wise cross products against Vector3D."""
+        cross = self.a.cross(self.b)
+        self.assertIsInstance(cross, VectorArray3D)
+        for i in range(5):
+            np.testing.assert_allclose(cross[i].coordinates, self.a[i].cross(self.b[i]).coordinates)
+
+    def test_norm_matches_vector3d(self):
+        """Test p-norms against Vector3D.norm."""
+        for p in (1, 2, 4, 2.5):
+            expected = [self.a[i].norm(p) for i in range(5)]
+            np.testing.assert_allclose(self.a.norm(p), expected)
+
+    def test_from_and_to_vectors(self):
+        """Test conversion from and to lists of Vector3D objects."""
+        vectors = [Vector3D(1.0, 2.0, 3.0), Vector3D(4.0, 5.0, 6.0)]
+        array = VectorArray3D.from_vectors(vectors)
+        self.assertEqual(array.to_vectors(), vectors)
+        self.assertEqual(repr(array), "VectorArray3D(num_vectors=2)")
+
+
+if __name__ == '__main__':
+    unittest.main()
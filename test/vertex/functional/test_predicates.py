@@ -0,0 +1,115 @@
+import unittest
+import numpy as np
+from fractions import Fraction
+
+from comgeo.core.shape.circle import Circle
+from comgeo.core.vertex import Vertex2D
+from comgeo.functional.shape.form import circumcircle_vertices
+from comgeo.functional.vertex.predicates import (
+    orient2d, orient3d, incircle, orient2d_batch, orient3d_batch, incircle_batch
+)
+from comgeo.functional.vertex.triplets.check import is_ccw_2d
+
+
+def exact_orient2d(a, b, c):
+    a, b, c = [[Fraction(x) for x in p] for p in (a, b, c)]
+    return (a[0] - c[0]) * (b[1] - c[1]) - (a[1] - c[1]) * (b[0] - c[0])
+
+
+def exact_orient3d(a, b, c, d):
+    rows = [[Fraction(x) - Fraction(y) for x, y in zip(p, d)] for p in (a, b, c)]
+    (a0, a1, a2), (b0, b1, b2), (c0, c1, c2) = rows
+    return a0 * (b1 * c2 - b2 * c1) - a1 * (b0 * c2 - b2 * c0) + a2 * (b0 * c1 - b1 * c0)
+
+
+class TestPredicates(unittest.TestCase):
+    """Test cases for the adaptive-precision geometric predicates."""
+
+    def setUp(self):
+        """Build a grid of points a few ulps around (0.5, 0.5) tested against a line through it."""
+        ulp = np.spacing(0.5)
+        offsets = np.arange(-16, 16) * ulp
+        x, y = np.meshgrid(0.5 + offsets, 0.5 + offsets)
+        self.points = np.stack([x.ravel(), y.ravel()], axis=1)
+        self.b = (12.0, 12.0)
+        self.c = (24.0, 24.0)
+
+    def test_orient2d_is_exact(self):
+        for p in self.points[::7]:
+            expected = exact_orient2d(p, self.b, self.c)
+            self.assertEqual(np.sign(orient2d(p, self.b, self.c)), np.sign(float(expected)))
+
+    def test_orient2d_batch_matches_scalar(self):
+        b = np.tile(self.b, (len(self.points), 1))
+        c = np.tile(self.c, (len(self.points), 1))
+        signs = np.sign(orient2d_batch(self.points, b, c))
+        expected = [np.sign(float(exact_orient2d(p, self.b, self.c))) for p in self.points]
+        np.testing.assert_array_equal(signs, expected)
+        # Points exactly on the diagonal are collinear
+        self.assertTrue(np.all(signs[self.points[:, 0] == self.points[:, 1]] == 0.0))
+
+    def test_orient2d_simple(self):
+        self.assertGreater(orient2d((0, 0), (1, 0), (0, 1)), 0.0)
+        self.assertLess(orient2d((0, 0), (0, 1), (1, 0)), 0.0)
+        self.assertEqual(orient2d((0, 0), (1, 1), (2, 2)), 0.0)
+
+    def test_orient3d(self):
+        a, b, c = (0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)
+        self.assertGreater(orient3d(a, b, c, (0.0, 0.0, -1.0)), 0.0)
+        self.assertLess(orient3d(a, b, c, (0.0, 0.0, 1.0)), 0.0)
+        self.assertEqual(orient3d(a, b, c, (0.3, 0.7, 0.0)), 0.0)
+        # Coplanar up to rounding: the plane z = x * 0.1 holds 0.1 * 0.3 only approximately
+        d = (0.3, 0.0, 0.1 * 0.3)
+        plane = ((0.0, 0.0, 0.0), (1.0, 0.0, 0.1), (0.0, 1.0, 0.0))
+        self.assertNotEqual(orient3d(*plane, d), 0.0)
+        self.assertEqual(np.sign(orient3d(*plane, d)), np.sign(float(exact_orient3d(*plane, d))))
+
+    def test_orient3d_batch(self):
+        rng = np.random.default_rng(0)
+        a, b, c, d = rng.random((4, 50, 3))
+        expected = [orient3d(*p) for p in zip(a, b, c, d)]
+        np.testing.assert_allclose(orient3d_batch(a, b, c, d), expected)
+
+    def test_incircle(self):
+        a, b, c = (0.0, 0.0), (1.0, 0.0), (0.0, 1.0)
+        self.assertGreater(incircle(a, b, c, (0.5, 0.5)), 0.0)
+        self.assertLess(incircle(a, b, c, (2.0, 2.0)), 0.0)
+        self.assertEqual(incircle(a, b, c, (1.0, 1.0)), 0.0)
+        self.assertLess(incircle(a, c, b, (0.5, 0.5)), 0.0)
+
+    def test_incircle_batch(self):
+        rng = np.random.default_rng(1)
+        a, b, c, d = rng.random((4, 50, 2))
+        expected = [incircle(*p) for p in zip(a, b, c, d)]
+        np.testing.assert_allclose(incircle_batch(a, b, c, d), expected)
+        # Cocircular points on the unit circle scaled by a power of two stay exact
+        square = np.array([[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0], [0.0, -1.0]]) * 2.0 ** 20
+        self.assertEqual(incircle_batch(square[None, 0], square[None, 1], square[None, 2], square[None, 3])[0], 0.0)
+
+    def test_batch_shape_check(self):
+        with self.assertRaises(ValueError):
+            orient2d_batch(np.zeros((3, 3)), np.zeros((3, 2)), np.zeros((3, 2)))
+
+    def test_is_ccw_2d_consistent(self):
+        # The three cyclic shifts of a near-degenerate triplet must agree
+        for p in self.points[::5]:
+            v = Vertex2D(float(p[0]), float(p[1]))
+            b, c = Vertex2D(*self.b), Vertex2D(*self.c)
+            self.assertEqual(is_ccw_2d(v, b, c), is_ccw_2d(b, c, v))
+            self.assertEqual(is_ccw_2d(v, b, c), is_ccw_2d(c, v, b))
+
+    def test_circle_contains(self):
+        a, b, c = Vertex2D(0.0, 0.0), Vertex2D(1.0, 0.0), Vertex2D(0.0, 1.0)
+        circle = circumcircle_vertices((a, b, c))
+        self.assertEqual(circle.through, (a, b, c))
+        self.assertTrue(circle.contains(Vertex2D(1.0, 1.0)))
+        self.assertTrue(circle.contains(Vertex2D(0.5, 0.5)))
+        self.assertFalse(circle.contains(Vertex2D(1.0, 1.0 + 1e-15)))
+
+        circle = Circle(Vertex2D(0.0, 0.0), 0.1)
+        self.assertTrue(circle.contains(Vertex2D(0.1, 0.0)))
+        self.assertFalse(circle.contains(Vertex2D(0.1, np.spacing(0.0) * 2 ** 520)))
+
+
+if __name__ == '__main__':
+    unittest.main()
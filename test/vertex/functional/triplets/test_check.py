@@ -34,13 +34,22 @@ class TestIsCCW2D(unittest.TestCase):
 class TestIsCCW3D(unittest.TestCase):
     """Test cases for is_ccw_3d function."""
     
-    def test_raises_not_implemented(self):
-        """Test that is_ccw_3d raises NotImplementedError."""
+    def test_default_normal(self):
+        """Test that 3D triplets are oriented as seen from +z by default."""
         v1 = Vertex3D(0.0, 0.0, 1.0)
         v2 = Vertex3D(1.0, 0.0, 2.0)
         v3 = Vertex3D(1.0, 1.0, 3.0)
-        with self.assertRaises(NotImplementedError):
-            is_ccw_3d(v1, v2, v3)
+        self.assertTrue(is_ccw_3d(v1, v2, v3))
+        self.assertFalse(is_ccw_3d(v1, v3, v2))
+
+    def test_custom_normal(self):
+        """Test that flipping the viewing normal flips the orientation."""
+        v1 = Vertex3D(0.0, 0.0, 0.0)
+        v2 = Vertex3D(0.0, 1.0, 0.0)
+        v3 = Vertex3D(0.0, 0.0, 1.0)
+        self.assertTrue(is_ccw_3d(v1, v2, v3, normal=(1.0, 0.0, 0.0)))
+        self.assertFalse(is_ccw_3d(v1, v2, v3, normal=(-1.0, 0.0, 0.0)))
+        self.assertFalse(is_ccw_3d(v1, v2, v3))
 
 
 class TestIsCCW(unittest.TestCase):
@@ -53,20 +62,19 @@ class TestIsCCW(unittest.TestCase):
         v3 = Vertex2D(1.0, 1.0)
         self.assertTrue(is_ccw(v1, v2, v3))
     
-    def test_3d_points_raises_not_implemented(self):
-        """Test that is_ccw with 3D points raises NotImplementedError."""
+    def test_3d_points(self):
+        """Test with 3D points."""
         v1 = Vertex3D(0.0, 0.0, 1.0)
         v2 = Vertex3D(1.0, 0.0, 2.0)
         v3 = Vertex3D(1.0, 1.0, 3.0)
-        with self.assertRaises(NotImplementedError):
-            is_ccw(v1, v2, v3)
+        self.assertTrue(is_ccw(v1, v2, v3))
     
     def test_mixed_types_raises_error(self):
         """Test that mixing 2D and 3D points raises an error."""
         v1 = Vertex2D(0.0, 0.0)
         v2 = Vertex3D(1.0, 0.0, 0.0)
         v3 = Vertex2D(1.0, 1.0)
-        with self.assertRaises(AssertionError):
+        with self.assertRaises(TypeError):
             is_ccw(v1, v2, v3)
     
     def test_custom_vertex2d_subclass_works(self):
@@ -0,0 +1,70 @@
+import unittest
+import numpy as np
+
+from comgeo.functional.vertex.triplets.compute import (
+    as_triplets, cyclic_triplets, triplet_orientation, triplet_signed_area, triplet_collinear
+)
+
+
+class TestTripletKernels(unittest.TestCase):
+    """Test cases for the batched triplet kernels."""
+
+    def setUp(self):
+        """Set up a ccw, a cw and a collinear 2D triplet."""
+        self.triplets2d = np.array([
+            [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]],
+            [[0.0, 0.0], [0.0, 1.0], [1.0, 0.0]],
+            [[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]],
+        ])
+        self.triplets3d = np.concatenate([self.triplets2d, np.full((3, 3, 1), 5.0)], axis=2)
+
+    def test_orientation_2d(self):
+        """Test orientation signs of 2D triplets."""
+        np.testing.assert_array_equal(triplet_orientation(self.triplets2d), [1, -1, 0])
+
+    def test_orientation_3d(self):
+        """Test orientation signs of 3D triplets against the default and a flipped normal."""
+        np.testing.assert_array_equal(triplet_orientation(self.triplets3d), [1, -1, 0])
+        np.testing.assert_array_equal(triplet_orientation(self.triplets3d, (0.0, 0.0, -2.0)), [-1, 1, 0])
+        normals = np.array([[0.0, 0.0, 1.0], [0.0, 0.0, -1.0], [1.0, 0.0, 0.0]])
+        np.testing.assert_array_equal(triplet_orientation(self.triplets3d, normals), [1, 1, 0])
+
+    def test_orientation_3d_near_degenerate(self):
+        """Test that a vertical offset of one ulp is still resolved exactly."""
+        ulp = np.spacing(1.0)
+        triplets = np.array([[[0.0, 0.0, 1.0], [1.0, 1.0, 1.0], [2.0, 2.0 + 2 * ulp, 1.0]]])
+        self.assertEqual(triplet_orientation(triplets)[0], 1)
+
+    def test_signed_area(self):
+        """Test signed areas in 2D and in the plane orthogonal to the normal in 3D."""
+        np.testing.assert_allclose(triplet_signed_area(self.triplets2d), [0.5, -0.5, 0.0])
+        np.testing.assert_allclose(triplet_signed_area(self.triplets3d, (0.0, 0.0, 3.0)), [0.5, -0.5, 0.0])
+        with self.assertRaises(ValueError):
+            triplet_signed_area(self.triplets3d, (0.0, 0.0, 0.0))
+
+    def test_collinear(self):
+        """Test collinearity in 2D and 3D."""
+        np.testing.assert_array_equal(triplet_collinear(self.triplets2d), [False, False, True])
+        line = np.array([[[0.0, 0.0, 0.0], [1.0, 2.0, 3.0], [2.0, 4.0, 6.0]], [[0.0, 0.0, 0.0], [1.0, 2.0, 3.0], [2.0, 4.0, 7.0]]])
+        np.testing.assert_array_equal(triplet_collinear(line), [True, False])
+
+    def test_cyclic_triplets(self):
+        """Test the consecutive corner triplets of a closed polygon."""
+        square = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])
+        triplets = cyclic_triplets(square)
+        self.assertEqual(triplets.shape, (4, 3, 2))
+        np.testing.assert_array_equal(triplets[3], square[[3, 0, 1]])
+        np.testing.assert_array_equal(triplet_orientation(triplets), [1, 1, 1, 1])
+
+    def test_invalid_shape(self):
+        """Test that malformed batches are rejected."""
+        with self.assertRaises(ValueError):
+            as_triplets(np.zeros((2, 4, 2)))
+        with self.assertRaises(ValueError):
+            triplet_orientation(np.zeros((2, 3, 4)))
+        with self.assertRaises(ValueError):
+            triplet_orientation(self.triplets3d, np.zeros((2, 3)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -224,5 +224,25 @@ class TestVertex3D(unittest.TestCase):
             self.vertex1.distance_to("not a vertex3d")
         self.assertIn("distance_to is only supported for Vertex3D instances", str(context.exception))
 
+    def test_vertex3d_slots(self):
+        """Test that vertices are slotted and reject unknown attributes."""
+        self.assertFalse(hasattr(self.vertex1, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.vertex1.color = "red"
+
+    def test_vertex3d_partial_normal(self):
+        """Test that setting one normal component leaves the others unset."""
+        self.vertex1.ny = 0.5
+        self.assertEqual(self.vertex1.normal, (None, 0.5, None))
+
+    def test_vertex3d_unchecked(self):
+        """Test the unchecked constructor matches the checked one."""
+        vertex = Vertex3D.unchecked(1.0, 2.0, 3.0, id=1)
+        self.assertEqual(vertex, self.vertex1)
+        self.assertEqual(vertex.id, 1)
+        self.assertFalse(vertex.visited)
+        self.assertEqual(vertex.normal, (None, None, None))
+        self.assertEqual(repr(vertex), repr(self.vertex1))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
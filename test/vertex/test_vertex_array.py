@@ -0,0 +1,248 @@
+import unittest
+import numpy as np
+
+from comgeo.core.vertex import Vertex2D, Vertex3D, VertexArray2D, VertexArray3D, Vertex2DView, Vertex3DView, coordinate_version
+from comgeo.core.graph.base import Graph
+from comgeo.core.mesh.base import Mesh
+from comgeo.core.mesh.triangle_mesh import TriangleMesh2D
+from comgeo.core.polygon.quad import Quad
+from comgeo.functional.polygon.area import get_area
+from comgeo.functional.polygon.center import get_center
+
+
+class TestVertexArray2D(unittest.TestCase):
+    """Test cases for the VertexArray2D container."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.coordinates = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])
+        self.array = VertexArray2D(self.coordinates)
+
+    def test_initialization(self):
+        """Test that the coordinates are stored without copying."""
+        self.assertEqual(len(self.array), 4)
+        self.assertIs(self.array.coordinates, self.coordinates)
+        self.assertEqual(self.array.ids.tolist(), [-1, -1, -1, -1])
+        self.assertEqual(self.array.weights.tolist(), [1.0] * 4)
+        self.assertEqual(self.array.visited.tolist(), [False] * 4)
+
+    def test_invalid_shape(self):
+        """Test that coordinates with the wrong dimension are rejected."""
+        with self.assertRaises(ValueError):
+            VertexArray2D(np.zeros((4, 3)))
+        with self.assertRaises(ValueError):
+            VertexArray2D(np.zeros((4, 2)), ids=np.arange(3))
+
+    def test_view_satisfies_vertex2d_api(self):
+        """Test that indexing returns a Vertex2D view."""
+        view = self.array[2]
+        self.assertIsInstance(view, Vertex2D)
+        self.assertIsInstance(view, Vertex2DView)
+        self.assertEqual(view.coordinates, (1.0, 1.0))
+        self.assertEqual(view.id, -1)
+        self.assertFalse(view.visited)
+        self.assertEqual(self.array[-1].coordinates, (0.0, 1.0))
+        with self.assertRaises(IndexError):
+            self.array[4]
+
+    def test_view_writes_through(self):
+        """Test that mutating a view mutates the backing array."""
+        view = self.array[1]
+        view.x = 5.0
+        view.set_coordinates(6.0, 7.0)
+        view.id = 3
+        view.visited = True
+        self.assertEqual(self.coordinates[1].tolist(), [6.0, 7.0])
+        self.assertEqual(self.array.ids[1], 3)
+        self.assertTrue(self.array.visited[1])
+        with self.assertRaises(TypeError):
+            view.x = 1
+
+    def test_view_arithmetic(self):
+        """Test that views interoperate with plain vertices."""
+        view = self.array[2]
+        vertex = Vertex2D(1.0, 1.0)
+        self.assertEqual(view, vertex)
+        self.assertEqual(vertex, view)
+        self.assertEqual((view + vertex).coordinates, (2.0, 2.0))
+        self.assertEqual((view - self.array[1]).coordinates, (0.0, 1.0))
+        self.assertEqual((view * 2.0).coordinates, (2.0, 2.0))
+        self.assertAlmostEqual(view.distance_to(Vertex2D(4.0, 5.0)), 5.0)
+        with self.assertRaises(TypeError):
+            view + Vertex3D(1.0, 1.0, 1.0)
+
+    def test_slice_shares_memory(self):
+        """Test that slicing returns a VertexArray sharing memory."""
+        sub = self.array[1:3]
+        self.assertIsInstance(sub, VertexArray2D)
+        self.assertEqual(len(sub), 2)
+        sub[0].x = 9.0
+        self.assertEqual(self.coordinates[1, 0], 9.0)
+
+    def test_from_and_to_vertices(self):
+        """Test conversion from and to lists of Vertex2D objects."""
+        vertices = [Vertex2D(float(i), float(2 * i), id=i) for i in range(3)]
+        array = VertexArray2D.from_vertices(vertices)
+        self.assertEqual(array.ids.tolist(), [0, 1, 2])
+        self.assertEqual(array, vertices)
+        back = array.to_vertices()
+        self.assertEqual(back, vertices)
+        self.assertEqual([v.id for v in back], [0, 1, 2])
+        with self.assertRaises(TypeError):
+            VertexArray2D.from_vertices([Vertex3D(0.0, 0.0, 0.0)])
+
+    def test_append_and_setitem(self):
+        """Test list-like mutation of the container."""
+        self.array.append(Vertex2D(2.0, 2.0, id=7))
+        self.assertEqual(len(self.array), 5)
+        self.assertEqual(self.array[4].id, 7)
+        self.array[0] = Vertex2D(3.0, 3.0, id=1)
+        self.assertEqual(self.array[0].coordinates, (3.0, 3.0))
+        with self.assertRaises(TypeError):
+            self.array.append(Vertex3D(0.0, 0.0, 0.0))
+
+    def test_append_grows_capacity_geometrically(self):
+        """Test that repeated appends reallocate only O(log n) times."""
+        capacities = set()
+        for i in range(1000):
+            self.array.append(Vertex2D(float(i), 0.0, id=i, visited=True))
+            capacities.add(self.array.capacity)
+        self.assertLessEqual(len(capacities), 8)
+        self.assertEqual(len(self.array), 1004)
+        self.assertEqual(self.array[1003].coordinates, (999.0, 0.0))
+        self.assertEqual(self.array.visited[[0, -1]].tolist(), [False, True])
+
+    def test_extend(self):
+        """Test batch appends from arrays, lists and containers."""
+        self.array.extend(np.array([[5.0, 5.0], [6.0, 6.0]]))
+        self.array.extend([Vertex2D(7.0, 7.0, id=9)])
+        self.array.extend(VertexArray2D(np.zeros((3, 2)), ids=np.arange(3)))
+        self.assertEqual(len(self.array), 10)
+        self.assertEqual(self.array[6].id, 9)
+        self.assertEqual(self.array.ids[-3:].tolist(), [0, 1, 2])
+        self.assertEqual(self.array.coordinates[4].tolist(), [5.0, 5.0])
+        with self.assertRaises(TypeError):
+            self.array.extend(VertexArray3D(np.zeros((1, 3))))
+
+    def test_version(self):
+        """Test that every coordinate write changes the version."""
+        versions = [self.array.version]
+        self.array[0].x = 5.0
+        versions.append(self.array.version)
+        self.array[1] = Vertex2D(3.0, 3.0)
+        versions.append(self.array.version)
+        self.array.append(Vertex2D(2.0, 2.0))
+        versions.append(self.array.version)
+        self.array.coordinates[0, 0] = 1.0
+        self.assertEqual(self.array.version, versions[-1])
+        self.array.mark_modified()
+        versions.append(self.array.version)
+        self.assertEqual(len(set(versions)), 5)
+        self.assertEqual(coordinate_version(self.array), self.array.version)
+
+    def test_coordinate_version_of_lists(self):
+        """Test that vertex objects bump the version of vertex lists."""
+        vertices = [Vertex2D(0.0, 0.0), Vertex3D(0.0, 0.0, 0.0)]
+        version = coordinate_version(vertices)
+        vertices[0].y = 1.0
+        self.assertNotEqual(coordinate_version(vertices), version)
+        version = coordinate_version(vertices)
+        vertices[1].set_coordinates(1.0, 1.0, 1.0)
+        self.assertNotEqual(coordinate_version(vertices), version)
+
+    def test_repr(self):
+        """Test the string representation."""
+        self.assertEqual(repr(self.array), "VertexArray2D(num_vertices=4)")
+
+
+class TestVertexArray3D(unittest.TestCase):
+    """Test cases for the VertexArray3D container."""
+
+    def test_view_satisfies_vertex3d_api(self):
+        """Test that indexing returns a Vertex3D view."""
+        array = VertexArray3D(np.array([[0.0, 0.0, 0.0], [1.0, 2.0, 2.0]]))
+        view = array[1]
+        self.assertIsInstance(view, Vertex3D)
+        self.assertIsInstance(view, Vertex3DView)
+        self.assertEqual(view.coordinates, (1.0, 2.0, 2.0))
+        self.assertEqual(view.normal, (None, None, None))
+        self.assertAlmostEqual(view.distance_to(array[0]), 3.0)
+        view.z = 4.0
+        self.assertEqual(array.coordinates[1, 2], 4.0)
+
+    def test_normals_column(self):
+        """Test that view normals are stored in a lazily allocated normals column."""
+        array = VertexArray3D(np.zeros((3, 3)))
+        self.assertIsNone(array._normals)
+        array[0].normal = (0.0, 0.0, 1.0)
+        self.assertEqual(array.normals.shape, (3, 3))
+        self.assertEqual(array[0].normal, (0.0, 0.0, 1.0))
+        self.assertEqual(array[1].normal, (None, None, None))
+        array[1].nx = 1.0
+        self.assertEqual(array[1].normal, (1.0, None, None))
+        self.assertEqual(array[:2][0].normal, (0.0, 0.0, 1.0))
+
+    def test_normals_follow_vertices(self):
+        """Test that normals survive conversion, appending and extending."""
+        vertices = Vertex3D.from_array(np.eye(3), normals=np.eye(3))
+        array = VertexArray3D.from_vertices(vertices)
+        np.testing.assert_array_equal(array.normals, np.eye(3))
+        self.assertEqual(array.to_vertices()[2].normal, (0.0, 0.0, 1.0))
+        array.append(Vertex3D(1.0, 1.0, 1.0))
+        self.assertEqual(array[3].normal, (None, None, None))
+        array.extend(np.ones((2, 3)))
+        array.extend(vertices[:1])
+        self.assertEqual(array.normals.shape, (7, 3))
+        self.assertEqual(array[6].normal, (1.0, 0.0, 0.0))
+        plain = VertexArray3D(np.zeros((1, 3)))
+        plain.append(vertices[1])
+        self.assertEqual(plain[0].normal, (None, None, None))
+        self.assertEqual(plain[1].normal, (0.0, 1.0, 0.0))
+        plain[0] = vertices[2]
+        self.assertEqual(plain[0].normal, (0.0, 0.0, 1.0))
+
+    def test_invalid_normals(self):
+        """Test that a normals column of the wrong shape is rejected."""
+        with self.assertRaises(ValueError):
+            VertexArray3D(np.zeros((2, 3)), normals=np.zeros(2))
+
+
+class TestVertexArrayConsumers(unittest.TestCase):
+    """Test that graph, mesh, polygon and functional code accept VertexArray."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.array = VertexArray2D(np.array([[0.0, 0.0], [4.0, 0.0], [4.0, 3.0], [0.0, 3.0]]))
+
+    def test_graph(self):
+        """Test Graph construction and growth with a VertexArray."""
+        graph = Graph(self.array)
+        self.assertIs(graph.vertices, self.array)
+        graph.add_vertex(Vertex2D(1.0, 1.0, id=4), connections=[0])
+        self.assertEqual(len(graph.vertices), 5)
+
+    def test_mesh(self):
+        """Test Mesh construction with a VertexArray."""
+        mesh = Mesh(self.array, [[0, 1, 2], [0, 2, 3]])
+        self.assertIs(mesh.vertices, self.array)
+        mesh2d = TriangleMesh2D(self.array, [[0, 1, 2], [0, 2, 3]])
+        self.assertAlmostEqual(mesh2d.faces[0].area(self.array), 6.0)
+
+    def test_polygon(self):
+        """Test Quad construction with a VertexArray."""
+        quad = Quad(self.array)
+        self.assertAlmostEqual(quad.area, 12.0)
+        self.assertEqual(quad.center.coordinates, (2.0, 1.5))
+        self.assertTrue(quad.is_convex())
+        self.assertEqual(len(quad.point_cloud_sampling(5)), 5)
+
+    def test_functional(self):
+        """Test functional area and center with a VertexArray."""
+        self.assertAlmostEqual(get_area(self.array), 12.0)
+        center = get_center(self.array)
+        self.assertIsInstance(center, Vertex2D)
+        self.assertEqual(center.coordinates, (2.0, 1.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import numpy as np
+
+from comgeo.core.vertex import Vertex2D, Vertex3D, VertexArray2D, VertexHashMap, VertexHashSet, vertex_key
+from comgeo.core.vector import Vector2D
+
+
+class TestVertexHash(unittest.TestCase):
+    """Test cases for hashing vertices and vectors."""
+
+    def test_equal_vertices_hash_equal(self):
+        """Test that equal vertices have equal hashes, whatever their IDs."""
+        self.assertEqual(hash(Vertex2D(1.0, 2.0, id=1)), hash(Vertex2D(1.0, 2.0, id=2)))
+        self.assertEqual(hash(Vertex3D(1.0, 2.0, 3.0)), hash(Vertex3D(1.0, 2.0, 3.0)))
+        self.assertEqual(hash(Vertex2D(0.0, 0.0)), hash(Vertex2D(-0.0, 0.0)))
+
+    def test_vertices_in_sets(self):
+        """Test that vertices can be deduplicated with a set and used as dict keys."""
+        vertices = {Vertex2D(0.0, 0.0), Vertex2D(1.0, 0.0), Vertex2D(0.0, 0.0)}
+        self.assertEqual(len(vertices), 2)
+        self.assertIn(Vertex2D(1.0, 0.0), vertices)
+        self.assertEqual({Vertex3D(1.0, 1.0, 1.0): 3}[Vertex3D(1.0, 1.0, 1.0)], 3)
+
+    def test_views_hash_like_vertices(self):
+        """Test that array views hash like the vertices they are equal to."""
+        array = VertexArray2D(np.array([[1.0, 2.0], [3.0, 4.0]]))
+        self.assertEqual(hash(array[0]), hash(Vertex2D(1.0, 2.0)))
+        self.assertIn(Vertex2D(3.0, 4.0), set(array))
+
+    def test_vectors_in_sets(self):
+        """Test that vectors hash by their components."""
+        self.assertEqual(len({Vector2D(x=1.0, y=0.0), Vector2D(x=1.0, y=0.0, id=3)}), 1)
+
+
+class TestVertexHashMap(unittest.TestCase):
+    """Test cases for the VertexHashMap and VertexHashSet utilities."""
+
+    def test_vertex_key(self):
+        """Test exact and quantized keys."""
+        self.assertEqual(vertex_key(Vertex2D(0.25, -0.25)), (0.25, -0.25))
+        self.assertEqual(vertex_key(Vertex2D(0.25, -0.25), 0.5), (0, -1))
+        self.assertEqual(vertex_key((1.0, 2.0, 3.0), 1.0), (1, 2, 3))
+
+    def test_exact_map(self):
+        """Test that an exact map matches equal coordinates only."""
+        table = VertexHashMap()
+        table[Vertex2D(0.0, 0.0)] = "a"
+        table[(1.0, 0.0)] = "b"
+        self.assertEqual(table[(0.0, 0.0)], "a")
+        self.assertEqual(table[Vertex2D(1.0, 0.0)], "b")
+        self.assertNotIn(Vertex2D(1e-12, 0.0), table)
+        self.assertEqual(len(table), 2)
+        with self.assertRaises(KeyError):
+            table[(2.0, 2.0)]
+
+    def test_tolerance_map(self):
+        """Test that a tolerant map merges nearby keys, including across cell borders."""
+        table = VertexHashMap(tolerance=0.1)
+        first = Vertex2D(0.099, 0.0)
+        table[first] = 1
+        table[Vertex2D(0.101, 0.0)] = 2
+        self.assertEqual(len(table), 1)
+        self.assertEqual(table[first], 2)
+        self.assertIs(table.representative((0.15, 0.0)), first)
+        self.assertIsNone(table.representative((0.3, 0.0)))
+        self.assertEqual(list(table), [first])
+
+    def test_tolerance_map_delete(self):
+        """Test deleting through a nearby key."""
+        table = VertexHashMap(tolerance=0.5)
+        table[(0.0, 0.0, 0.0)] = 1
+        table[(2.0, 0.0, 0.0)] = 2
+        del table[(0.1, 0.1, 0.1)]
+        self.assertEqual(list(table.items()), [((2.0, 0.0, 0.0), 2)])
+        with self.assertRaises(KeyError):
+            del table[(0.0, 0.0, 0.0)]
+
+    def test_invalid_tolerance(self):
+        """Test that the tolerance is validated."""
+        with self.assertRaises(TypeError):
+            VertexHashMap(tolerance=1)
+        with self.assertRaises(ValueError):
+            VertexHashMap(tolerance=-1.0)
+
+    def test_hash_set(self):
+        """Test the set interface with a tolerance."""
+        points = VertexHashSet([Vertex2D(0.0, 0.0), Vertex2D(0.01, 0.0), Vertex2D(1.0, 1.0)], tolerance=0.05)
+        self.assertEqual(len(points), 2)
+        self.assertIn((0.02, 0.02), points)
+        points.discard((0.02, 0.02))
+        self.assertEqual(len(points), 1)
+        points.add(Vertex2D(1.0, 1.0))
+        self.assertEqual(len(points), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,4 +2,13 @@ python -m pytest test/mesh/test_base.py
 python -m pytest test/mesh/test_hybrid.py
 
 python -m pytest test/mesh/primitives/test_face.py
-python -m pytest test/mesh/edge/test_baseedge.py
\ No newline at end of file
+python -m pytest test/mesh/edge/test_baseedge.py
+python -m pytest test/mesh/edge/test_half_edge.py
+python -m pytest test/mesh/edge/test_edge_table.py
+python -m pytest test/mesh/test_basic.py
+python -m pytest test/mesh/test_delaunay.py
+python -m pytest test/mesh/test_io.py
+python -m pytest test/mesh/test_cleanup.py
+python -m pytest test/mesh/test_topology.py
+python -m pytest test/mesh/test_normals.py
+python -m pytest test/mesh/test_shared.py
@@ -1,3 +1,4 @@
 python -m pytest test/polygon/test_polygon.py
 python -m pytest test/polygon/test_triangle.py
 python -m pytest test/polygon/test_quad.py
+python -m pytest test/polygon/test_point_cloud.py
@@ -0,0 +1,6 @@
+python -m pytest test/utils/test_error.py
+python -m pytest test/utils/test_sparse.py
+python -m pytest test/utils/test_buffer.py
+python -m pytest test/utils/test_version.py
+python -m pytest test/utils/test_parallel.py
+python -m pytest test/utils/test_shared.py
@@ -1,4 +1,5 @@
 python -m pytest test/vector/test_vector.py
 python -m pytest test/vector/test_vector2d.py
 python -m pytest test/vector/test_vector3d.py
-python -m pytest test/vector/test_vector_edge_case.py
\ No newline at end of file
+python -m pytest test/vector/test_vector_edge_case.py
+python -m pytest test/vector/test_vector_array.py
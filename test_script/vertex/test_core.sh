@@ -1,3 +1,5 @@
 python -m pytest test/vertex/test_vertex.py
 python -m pytest test/vertex/test_vertex2d.py
-python -m pytest test/vertex/test_vertex3d.py
\ No newline at end of file
+python -m pytest test/vertex/test_vertex3d.py
+python -m pytest test/vertex/test_vertex_array.py
+python -m pytest test/vertex/test_vertex_hashing.py
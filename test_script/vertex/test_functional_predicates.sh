@@ -0,0 +1 @@
+python -m pytest test/vertex/functional/test_predicates.py
\ No newline at end of file
@@ -0,0 +1 @@
+python -m pytest test/vertex/functional/triplets/test_compute.py
\ No newline at end of file